@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import json
+import os
 from scrape import scrape_data
 from clean import clean_data
 
@@ -18,10 +19,14 @@ def load_data(filename="applicant_data.json"):
         return json.load(f)
 
 if __name__ == "__main__":
+    # progress is checkpointed here so a crashed or interrupted scrape can resume
+    checkpoint = "scrape_checkpoint.jsonl"
     print("Starting scrape...")
-    raw = scrape_data(target_count=55000, batch_size=500) 
+    raw = scrape_data(target_count=55000, batch_size=500, checkpoint=checkpoint)
     print("Cleaning data...")
-    cleaned = clean_data(raw, target_count=50000) 
+    cleaned = clean_data(raw, target_count=50000, workers=os.cpu_count())
     print(f"Saving {len(cleaned)} cleaned entries...")
     save_data(cleaned)
+    if os.path.exists(checkpoint):
+        os.remove(checkpoint)  # results are saved, so the next run starts fresh
     print("Done")
\ No newline at end of file
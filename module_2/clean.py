@@ -2,6 +2,8 @@
 
 from bs4 import BeautifulSoup
 import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 
 
 def _parse_decision_date(notification_str):
@@ -13,79 +15,88 @@ def _parse_decision_date(notification_str):
     return match.group(0) if match else None
 
 
-def clean_data(raw_entries, target_count):
+# setting the fields to be in each record, regardless if they exist
+FIELD_MAP = {
+    "program": ["Program"],
+    "university": ["Institution"],
+    "comments": ["Notes"],
+    "date_added": ["Date Added"],
+    "applicant_status": ["Decision", "Status"],
+    "acceptance_date": ["Notification"],
+    "rejection_date": ["Notification"],
+    "term": ["Term"], 
+    "US/International": ["Degree's Country of Origin"],
+    "GRE Score": ["GRE Score"],
+    "GRE V Score": ["GRE V Score"],
+    "Degree": ["Degree Type"],
+    "GPA": ["Undergrad GPA"],
+    "GRE AW": ["GRE AW"],
+}
+
+
+def _clean_entry(entry):
+    # clean a single admissions entry (top-level so worker processes can run it)
+
+    pairs = entry["data"]
+
+    record = {} # initialize dictionary to hold pairs
+    for field, labels in FIELD_MAP.items():
+        value = None
+        for label in labels:
+            raw_html = pairs.get(label)
+            if raw_html and raw_html.strip():
+                soup = BeautifulSoup(raw_html, "html.parser")
+
+                # try to find label span 
+                span_label = soup.find("span", string=lambda t: t and t.strip() == label)
+                if span_label and span_label.next_sibling:
+                    # use the sibling text as the value if found
+                    value = span_label.next_sibling.get_text(strip=True)
+                    break
+                # fallback: just get text of the html
+                value = soup.get_text(strip=True)
+                if value:
+                    break
+        record[field] = value
+
+    # combine program and university into a single "program" field for LLM
+    program_val = record.get("program") or ""
+    university_val = record.get("university") or ""
+    combined = f"{program_val}, {university_val}".strip().rstrip(",")
+    record["program"] = combined
+
+    record["URL"] = entry.get("url") # add the URL
+
+    # return application status so we can set the acceptance or rejection date
+    decision = record.get("applicant_status")
+    notification = pairs.get("Notification")
+
+    if decision == "Accepted":
+        record["acceptance_date"] = _parse_decision_date(notification)
+        record["rejection_date"] = None
+    elif decision == "Rejected":
+        record["rejection_date"] = _parse_decision_date(notification)
+        record["acceptance_date"] = None
+    else:
+        record["rejection_date"] = None
+        record["acceptance_date"] = None
+
+    return record
+
+
+def clean_data(raw_entries, target_count, workers=None):
     # clean and normalize the admissions data so all records have the same fields
+    # workers > 1 shards the entries across a process pool (output order is kept)
 
-    cleaned = [] # initial list to hold records
-
-    # setting the fields to be in each record, regardless if they exist
-    FIELD_MAP = {
-        "program": ["Program"],
-        "university": ["Institution"],
-        "comments": ["Notes"],
-        "date_added": ["Date Added"],
-        "applicant_status": ["Decision", "Status"],
-        "acceptance_date": ["Notification"],
-        "rejection_date": ["Notification"],
-        "term": ["Term"], 
-        "US/International": ["Degree's Country of Origin"],
-        "GRE Score": ["GRE Score"],
-        "GRE V Score": ["GRE V Score"],
-        "Degree": ["Degree Type"],
-        "GPA": ["Undergrad GPA"],
-        "GRE AW": ["GRE AW"],
-    }
-
-    # loop through all the admissions data
-    for entry in raw_entries:
-        pairs = entry["data"]
-
-        record = {} # initialize dictionary to hold pairs
-        for field, labels in FIELD_MAP.items():
-            value = None
-            for label in labels:
-                raw_html = pairs.get(label)
-                if raw_html and raw_html.strip():
-                    soup = BeautifulSoup(raw_html, "html.parser")
-
-                    # try to find label span 
-                    span_label = soup.find("span", string=lambda t: t and t.strip() == label)
-                    if span_label and span_label.next_sibling:
-                        # use the sibling text as the value if found
-                        value = span_label.next_sibling.get_text(strip=True)
-                        break
-                    # fallback: just get text of the html
-                    value = soup.get_text(strip=True)
-                    if value:
-                        break
-            record[field] = value
-
-        # combine program and university into a single "program" field for LLM
-        program_val = record.get("program") or ""
-        university_val = record.get("university") or ""
-        combined = f"{program_val}, {university_val}".strip().rstrip(",")
-        record["program"] = combined
-
-        record["URL"] = entry.get("url") # add the URL
-
-        # return application status so we can set the acceptance or rejection date
-        decision = record.get("applicant_status")
-        notification = pairs.get("Notification")
-
-        if decision == "Accepted":
-            record["acceptance_date"] = _parse_decision_date(notification)
-            record["rejection_date"] = None
-        elif decision == "Rejected":
-            record["rejection_date"] = _parse_decision_date(notification)
-            record["acceptance_date"] = None
-        else:
-            record["rejection_date"] = None
-            record["acceptance_date"] = None
-
-        cleaned.append(record) # adding cleaned record
-
-    # trim the list if we got too many records
-    if len(cleaned) > target_count:
-        cleaned = cleaned[:target_count]
-
-    return cleaned
+    # each entry gives exactly one record, so only clean up to the target count
+    # (None keeps every entry)
+    limit = None if target_count is None else max(target_count, 0)
+    entries = list(islice(raw_entries, limit))
+
+    if not workers or workers <= 1 or len(entries) < 2:
+        return [_clean_entry(entry) for entry in entries]
+
+    # submit entries in chunks so each worker gets a batch per round trip
+    chunksize = max(1, len(entries) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_clean_entry, entries, chunksize=chunksize))
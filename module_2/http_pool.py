@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+import threading
+import urllib3
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# urllib3 PoolManager that counts how connections are obtained, so we can check that
+# the scraper's threads reuse kept-alive connections instead of opening new ones:
+#   created - new connections opened (each a TCP + TLS handshake)
+#   reused  - requests served by an idle kept-alive connection
+#   waited  - requests that found every connection busy and blocked for one
+
+
+class _CountingPoolMixin:
+    # shared with the owning manager in InstrumentedPoolManager._new_pool
+    stats = {"requests": 0, "created": 0, "waited": 0}
+    stats_lock = threading.Lock()
+
+    def _get_conn(self, timeout=None):
+        waited = self.pool is not None and self.pool.empty()
+        conn = super()._get_conn(timeout)
+        with self.stats_lock:
+            self.stats["requests"] += 1
+            self.stats["waited"] += waited
+        return conn
+
+    def _new_conn(self):
+        with self.stats_lock:
+            self.stats["created"] += 1
+        return super()._new_conn()
+
+
+class _CountingHTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _CountingHTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class InstrumentedPoolManager(urllib3.PoolManager):
+    # maxsize should match the number of worker threads; with block=True a thread
+    # waits for a free connection instead of opening one that gets thrown away
+
+    def __init__(self, maxsize, block=True, **kwargs):
+        super().__init__(maxsize=maxsize, block=block, **kwargs)
+        self.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+        self._stats = {"requests": 0, "created": 0, "waited": 0}
+        self._stats_lock = threading.Lock()
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super()._new_pool(scheme, host, port, request_context)
+        pool.stats = self._stats
+        pool.stats_lock = self._stats_lock
+        return pool
+
+    def stats(self):
+        # requests counts connection checkouts; reused is the part that didn't open a new one
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["reused"] = max(stats["requests"] - stats["created"], 0)
+        return stats
@@ -3,16 +3,23 @@
 
 from __future__ import annotations
 
+import difflib
 import json
+import multiprocessing
 import os
 import re
 import sys
-import difflib
-from typing import Any, Dict, List, Tuple
+import threading
+import time
+import hashlib
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
+from diskcache import Cache
 from flask import Flask, jsonify, request
 from huggingface_hub import hf_hub_download
-from llama_cpp import Llama  # CPU-only by default if N_GPU_LAYERS=0
+from llama_cpp import Llama, LlamaGrammar  # CPU-only by default if N_GPU_LAYERS=0
+
+from fuzzy_index import FuzzyIndex
 
 app = Flask(__name__)
 
@@ -30,12 +37,43 @@ N_THREADS = int(os.getenv("N_THREADS", str(os.cpu_count() or 2)))
 N_CTX = int(os.getenv("N_CTX", "2048"))
 N_GPU_LAYERS = int(os.getenv("N_GPU_LAYERS", "0"))  # 0 → CPU-only
 
+# Model instances (worker processes) sharing N_THREADS; 1 → run in-process
+LLM_WORKERS = int(os.getenv("LLM_WORKERS", "1"))
+
 CANON_UNIS_PATH = os.getenv("CANON_UNIS_PATH", "canon_universities.txt")
 CANON_PROGS_PATH = os.getenv("CANON_PROGS_PATH", "canon_programs.txt")
+ABBREV_UNIS_PATH = os.getenv("ABBREV_UNIS_PATH", "abbrev_universities.txt")
+
+# On-disk memo of standardization results; set LLM_CACHE_DIR="" to disable
+LLM_CACHE_DIR = os.getenv("LLM_CACHE_DIR", "llm_cache")
+LLM_CACHE_SIZE_MB = int(os.getenv("LLM_CACHE_SIZE_MB", "256"))
+
+# Rows whose rules-first split scores at least this confidence skip the model
+# (1.0: both halves resolve exactly to canonical names; above 1 disables it)
+RULES_MIN_CONFIDENCE = float(os.getenv("RULES_MIN_CONFIDENCE", "1.0"))
+
+# Constrain decoding to OUTPUT_SCHEMA with a llama.cpp grammar; LLM_GRAMMAR=0
+# lets the model answer in free text (parsed with JSON_OBJ_RE / fallback)
+LLM_GRAMMAR = os.getenv("LLM_GRAMMAR", "1") != "0"
+
+# The only reply the model may produce when LLM_GRAMMAR is on
+OUTPUT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "standardized_program": {"type": "string"},
+        "standardized_university": {"type": "string"},
+    },
+    "required": ["standardized_program", "standardized_university"],
+}
 
 # Precompiled, non-greedy JSON object matcher to tolerate chatter around JSON
 JSON_OBJ_RE = re.compile(r"\{.*?\}", re.DOTALL)
 
+# Precompiled helpers used on every row
+WS_RE = re.compile(r"\s+")
+SPLIT_RE = re.compile(r",| at | @ ")
+OF_RE = re.compile(r"\bOf\b")
+
 # ---------------- Canonical lists + abbrev maps ----------------
 def _read_lines(path: str) -> List[str]:
     """Read non-empty, stripped lines from a file (UTF-8)."""
@@ -49,18 +87,60 @@ def _read_lines(path: str) -> List[str]:
 CANON_UNIS = _read_lines(CANON_UNIS_PATH)
 CANON_PROGS = _read_lines(CANON_PROGS_PATH)
 
-ABBREV_UNI: Dict[str, str] = {
-    r"(?i)^mcg(\.|ill)?$": "McGill University",
-    r"(?i)^(ubc|u\.?b\.?c\.?)$": "University of British Columbia",
-    r"(?i)^uoft$": "University of Toronto",
-}
+# Case-insensitive exact lookups for the rules-first gate
+CANON_UNIS_FOLDED = {u.casefold(): u for u in CANON_UNIS}
+CANON_PROGS_FOLDED = {p.casefold(): p for p in CANON_PROGS}
+
+# Prebuilt indexes: O(1) membership + pruned fuzzy search (same results as difflib)
+CANON_UNIS_INDEX = FuzzyIndex(CANON_UNIS)
+CANON_PROGS_INDEX = FuzzyIndex(CANON_PROGS)
+
+
+class AbbrevRules:
+    """Whole-string university abbreviation rules, compiled once.
+
+    Plain-text patterns go into a case-folded dict (O(1) per row no matter how
+    many there are); regex patterns are joined into a single case-insensitive
+    alternation, so each row is expanded in one lookup + one ``fullmatch``.
+    """
+
+    _REGEX_CHARS = frozenset(".^$*+?{}[]\\|()")
+
+    def __init__(self, rules: List[Tuple[str, str]]) -> None:
+        self._literal: Dict[str, str] = {}
+        self._expansions: List[str] = []
+        patterns: List[str] = []
+        for pat, full in rules:
+            if self._REGEX_CHARS.isdisjoint(pat):
+                self._literal.setdefault(pat.casefold(), full)
+            else:
+                patterns.append(f"(?P<r{len(patterns)}>{pat})")
+                self._expansions.append(full)
+        self._regex = (
+            re.compile("|".join(patterns), re.IGNORECASE) if patterns else None
+        )
 
-COMMON_UNI_FIXES: Dict[str, str] = {
-    "McGiill University": "McGill University",
-    "Mcgill University": "McGill University",
-    # Normalize 'Of' → 'of'
-    "University Of British Columbia": "University of British Columbia",
-}
+    def expand(self, text: str) -> str | None:
+        """Return the expansion whose pattern matches all of `text`, if any."""
+        full = self._literal.get(text.casefold())
+        if full is not None or self._regex is None:
+            return full
+        match = self._regex.fullmatch(text)
+        return self._expansions[int(match.lastgroup[1:])] if match else None
+
+
+def _load_abbrev_rules(path: str) -> AbbrevRules:
+    """Read `<pattern>\\t<expansion>` rules, skipping comments and blank lines."""
+    rules = []
+    for ln in _read_lines(path):
+        if ln.startswith("#") or "\t" not in ln:
+            continue
+        pat, full = ln.split("\t", 1)
+        rules.append((pat.strip(), full.strip()))
+    return AbbrevRules(rules)
+
+
+ABBREV_UNI = _load_abbrev_rules(ABBREV_UNIS_PATH)
 
 COMMON_PROG_FIXES: Dict[str, str] = {
     "Mathematic": "Mathematics",
@@ -112,6 +192,43 @@ FEW_SHOTS: List[Tuple[Dict[str, str], Dict[str, str]]] = [
 
 _LLM: Llama | None = None
 
+# llama.cpp contexts are not thread-safe; the server handles requests in threads
+_MODEL_LOCK = threading.Lock()
+
+# Worker processes for LLM_WORKERS > 1, started on first use and reused
+_POOL: Any = None
+_POOL_WORKERS = 0
+
+# JSON-schema grammar for OUTPUT_SCHEMA, compiled on first use
+_GRAMMAR: LlamaGrammar | None = None
+
+# Throughput of the most recent standardization run
+_THROUGHPUT: Dict[str, float] = {"rows": 0, "rows_per_sec": 0.0}
+
+# Replies that could not be parsed and went to `_split_fallback`
+_PARSE_STATS: Dict[str, int] = {"fallbacks": 0}
+_CACHE: Cache | None = None
+_CACHE_STATS: Dict[str, int] = {"hits": 0, "misses": 0}
+
+# Cached results are post-normalized, so they are only valid for the same
+# model, prompt, and normalization data (canonical lists, abbreviation rules)
+_CACHE_FINGERPRINT = hashlib.sha256(
+    json.dumps(
+        [
+            MODEL_REPO,
+            MODEL_FILE,
+            SYSTEM_PROMPT,
+            FEW_SHOTS,
+            OUTPUT_SCHEMA if LLM_GRAMMAR else None,
+            CANON_UNIS,
+            CANON_PROGS,
+            _read_lines(ABBREV_UNIS_PATH),
+            COMMON_PROG_FIXES,
+        ],
+        ensure_ascii=False,
+    ).encode("utf-8")
+).hexdigest()[:16]
+
 
 def _load_llm() -> Llama:
     """Download (or reuse) the GGUF file and initialize llama.cpp."""
@@ -132,6 +249,7 @@ def _load_llm() -> Llama:
         n_ctx=N_CTX,
         n_threads=N_THREADS,
         n_gpu_layers=N_GPU_LAYERS,
+        use_mmap=True,  # worker processes share one page-cached copy of the weights
         verbose=False,
     )
     return _LLM
@@ -139,35 +257,26 @@ def _load_llm() -> Llama:
 
 def _split_fallback(text: str) -> Tuple[str, str]:
     """Simple, rules-first parser if the model returns non-JSON."""
-    s = re.sub(r"\s+", " ", (text or "")).strip().strip(",")
-    parts = [p.strip() for p in re.split(r",| at | @ ", s) if p.strip()]
+    s = WS_RE.sub(" ", (text or "")).strip().strip(",")
+    parts = [p.strip() for p in SPLIT_RE.split(s) if p.strip()]
     prog = parts[0] if parts else ""
     uni = parts[1] if len(parts) > 1 else ""
 
     # High-signal expansions
-    if re.fullmatch(r"(?i)mcg(ill)?(\.)?", uni or ""):
-        uni = "McGill University"
-    if re.fullmatch(
-        r"(?i)(ubc|u\.?b\.?c\.?|university of british columbia)",
-        uni or "",
-    ):
-        uni = "University of British Columbia"
+    uni = ABBREV_UNI.expand(uni) or uni
 
     # Title-case program; normalize 'Of' → 'of' for universities
     prog = prog.title()
     if uni:
-        uni = re.sub(r"\bOf\b", "of", uni.title())
+        uni = OF_RE.sub("of", uni.title())
     else:
         uni = "Unknown"
     return prog, uni
 
 
-def _best_match(name: str, candidates: List[str], cutoff: float = 0.86) -> str | None:
-    """Fuzzy match via difflib (lightweight, Replit-friendly)."""
-    if not name or not candidates:
-        return None
-    matches = difflib.get_close_matches(name, candidates, n=1, cutoff=cutoff)
-    return matches[0] if matches else None
+def _best_match(name: str, index: FuzzyIndex, cutoff: float = 0.86) -> str | None:
+    """Fuzzy match via the prebuilt index (same result as difflib.get_close_matches)."""
+    return index.best_match(name, cutoff)
 
 
 def _post_normalize_program(prog: str) -> str:
@@ -175,9 +284,9 @@ def _post_normalize_program(prog: str) -> str:
     p = (prog or "").strip()
     p = COMMON_PROG_FIXES.get(p, p)
     p = p.title()
-    if p in CANON_PROGS:
+    if p in CANON_PROGS_INDEX:
         return p
-    match = _best_match(p, CANON_PROGS, cutoff=0.84)
+    match = _best_match(p, CANON_PROGS_INDEX, cutoff=0.84)
     return match or p
 
 
@@ -185,30 +294,58 @@ def _post_normalize_university(uni: str) -> str:
     """Expand abbreviations, apply common fixes, capitalization, and canonical map."""
     u = (uni or "").strip()
 
-    # Abbreviations
-    for pat, full in ABBREV_UNI.items():
-        if re.fullmatch(pat, u):
-            u = full
-            break
-
-    # Common spelling fixes
-    u = COMMON_UNI_FIXES.get(u, u)
+    # Abbreviations and common spelling fixes (one compiled pass)
+    u = ABBREV_UNI.expand(u) or u
 
     # Normalize 'Of' → 'of'
     if u:
-        u = re.sub(r"\bOf\b", "of", u.title())
+        u = OF_RE.sub("of", u.title())
 
     # Canonical or fuzzy map
-    if u in CANON_UNIS:
+    if u in CANON_UNIS_INDEX:
         return u
-    match = _best_match(u, CANON_UNIS, cutoff=0.86)
+    match = _best_match(u, CANON_UNIS_INDEX, cutoff=0.86)
     return match or u or "Unknown"
 
 
-def _call_llm(program_text: str) -> Dict[str, str]:
-    """Query the tiny LLM and return standardized fields."""
-    llm = _load_llm()
-
+def _resolve(text: str, folded: Dict[str, str], index: FuzzyIndex, cutoff: float):
+    """Map `text` to a canonical name with a confidence score.
+
+    1.0 for a case-insensitive exact match; otherwise the similarity ratio of
+    the closest fuzzy match (at least `cutoff`), or 0.0 if there is none.
+    """
+    exact = folded.get(text.casefold())
+    if exact is not None:
+        return exact, 1.0
+    match = _best_match(text, index, cutoff=cutoff)
+    if match is None:
+        return text, 0.0
+    return match, difflib.SequenceMatcher(None, text, match).ratio()
+
+
+def _rules_first(program_text: str) -> Tuple[Dict[str, str], float]:
+    """Split and resolve a row deterministically; return the result and its confidence.
+
+    The row is split at its first separator into a program and a university,
+    so university names with their own comma or " at " (e.g. "University of
+    California, Berkeley") stay whole. Program text gets COMMON_PROG_FIXES;
+    university text gets abbreviation expansion. The confidence is the lower
+    of the two halves' `_resolve` scores.
+    """
+    s = WS_RE.sub(" ", program_text or "").strip().strip(",")
+    parts = [p.strip() for p in SPLIT_RE.split(s, maxsplit=1) if p.strip()]
+    if len(parts) != 2:
+        return {}, 0.0
+    prog = COMMON_PROG_FIXES.get(parts[0], parts[0])
+    uni = ABBREV_UNI.expand(parts[1]) or parts[1]
+    prog, prog_conf = _resolve(prog, CANON_PROGS_FOLDED, CANON_PROGS_INDEX, 0.84)
+    uni, uni_conf = _resolve(uni, CANON_UNIS_FOLDED, CANON_UNIS_INDEX, 0.86)
+    result = {"standardized_program": prog, "standardized_university": uni}
+    return result, min(prog_conf, uni_conf)
+
+
+def _build_messages(program_text: str) -> List[Dict[str, str]]:
+    """Build the system + few-shot chat messages followed by one input row."""
     messages = [{"role": "system", "content": SYSTEM_PROMPT}]
     for x_in, x_out in FEW_SHOTS:
         messages.append(
@@ -226,21 +363,21 @@ def _call_llm(program_text: str) -> Dict[str, str]:
             "content": json.dumps({"program": program_text}, ensure_ascii=False),
         }
     )
+    return messages
 
-    out = llm.create_chat_completion(
-        messages=messages,
-        temperature=0.0,
-        max_tokens=128,
-        top_p=1.0,
-    )
 
-    text = (out["choices"][0]["message"]["content"] or "").strip()
+def _parse_llm_output(text: str, program_text: str) -> Dict[str, str]:
+    """Parse the model's JSON reply (or fall back to rules) and normalize it."""
     try:
-        match = JSON_OBJ_RE.search(text)
-        obj = json.loads(match.group(0) if match else text)
+        if LLM_GRAMMAR:  # the reply is the object itself (braces may be in values)
+            obj = json.loads(text)
+        else:
+            match = JSON_OBJ_RE.search(text)
+            obj = json.loads(match.group(0) if match else text)
         std_prog = str(obj.get("standardized_program", "")).strip()
         std_uni = str(obj.get("standardized_university", "")).strip()
     except Exception:
+        _PARSE_STATS["fallbacks"] += 1
         std_prog, std_uni = _split_fallback(program_text)
 
     std_prog = _post_normalize_program(std_prog)
@@ -251,6 +388,165 @@ def _call_llm(program_text: str) -> Dict[str, str]:
     }
 
 
+def _get_grammar() -> LlamaGrammar | None:
+    """Return the OUTPUT_SCHEMA grammar, or None when LLM_GRAMMAR is off."""
+    global _GRAMMAR
+    if _GRAMMAR is None and LLM_GRAMMAR:
+        _GRAMMAR = LlamaGrammar.from_json_schema(
+            json.dumps(OUTPUT_SCHEMA), verbose=False
+        )
+    return _GRAMMAR
+
+
+def _call_llm(program_text: str) -> Dict[str, str]:
+    """Query the tiny LLM and return standardized fields."""
+    llm = _load_llm()
+
+    # With the grammar, the reply is exactly one JSON object and sampling
+    # ends at its closing brace.
+    out = llm.create_chat_completion(
+        messages=_build_messages(program_text),
+        temperature=0.0,
+        max_tokens=128,
+        top_p=1.0,
+        grammar=_get_grammar(),
+    )
+
+    text = (out["choices"][0]["message"]["content"] or "").strip()
+    return _parse_llm_output(text, program_text)
+
+
+def _get_cache() -> Cache | None:
+    """Open (or reuse) the size-bounded LRU result cache, if enabled."""
+    global _CACHE
+    if _CACHE is None and LLM_CACHE_DIR:
+        _CACHE = Cache(
+            LLM_CACHE_DIR,
+            size_limit=LLM_CACHE_SIZE_MB * 1024 * 1024,
+            eviction_policy="least-recently-used",
+        )
+    return _CACHE
+
+
+def _cache_key(program_text: str) -> str:
+    """Key on model/prompt fingerprint + whitespace/case-normalized input."""
+    normalized = " ".join(program_text.split()).casefold()
+    return f"{_CACHE_FINGERPRINT}:{normalized}"
+
+
+def _cached_call(call: Any, program_text: str) -> Dict[str, str]:
+    """Return a memoized result for `program_text`, invoking `call` on a miss."""
+    cache = _get_cache()
+    if cache is None:
+        return call(program_text)
+
+    key = _cache_key(program_text)
+    result = cache.get(key)
+    if result is not None:
+        _CACHE_STATS["hits"] += 1
+        return result
+
+    _CACHE_STATS["misses"] += 1
+    fallbacks = _PARSE_STATS["fallbacks"]
+    result = call(program_text)
+    # A reply that had to go to the rules fallback may parse on a later run
+    # (e.g. with another model or grammar setting), so it is not memoized
+    if _PARSE_STATS["fallbacks"] == fallbacks:
+        cache.set(key, result)
+    return result
+
+
+def _pool_init(n_threads: int) -> None:
+    """Worker initializer: load this process's model with `n_threads` threads."""
+    global N_THREADS
+    N_THREADS = n_threads
+    _load_llm()
+
+
+def _pool_call(program_text: str) -> Tuple[Dict[str, str], Dict[str, int]]:
+    """Standardize one row in a worker; also return its cache/fallback counts."""
+    before = {**_CACHE_STATS, **_PARSE_STATS}
+    result = _cached_call(_call_llm, program_text)
+    after = {**_CACHE_STATS, **_PARSE_STATS}
+    return result, {k: after[k] - before[k] for k in after}
+
+
+def _get_pool(workers: int) -> Any:
+    """Start (or reuse) `workers` model processes with N_THREADS split among them."""
+    global _POOL, _POOL_WORKERS
+    if _POOL is None or _POOL_WORKERS != workers:
+        if _POOL is not None:
+            _POOL.terminate()
+        # spawn, not fork: llama.cpp's threads do not survive a fork
+        _POOL = multiprocessing.get_context("spawn").Pool(
+            workers,
+            initializer=_pool_init,
+            initargs=(max(1, N_THREADS // workers),),
+        )
+        _POOL_WORKERS = workers
+    return _POOL
+
+
+def _pooled_results(texts: List[str], workers: int) -> Iterator[Dict[str, str]]:
+    """Standardize `texts` across the worker pool, yielding results in input order."""
+    for result, counts in _get_pool(workers).imap(_pool_call, texts):
+        for key, n in counts.items():
+            stats = _CACHE_STATS if key in _CACHE_STATS else _PARSE_STATS
+            stats[key] += n
+        yield result
+
+
+def _standardize_rows(
+    rows: Iterable[Dict[str, Any]], workers: int | None = None
+) -> Iterator[Dict[str, Any]]:
+    """Yield rows with the LLM fields added, reporting rows/sec when done.
+
+    With ``workers`` > 1 (default LLM_WORKERS), rows are standardized by that
+    many model processes, each with N_THREADS / workers threads.
+    """
+    workers = workers or LLM_WORKERS
+    rows = list(rows)
+    texts = [(row or {}).get("program") or "" for row in rows]
+    fallbacks = _PARSE_STATS["fallbacks"]
+    start = time.perf_counter()
+
+    # Rules-first gate: confident rows never reach the cache or the model
+    gated: List[Dict[str, str] | None] = []
+    for text in texts:
+        result, confidence = _rules_first(text)
+        gated.append(result if confidence >= RULES_MIN_CONFIDENCE else None)
+    pending = [text for text, result in zip(texts, gated) if result is None]
+    if workers > 1 and pending:
+        llm_results = _pooled_results(pending, workers)
+    else:
+        llm_results = (_cached_call(_call_llm, text) for text in pending)
+    results = (r if r is not None else next(llm_results) for r in gated)
+
+    count = 0
+    bypassed = len(texts) - len(pending)
+    for row, result in zip(rows, results):
+        row["llm-generated-program"] = result["standardized_program"]
+        row["llm-generated-university"] = result["standardized_university"]
+        count += 1
+        yield row
+
+    elapsed = time.perf_counter() - start
+    _THROUGHPUT["rows"] = count
+    _THROUGHPUT["rows_per_sec"] = round(count / elapsed, 2) if elapsed else 0.0
+    _THROUGHPUT["fallbacks"] = _PARSE_STATS["fallbacks"] - fallbacks
+    _THROUGHPUT["bypassed"] = bypassed
+    print(
+        f"Standardized {count} rows in {elapsed:.1f}s "
+        f"({_THROUGHPUT['rows_per_sec']} rows/sec, "
+        f"workers={workers}, grammar={LLM_GRAMMAR}); "
+        f"rules-first bypassed {bypassed}/{count} rows "
+        f"(min confidence {RULES_MIN_CONFIDENCE}); "
+        f"fallbacks={_THROUGHPUT['fallbacks']}; "
+        f"cache hits={_CACHE_STATS['hits']} misses={_CACHE_STATS['misses']}",
+        file=sys.stderr,
+    )
+
+
 def _normalize_input(payload: Any) -> List[Dict[str, Any]]:
     """Accept either a list of rows or {'rows': [...]}."""
     if isinstance(payload, list):
@@ -262,8 +558,8 @@ def _normalize_input(payload: Any) -> List[Dict[str, Any]]:
 
 @app.get("/")
 def health() -> Any:
-    """Simple liveness check."""
-    return jsonify({"ok": True})
+    """Liveness check; ``model_loaded`` is True once the model is warm."""
+    return jsonify({"ok": True, "model_loaded": _LLM is not None or _POOL is not None})
 
 
 @app.post("/standardize")
@@ -272,15 +568,17 @@ def standardize() -> Any:
     payload = request.get_json(force=True, silent=True)
     rows = _normalize_input(payload)
 
-    out: List[Dict[str, Any]] = []
-    for row in rows:
-        program_text = (row or {}).get("program") or ""
-        result = _call_llm(program_text)
-        row["llm-generated-program"] = result["standardized_program"]
-        row["llm-generated-university"] = result["standardized_university"]
-        out.append(row)
-
-    return jsonify({"rows": out})
+    with _MODEL_LOCK:
+        out = list(_standardize_rows(rows))
+    return jsonify(
+        {
+            "rows": out,
+            "rows_per_sec": _THROUGHPUT["rows_per_sec"],
+            "fallbacks": _THROUGHPUT["fallbacks"],
+            "bypassed": _THROUGHPUT["bypassed"],
+            "cache": dict(_CACHE_STATS),
+        }
+    )
 
 
 def _cli_process_file(
@@ -288,6 +586,7 @@ def _cli_process_file(
     out_path: str | None,
     append: bool,
     to_stdout: bool,
+    workers: int | None = None,
 ) -> None:
     """Process a JSON file and write JSONL incrementally."""
     with open(in_path, "r", encoding="utf-8") as f:
@@ -302,12 +601,7 @@ def _cli_process_file(
     assert sink is not None  # for type-checkers
 
     try:
-        for row in rows:
-            program_text = (row or {}).get("program") or ""
-            result = _call_llm(program_text)
-            row["llm-generated-program"] = result["standardized_program"]
-            row["llm-generated-university"] = result["standardized_university"]
-
+        for row in _standardize_rows(rows, workers=workers):
             json.dump(row, sink, ensure_ascii=False)
             sink.write("\n")
             sink.flush()
@@ -348,15 +642,34 @@ if __name__ == "__main__":
         action="store_true",
         help="Write JSON Lines to stdout instead of a file.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Model instances (processes) sharing N_THREADS; "
+        "defaults to LLM_WORKERS.",
+    )
     args = parser.parse_args()
 
     if args.serve or args.file is None:
+        # Load the model and cache up front so the first request is served warm
+        start = time.perf_counter()
+        _get_cache()
+        if LLM_WORKERS > 1:
+            _get_pool(LLM_WORKERS)  # each worker loads its model as it starts
+            print(f"Started {LLM_WORKERS} model workers", file=sys.stderr)
+        else:
+            _load_llm()
+            print(
+                f"Model loaded in {time.perf_counter() - start:.1f}s", file=sys.stderr
+            )
         port = int(os.getenv("PORT", "8000"))
-        app.run(host="0.0.0.0", port=port, debug=False)
+        app.run(host=os.getenv("HOST", "0.0.0.0"), port=port, debug=False)
     else:
         _cli_process_file(
             in_path=args.file,
             out_path=args.out,
             append=bool(args.append),
             to_stdout=bool(args.stdout),
+            workers=args.workers,
         )
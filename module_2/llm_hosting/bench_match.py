@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""Benchmark FuzzyIndex.best_match against the difflib linear scan.
+
+Usage:
+    python bench_match.py [--file rows.json|rows.jsonl] [--rows 2000]
+
+Queries are the program/university halves of each row's ``program`` field,
+plus deterministically misspelled canonical names so both paths do real
+fuzzy work. Every query is checked for identical results.
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import json
+import random
+import time
+from typing import Callable, List
+
+from fuzzy_index import FuzzyIndex
+
+# Same lists and cutoffs as app.py (_post_normalize_program / _university)
+with open("canon_universities.txt", "r", encoding="utf-8") as _f:
+    CANON_UNIS = [ln.strip() for ln in _f if ln.strip()]
+with open("canon_programs.txt", "r", encoding="utf-8") as _f:
+    CANON_PROGS = [ln.strip() for ln in _f if ln.strip()]
+CUTOFFS = {"program": 0.84, "university": 0.86}
+
+
+def _read_rows(path: str) -> List[dict]:
+    """Read rows from a JSON list, {'rows': [...]}, or JSON Lines file."""
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    try:
+        data = json.loads(text)
+        return data["rows"] if isinstance(data, dict) else data
+    except json.JSONDecodeError:
+        return [json.loads(ln) for ln in text.splitlines() if ln.strip()]
+
+
+def _typo(rng: random.Random, s: str) -> str:
+    """Drop, swap, or duplicate one character."""
+    i = rng.randrange(len(s))
+    op = rng.choice("dsx")
+    if op == "d":
+        return s[:i] + s[i + 1 :]
+    if op == "s" and i + 1 < len(s):
+        return s[:i] + s[i + 1] + s[i] + s[i + 2 :]
+    return s[:i] + s[i] + s[i:]
+
+
+def _queries(rows: List[dict], n: int) -> List[tuple]:
+    """Build (kind, text) queries from rows and misspelled canon names."""
+    rng = random.Random(0)
+    out = []
+    for row in rows:
+        parts = [p.strip() for p in (row.get("program") or "").split(",")]
+        if parts and parts[0]:
+            out.append(("program", parts[0].title()))
+        if len(parts) > 1 and parts[1]:
+            out.append(("university", parts[1].title()))
+    while len(out) < n:
+        kind = rng.choice(["program", "university"])
+        canon = CANON_PROGS if kind == "program" else CANON_UNIS
+        out.append((kind, _typo(rng, rng.choice(canon))))
+    return out[:n]
+
+
+def _time(label: str, queries: List[tuple], fn: Callable) -> List:
+    """Run fn over every query and print per-row latency."""
+    start = time.perf_counter()
+    results = [fn(kind, text) for kind, text in queries]
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<12} {elapsed:8.3f}s total  "
+        f"{elapsed / len(queries) * 1e6:9.1f} us/row"
+    )
+    return results
+
+
+def main() -> None:
+    """Run both matchers over the same queries and compare."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--file", default="sample_data.json")
+    parser.add_argument("--rows", type=int, default=2000)
+    args = parser.parse_args()
+
+    queries = _queries(_read_rows(args.file), args.rows)
+    canon = {"program": CANON_PROGS, "university": CANON_UNIS}
+
+    start = time.perf_counter()
+    index = {kind: FuzzyIndex(lst) for kind, lst in canon.items()}
+    print(f"index build  {time.perf_counter() - start:8.3f}s")
+
+    def _difflib(kind: str, text: str):
+        m = difflib.get_close_matches(text, canon[kind], n=1, cutoff=CUTOFFS[kind])
+        return m[0] if m else None
+
+    def _indexed(kind: str, text: str):
+        return index[kind].best_match(text, CUTOFFS[kind])
+
+    expected = _time("difflib", queries, _difflib)
+    actual = _time("FuzzyIndex", queries, _indexed)
+    mismatches = sum(a != b for a, b in zip(expected, actual))
+    print(f"{len(queries)} queries, {mismatches} mismatches")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""Benchmark standardization throughput for different LLM worker counts.
+
+Usage:
+    python bench_workers.py [--file rows.json] [--rows 64] [--workers 1,2,4]
+
+For each worker count K, K model processes split N_THREADS between them
+(N_THREADS / K threads each). Models are loaded before timing starts, and
+the result cache and rules-first gate are disabled so every row reaches a
+model. Pick the K with the highest rows/sec and set it as LLM_WORKERS.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import os
+import time
+from typing import List
+
+os.environ["LLM_CACHE_DIR"] = ""  # must be set before app reads it
+os.environ["RULES_MIN_CONFIDENCE"] = "2"  # no row is gated; every row hits a model
+
+import app  # noqa: E402
+from bench_match import _read_rows  # noqa: E402
+
+
+def _default_workers() -> List[int]:
+    """Powers of two up to N_THREADS."""
+    out, k = [], 1
+    while k <= app.N_THREADS:
+        out.append(k)
+        k *= 2
+    return out
+
+
+def _run(rows: List[dict], workers: int) -> float:
+    """Standardize a copy of rows with `workers` model instances; return rows/sec."""
+    # Warm up: start the processes and load their models outside the timing
+    list(app._standardize_rows(copy.deepcopy(rows[:workers]), workers))
+    start = time.perf_counter()
+    out = list(app._standardize_rows(copy.deepcopy(rows), workers))
+    return len(out) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Time every worker count over the same rows and report the fastest."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--file", default="sample_data.json")
+    parser.add_argument("--rows", type=int, default=64)
+    parser.add_argument(
+        "--workers",
+        default=None,
+        help="Comma-separated worker counts (default: powers of two up to N_THREADS)",
+    )
+    args = parser.parse_args()
+
+    rows = _read_rows(args.file)
+    rows = (rows * (args.rows // max(len(rows), 1) + 1))[: args.rows]
+    counts = (
+        [int(k) for k in args.workers.split(",")]
+        if args.workers
+        else _default_workers()
+    )
+
+    rates = {}
+    for k in counts:
+        rates[k] = _run(rows, k)
+        print(
+            f"workers={k:<3} threads/worker={max(1, app.N_THREADS // k):<3} "
+            f"{rates[k]:8.2f} rows/sec"
+        )
+    best = max(rates, key=rates.get)
+    print(f"{len(rows)} rows; fastest: LLM_WORKERS={best}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""Shared setup for the app.py tests.
+
+app.py reads its config from the environment when it is imported, so the
+result cache is disabled here first (tests that need it open their own).
+When llama-cpp-python is not installed, a stub ``llama_cpp`` module stands
+in for it: the tests swap the model for `FakeLlama` and never run llama.cpp.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import types
+from typing import Any, Dict, List
+
+import pytest
+
+os.environ["LLM_CACHE_DIR"] = ""  # must be set before app reads it
+
+try:
+    import llama_cpp  # noqa: F401
+except ImportError:
+    llama_cpp = types.ModuleType("llama_cpp")
+
+    class _StubLlama:
+        """Stand-in for ``llama_cpp.Llama``; the tests never construct it."""
+
+    class _StubLlamaGrammar:
+        """Stand-in for ``llama_cpp.LlamaGrammar`` that keeps the schema."""
+
+        def __init__(self, json_schema: str) -> None:
+            self.json_schema = json_schema
+
+        @classmethod
+        def from_json_schema(cls, json_schema: str, verbose: bool = True):
+            return cls(json_schema)
+
+    llama_cpp.Llama = _StubLlama
+    llama_cpp.LlamaGrammar = _StubLlamaGrammar
+    sys.modules["llama_cpp"] = llama_cpp
+
+import app  # noqa: E402
+
+REPLY = (
+    '{"standardized_program": "Mathematics", '
+    '"standardized_university": "McGill University"}'
+)
+
+
+class FakeLlama:
+    """Model stand-in that answers every chat completion with `reply`."""
+
+    def __init__(self, reply: str = REPLY) -> None:
+        self.reply = reply
+        self.calls: List[Dict[str, Any]] = []
+
+    def create_chat_completion(self, messages, **kwargs) -> Dict[str, Any]:
+        self.calls.append({"messages": messages, **kwargs})
+        return {"choices": [{"message": {"content": self.reply}}]}
+
+
+@pytest.fixture
+def fake_llm(monkeypatch) -> FakeLlama:
+    """Load a `FakeLlama` as the model, with fresh cache/fallback counters."""
+    llm = FakeLlama()
+    monkeypatch.setattr(app, "_LLM", llm)
+    monkeypatch.setattr(app, "_CACHE_STATS", {"hits": 0, "misses": 0})
+    monkeypatch.setattr(app, "_PARSE_STATS", {"fallbacks": 0})
+    return llm
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""Prebuilt fuzzy-match index that returns the same best match as difflib."""
+
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Tuple
+
+
+def _ratio(matches: int, length: int) -> float:
+    """Same formula (and float rounding) as difflib's ``_calculate_ratio``."""
+    return 2.0 * matches / length if length else 1.0
+
+
+def _trigrams(s: str) -> set:
+    """Lower-cased character trigrams of a space-padded string."""
+    padded = f"  {s.lower()} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class FuzzyIndex:
+    """Candidate index equivalent to ``difflib.get_close_matches(name, c, n=1)``.
+
+    ``get_close_matches`` runs ``real_quick_ratio`` / ``quick_ratio`` /
+    ``ratio`` against every candidate. Here:
+
+    - a trigram inverted index proposes a few likely candidates whose true
+      ``ratio`` seeds the best score, raising the effective cutoff;
+    - candidates are bucketed by length, and buckets whose length bound
+      (``real_quick_ratio``) cannot reach that cutoff are skipped whole;
+    - surviving candidates are scored by ``quick_ratio`` from prebuilt
+      character counts, and ``SequenceMatcher.ratio`` is then evaluated in
+      descending bound order, stopping once no bound can beat the best score.
+
+    Both quick ratios are upper bounds of ``ratio``, and ties are broken like
+    difflib (the larger string wins), so the result is identical to the
+    linear scan; the trigram seeds only affect speed.
+    """
+
+    def __init__(self, candidates: Iterable[str], seeds: int = 5) -> None:
+        self.candidates: List[str] = list(candidates)
+        self._seeds = seeds
+        self._members = frozenset(self.candidates)
+        # Per-candidate character counts as tuples indexed by alphabet position
+        alphabet = sorted(set("".join(self.candidates)))
+        self._alphabet = {ch: k for k, ch in enumerate(alphabet)}
+        self._counts: List[Tuple[int, ...]] = []
+        self._by_length: Dict[int, List[int]] = defaultdict(list)
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        for i, cand in enumerate(self.candidates):
+            counts = Counter(cand)
+            self._counts.append(tuple(counts[ch] for ch in self._alphabet))
+            self._by_length[len(cand)].append(i)
+            for gram in _trigrams(cand):
+                self._postings[gram].append(i)
+
+    def __contains__(self, name: object) -> bool:
+        """O(1) exact membership."""
+        return name in self._members
+
+    def __len__(self) -> int:
+        return len(self.candidates)
+
+    def _seed_candidates(self, name: str) -> List[int]:
+        """Indices of the candidates sharing the most trigrams with ``name``."""
+        shared: Counter = Counter()
+        for gram in _trigrams(name):
+            shared.update(self._postings.get(gram, ()))
+        return [i for i, _ in shared.most_common(self._seeds)]
+
+    def best_match(self, name: str, cutoff: float) -> str | None:
+        """Return the best candidate with ``ratio() >= cutoff`` (or None)."""
+        if not name or not self.candidates:
+            return None
+
+        matcher = SequenceMatcher()
+        matcher.set_seq2(name)
+        best: Tuple[float, str] | None = None
+
+        def consider(i: int) -> None:
+            nonlocal best
+            cand = self.candidates[i]
+            matcher.set_seq1(cand)
+            score = matcher.ratio()
+            if score >= cutoff and (best is None or (score, cand) > best):
+                best = (score, cand)
+
+        seeded = self._seed_candidates(name)
+        for i in seeded:
+            consider(i)
+        floor = max(cutoff, best[0]) if best else cutoff
+
+        # Characters outside the candidates' alphabet can never match
+        len_a = len(name)
+        name_counts = Counter(ch for ch in name if ch in self._alphabet)
+        positions = [self._alphabet[ch] for ch in name_counts]
+        wanted = list(name_counts.values())
+        bounded: List[Tuple[float, int]] = []
+        for len_b, idxs in self._by_length.items():
+            total = len_a + len_b
+            if _ratio(min(len_a, len_b), total) < floor:
+                continue
+            for i in idxs:
+                have = map(self._counts[i].__getitem__, positions)
+                matches = sum(map(min, wanted, have))
+                bound = _ratio(matches, total)
+                if bound >= floor:
+                    bounded.append((bound, i))
+
+        bounded.sort(reverse=True)
+        for bound, i in bounded:
+            if best is not None and bound < best[0]:
+                break
+            if i not in seeded:
+                consider(i)
+        return best[1] if best else None
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""Tests for the tab-separated university abbreviation rules in app.py.
+
+Run from this directory (app.py reads its canonical lists relative to it):
+    python -m pytest test_abbrev.py
+"""
+
+from __future__ import annotations
+
+import pytest
+
+import app
+
+
+@pytest.fixture
+def rules(tmp_path):
+    """Load a small rules file with comments, blank lines, and a bad line."""
+    path = tmp_path / "abbrev.txt"
+    path.write_text(
+        "# comment\tNot a rule\n"
+        "\n"
+        "no tab here\n"
+        "MIT \t Massachusetts Institute of Technology \n"
+        "mit\tShadowed Duplicate\n"
+        "u\\.?c\\.? ?berkeley\tUniversity of California, Berkeley\n"
+        "u(cb|c berkeley)\tUC Berkeley (short)\n"
+        "jhu|johns hopkins\tJohns Hopkins University\n",
+        encoding="utf-8",
+    )
+    return app._load_abbrev_rules(str(path))
+
+
+def test_literal_rules_are_case_insensitive_and_first_wins(rules):
+    """Plain patterns match the whole string in any case; duplicates are ignored."""
+    assert rules.expand("MIT") == "Massachusetts Institute of Technology"
+    assert rules.expand("mIt") == "Massachusetts Institute of Technology"
+
+
+def test_regex_rules_match_whole_string_in_file_order(rules):
+    """Regex patterns are tried as one alternation and must match fully."""
+    assert rules.expand("U.C. Berkeley") == "University of California, Berkeley"
+    assert rules.expand("ucberkeley") == "University of California, Berkeley"
+    assert rules.expand("UCB") == "UC Berkeley (short)"
+    assert rules.expand("uc berkeley") == "University of California, Berkeley"
+    assert rules.expand("Johns Hopkins") == "Johns Hopkins University"
+    assert rules.expand("JHU") == "Johns Hopkins University"
+
+
+def test_unmatched_and_partial_strings_are_not_expanded(rules):
+    """Comments, lines without a tab, and substrings never expand."""
+    assert rules.expand("# comment") is None
+    assert rules.expand("no tab here") is None
+    assert rules.expand("MIT Sloan") is None
+    assert rules.expand("jhu sais") is None
+
+
+def test_missing_file_has_no_rules(tmp_path):
+    """A missing rules file expands nothing."""
+    assert app._load_abbrev_rules(str(tmp_path / "missing.txt")).expand("MIT") is None
+
+
+@pytest.mark.parametrize(
+    "text, expansion",
+    [
+        ("McG", "McGill University"),
+        ("mcgill.", "McGill University"),
+        ("U.B.C.", "University of British Columbia"),
+        ("UofT", "University of Toronto"),
+        ("McGiill University", "McGill University"),
+    ],
+)
+def test_bundled_rules(text, expansion):
+    """The shipped abbrev_universities.txt expands the documented examples."""
+    assert app.ABBREV_UNI.expand(text) == expansion
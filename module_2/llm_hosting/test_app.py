@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""Tests for the rules-first gate in app.py.
+
+Run from this directory (app.py reads its canonical lists relative to it):
+    python -m pytest test_app.py
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+os.environ["LLM_CACHE_DIR"] = ""  # must be set before app reads it
+
+import app  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "text, program, university",
+    [
+        (
+            "Computer Science, University of California, Berkeley",
+            "Computer Science",
+            "University of California, Berkeley",
+        ),
+        (
+            "Computer Science, University of Texas at Austin",
+            "Computer Science",
+            "University of Texas at Austin",
+        ),
+        (
+            "Computer Science at University of Texas at Austin",
+            "Computer Science",
+            "University of Texas at Austin",
+        ),
+    ],
+)
+def test_rules_first_keeps_separators_inside_university(text, program, university):
+    """Only the first separator splits program from university."""
+    result, confidence = app._rules_first(text)
+    assert result == {
+        "standardized_program": program,
+        "standardized_university": university,
+    }
+    assert confidence == 1.0
+
+
+def test_rules_first_needs_program_and_university():
+    """A row without a separator is left to the model."""
+    assert app._rules_first("Computer Science") == ({}, 0.0)
+    assert app._rules_first("Computer Science ,  ") == ({}, 0.0)
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""Tests for the on-disk memoization of standardization results in app.py.
+
+Run from this directory (app.py reads its canonical lists relative to it):
+    python -m pytest test_cache.py
+"""
+
+from __future__ import annotations
+
+import importlib
+
+import pytest
+from diskcache import Cache
+
+import app
+
+
+@pytest.fixture
+def cache(monkeypatch, tmp_path):
+    """Open a fresh result cache in a temporary directory."""
+    result_cache = Cache(str(tmp_path / "llm_cache"))
+    monkeypatch.setattr(app, "_CACHE", result_cache)
+    yield result_cache
+    result_cache.close()
+
+
+def test_cache_key_normalizes_whitespace_and_case():
+    """Rows differing only in spacing or case share one key."""
+    key = app._cache_key("  Mathematics,\tMcGill   University ")
+    assert key == app._cache_key("mathematics, MCGILL university")
+    assert key == f"{app._CACHE_FINGERPRINT}:mathematics, mcgill university"
+    assert key != app._cache_key("Mathematics, UBC")
+
+
+def test_cached_call_memoizes_normalized_rows(fake_llm, cache):
+    """A repeated row is answered from the cache without calling the model."""
+    first = app._cached_call(app._call_llm, "Mathematics, McG")
+    again = app._cached_call(app._call_llm, "  mathematics,  MCG ")
+
+    assert again == first
+    assert len(fake_llm.calls) == 1
+    assert app._CACHE_STATS == {"hits": 1, "misses": 1}
+    assert cache.get(app._cache_key("Mathematics, McG")) == first
+
+
+def test_cached_call_skips_fallback_results(fake_llm, cache):
+    """Replies that went to the rules fallback are not memoized."""
+    fake_llm.reply = "not json"
+    app._cached_call(app._call_llm, "Mathematics, McG")
+    app._cached_call(app._call_llm, "Mathematics, McG")
+
+    assert len(fake_llm.calls) == 2
+    assert app._PARSE_STATS["fallbacks"] == 2
+    assert app._CACHE_STATS == {"hits": 0, "misses": 2}
+    assert len(cache) == 0
+
+
+def test_cache_misses_after_fingerprint_change(fake_llm, cache, monkeypatch):
+    """Results cached under another fingerprint are not reused."""
+    app._cached_call(app._call_llm, "Mathematics, McG")
+    monkeypatch.setattr(app, "_CACHE_FINGERPRINT", "0" * 16)
+    app._cached_call(app._call_llm, "Mathematics, McG")
+
+    assert len(fake_llm.calls) == 2
+    assert app._CACHE_STATS == {"hits": 0, "misses": 2}
+
+
+def test_fingerprint_covers_normalization_data(monkeypatch, tmp_path):
+    """Editing the abbreviation rules changes the fingerprint."""
+    rules = tmp_path / "abbrev.txt"
+    with open(app.ABBREV_UNIS_PATH, encoding="utf-8") as f:
+        rules.write_text(f.read() + "jhu\tJohns Hopkins University\n", "utf-8")
+    original = app._CACHE_FINGERPRINT
+
+    monkeypatch.setenv("ABBREV_UNIS_PATH", str(rules))
+    try:
+        assert importlib.reload(app)._CACHE_FINGERPRINT != original
+    finally:
+        monkeypatch.undo()
+        importlib.reload(app)
+    assert app._CACHE_FINGERPRINT == original
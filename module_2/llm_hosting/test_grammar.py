@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""Tests for grammar-constrained decoding (OUTPUT_SCHEMA) in app.py.
+
+Run from this directory (app.py reads its canonical lists relative to it):
+    python -m pytest test_grammar.py
+"""
+
+from __future__ import annotations
+
+import json
+from typing import List
+
+import pytest
+
+import app
+
+
+class RecordingGrammar:
+    """``LlamaGrammar`` stand-in that records the schemas it is built from."""
+
+    schemas: List[str] = []
+
+    def __init__(self, json_schema: str) -> None:
+        self.json_schema = json_schema
+
+    @classmethod
+    def from_json_schema(cls, json_schema: str, verbose: bool = True):
+        cls.schemas.append(json_schema)
+        return cls(json_schema)
+
+
+@pytest.fixture
+def grammar(monkeypatch):
+    """Build grammars with `RecordingGrammar`, starting from none compiled."""
+    RecordingGrammar.schemas = []
+    monkeypatch.setattr(app, "LlamaGrammar", RecordingGrammar)
+    monkeypatch.setattr(app, "_GRAMMAR", None)
+    monkeypatch.setattr(app, "LLM_GRAMMAR", True)
+    return RecordingGrammar
+
+
+def test_grammar_is_built_once_from_output_schema(grammar):
+    """The grammar comes from OUTPUT_SCHEMA and is compiled only on first use."""
+    first = app._get_grammar()
+    assert app._get_grammar() is first
+    assert grammar.schemas == [json.dumps(app.OUTPUT_SCHEMA)]
+    assert json.loads(first.json_schema)["required"] == [
+        "standardized_program",
+        "standardized_university",
+    ]
+
+
+def test_grammar_off_builds_nothing(grammar, monkeypatch):
+    """With LLM_GRAMMAR off, decoding is unconstrained."""
+    monkeypatch.setattr(app, "LLM_GRAMMAR", False)
+    assert app._get_grammar() is None
+    assert not grammar.schemas
+
+
+def test_call_llm_passes_the_grammar(grammar, fake_llm):
+    """Every chat completion is constrained by the schema grammar."""
+    app._call_llm("Mathematics, McG")
+    assert fake_llm.calls[-1]["grammar"] is app._get_grammar()
+    assert len(grammar.schemas) == 1
+
+
+def test_grammar_reply_may_contain_braces(grammar, fake_llm, monkeypatch):
+    """A constrained reply is parsed whole, so braces inside values still parse."""
+    fake_llm.reply = json.dumps(
+        {
+            "standardized_program": "Data {Science}",
+            "standardized_university": "McGill University",
+        }
+    )
+    app._call_llm("Data {Science}, McGill")
+    assert app._PARSE_STATS["fallbacks"] == 0
+
+    # Free-text replies are cut at the first "}", which breaks this one
+    monkeypatch.setattr(app, "LLM_GRAMMAR", False)
+    app._call_llm("Data {Science}, McGill")
+    assert app._PARSE_STATS["fallbacks"] == 1
+
+
+def test_generated_gbnf_requires_both_keys():
+    """llama.cpp's converter turns OUTPUT_SCHEMA into a two-key object rule."""
+    llama_grammar = pytest.importorskip("llama_cpp.llama_grammar")
+    gbnf = llama_grammar.json_schema_to_gbnf(json.dumps(app.OUTPUT_SCHEMA))
+    root = next(ln for ln in gbnf.splitlines() if ln.startswith("root ::="))
+    assert "standardized-program-kv" in root
+    assert "standardized-university-kv" in root
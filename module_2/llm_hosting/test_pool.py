@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""Tests for the multi-process LLM worker pool in app.py.
+
+The pool is replaced by a thread pool (same ``imap`` contract) so the tests
+need no model processes.
+
+Run from this directory (app.py reads its canonical lists relative to it):
+    python -m pytest test_pool.py
+"""
+
+from __future__ import annotations
+
+import time
+from multiprocessing.pool import ThreadPool
+from typing import Dict
+
+import pytest
+
+import app
+
+GATED = "Computer Science, University of Texas at Austin"
+
+
+def slow_llm(program_text: str) -> Dict[str, str]:
+    """Fake `_call_llm` where earlier rows finish later (p0 is slowest)."""
+    time.sleep(0.05 / (1 + int(program_text[1:])))
+    return {
+        "standardized_program": program_text.upper(),
+        "standardized_university": "Unknown",
+    }
+
+
+@pytest.fixture
+def thread_pool(monkeypatch):
+    """Serve `_get_pool` from a thread pool; record the worker counts asked for."""
+    requested = []
+    pools = []
+
+    def get_pool(workers):
+        requested.append(workers)
+        pools.append(ThreadPool(workers))
+        return pools[-1]
+
+    monkeypatch.setattr(app, "_get_pool", get_pool)
+    monkeypatch.setattr(app, "_call_llm", slow_llm)
+    monkeypatch.setattr(app, "_CACHE_STATS", {"hits": 0, "misses": 0})
+    monkeypatch.setattr(app, "_PARSE_STATS", {"fallbacks": 0})
+    yield requested
+    for pool in pools:
+        pool.terminate()
+
+
+def test_pooled_rows_keep_input_order(thread_pool):
+    """Rows come back in input order even when workers finish out of order."""
+    texts = ["p0", GATED, "p1", "p2", GATED, "p3", "p4", "p5"]
+    rows = list(app._standardize_rows([{"program": t} for t in texts], workers=3))
+
+    assert [r["program"] for r in rows] == texts
+    assert [r["llm-generated-program"] for r in rows] == [
+        "P0",
+        "Computer Science",
+        "P1",
+        "P2",
+        "Computer Science",
+        "P3",
+        "P4",
+        "P5",
+    ]
+    assert thread_pool == [3]
+    assert app._THROUGHPUT["bypassed"] == 2
+
+
+def test_pool_is_not_started_when_every_row_is_gated(thread_pool):
+    """Rows resolved by the rules-first gate never start the worker pool."""
+    rows = list(app._standardize_rows([{"program": GATED}] * 2, workers=4))
+    assert [r["llm-generated-university"] for r in rows] == [
+        "University of Texas at Austin"
+    ] * 2
+    assert not thread_pool
+
+
+def test_worker_counts_are_merged_into_parent_stats(monkeypatch):
+    """Cache and fallback counts returned by workers add up in the parent."""
+
+    class FakePool:
+        def imap(self, func, tasks):
+            assert func is app._pool_call
+            for program_text in tasks:
+                yield {"standardized_program": program_text}, {
+                    "hits": 1,
+                    "misses": 0,
+                    "fallbacks": 1,
+                }
+
+    monkeypatch.setattr(app, "_get_pool", lambda workers: FakePool())
+    monkeypatch.setattr(app, "_CACHE_STATS", {"hits": 0, "misses": 0})
+    monkeypatch.setattr(app, "_PARSE_STATS", {"fallbacks": 0})
+
+    results = list(app._pooled_results(["a", "b"], workers=2))
+    assert [r["standardized_program"] for r in results] == ["a", "b"]
+    assert app._CACHE_STATS == {"hits": 2, "misses": 0}
+    assert app._PARSE_STATS == {"fallbacks": 2}
+
+
+def test_pool_call_returns_its_own_counts(fake_llm):
+    """A worker reports the cache/fallback counts of just the row it handled."""
+    fake_llm.reply = "not json"
+    app._PARSE_STATS["fallbacks"] = 5
+    result, counts = app._pool_call("Mathematics, McG")
+
+    assert result["standardized_university"] == "McGill University"
+    assert counts == {"hits": 0, "misses": 0, "fallbacks": 1}
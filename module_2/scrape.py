@@ -1,10 +1,15 @@
 #!/usr/bin/env python3
 
+import json
+import os
 import urllib3
 from bs4 import BeautifulSoup
 from concurrent.futures import ThreadPoolExecutor
+from http_pool import InstrumentedPoolManager
 
-http = urllib3.PoolManager()
+# one kept-alive connection per detail-page thread (the largest pool below)
+DETAIL_WORKERS = 300
+http = InstrumentedPoolManager(maxsize=DETAIL_WORKERS, block=True)
 
 
 def _scrape_survey_page(page_num: int):
@@ -121,38 +126,98 @@ def _scrape_page(page_entry: dict):
         return None
 
 
-def scrape_data(target_count, batch_size):
-    # scrape the pages from https://www.thegradcafe.com until we get the target number of entries
-
-    all_entries = [] 
-    page_num = 1 
-
-    # continue scraping results until we get to the target count
-    while len(all_entries) < target_count:
-
-        # determine the page range for the surveys based on batch size
-        page_range = list(range(page_num, page_num + batch_size))
-        print(f"Scraping survey pages {page_range[0]}–{page_range[-1]}...")
-
-        # using threading to concurrently scrape survey pages
-        with ThreadPoolExecutor(max_workers=100) as executor:
-            results = list(executor.map(_scrape_survey_page, page_range))        
+def load_checkpoint(path):
+    # replay the append-only checkpoint log into the state of an interrupted scrape
+    state = {"next_page": 1, "entries": [], "surveyed": False, "details": {}}
+    if not path or not os.path.exists(path):
+        return state
 
-        # flatten the results and remove empty entries
-        batch_entries = [entry for sublist in results for entry in sublist]
-        if not batch_entries:
-            break  
-        all_entries.extend(batch_entries)
-
-        print(f"Collected {len(all_entries)} survey entries so far...")
-        page_num += batch_size # initialize the next batch of pages
+    good_offset = 0
+    with open(path, "rb") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                break  # torn write from a crash, ignore it and anything after
+            good_offset += len(line)
+            if record["type"] == "batch":
+                state["next_page"] = record["next_page"]
+                state["entries"].extend(record["entries"])
+            elif record["type"] == "surveyed":
+                state["surveyed"] = True
+            elif record["type"] == "detail":
+                state["details"][record["record"]["id"]] = record["record"]
+
+    # cut off the torn write so new records aren't appended onto it
+    if good_offset < os.path.getsize(path):
+        with open(path, "r+b") as f:
+            f.truncate(good_offset)
+    return state
+
+
+def _append_checkpoint(log, record, sync=False):
+    # write one record to the log; fsync at batch boundaries so it survives a power loss
+    if log is None:
+        return
+    log.write(json.dumps(record) + "\n")
+    log.flush()
+    if sync:
+        os.fsync(log.fileno())
+
+
+def scrape_data(target_count, batch_size, checkpoint=None):
+    # scrape the pages from https://www.thegradcafe.com until we get the target number of entries
+    # if a checkpoint path is given, progress is appended to that log as it's made and a
+    # restarted scrape resumes from it instead of refetching everything
 
-    all_entries = all_entries[:target_count]
-    print(f"Collected {len(all_entries)} survey entries. Fetching details...")
+    state = load_checkpoint(checkpoint)
+    all_entries = state["entries"]
+    page_num = state["next_page"]
+    details = state["details"]
+    if all_entries:
+        print(f"Resuming from checkpoint: {len(all_entries)} survey entries, {len(details)} detail pages")
 
-    # use threading to concurrently run results pages 
-    with ThreadPoolExecutor(max_workers=300) as executor:
-        detailed = list(executor.map(_scrape_page, all_entries))
+    log = open(checkpoint, "a") if checkpoint else None
+    try:
+        # continue scraping results until we get to the target count
+        while not state["surveyed"] and len(all_entries) < target_count:
+
+            # determine the page range for the surveys based on batch size
+            page_range = list(range(page_num, page_num + batch_size))
+            print(f"Scraping survey pages {page_range[0]}–{page_range[-1]}...")
+
+            # using threading to concurrently scrape survey pages
+            with ThreadPoolExecutor(max_workers=100) as executor:
+                results = list(executor.map(_scrape_survey_page, page_range))        
+
+            # flatten the results and remove empty entries
+            batch_entries = [entry for sublist in results for entry in sublist]
+            if not batch_entries:
+                break  
+            all_entries.extend(batch_entries)
+
+            print(f"Collected {len(all_entries)} survey entries so far...")
+            page_num += batch_size # initialize the next batch of pages
+            _append_checkpoint(log, {"type": "batch", "next_page": page_num, "entries": batch_entries}, sync=True)
+
+        if not state["surveyed"]:
+            _append_checkpoint(log, {"type": "surveyed"}, sync=True)
+
+        all_entries = all_entries[:target_count]
+        print(f"Collected {len(all_entries)} survey entries. Fetching details...")
+
+        # use threading to concurrently run results pages, skipping ones already in the checkpoint
+        pending = [e for e in all_entries if e["id"] not in details]
+        with ThreadPoolExecutor(max_workers=DETAIL_WORKERS) as executor:
+            for n, d in enumerate(executor.map(_scrape_page, pending), start=1):
+                if d:
+                    details[d["id"]] = d
+                    _append_checkpoint(log, {"type": "detail", "record": d}, sync=n % 500 == 0)
+    finally:
+        if log:
+            log.close()
+
+    print(f"Connection pool stats: {http.stats()}")
 
     # return entries
-    return [d for d in detailed if d]
+    return [details[e["id"]] for e in all_entries if e["id"] in details]
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import json
 import psycopg
+from itertools import chain, islice
 from pathlib import Path
 import argparse
 
@@ -22,6 +23,9 @@ KEY_MAP = {
     "llm-generated-university": "llm_generated_university",
 }
 
+# Number of rows read, inserted, and committed at a time by load_data_to_db
+CHUNK_SIZE = 5000
+
 
 def load_jsonl(filename: str):
     """Read data from a jsonl (json Lines) file.
@@ -32,8 +36,42 @@ def load_jsonl(filename: str):
     Output:
         list[dict]: A list of dictionaries, one per line of JSON in the file.
     """
+    return list(iter_jsonl(filename))
+
+
+def iter_jsonl(filename: str):
+    """Lazily read data from a jsonl (json Lines) file.
+
+    Input:
+        filename (str): Path to the jsonl file.
+
+    Output:
+        generator[dict]: Yields one dictionary per non-empty line of JSON.
+    """
     with open(filename, "r") as f:
-        return [json.loads(line) for line in f if line.strip()]
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_chunks(rows, size):
+    """Group an iterable of rows into lists of at most `size` rows.
+
+    Input:
+        rows (iterable[dict]): Rows to group, consumed lazily.
+        size (int): Maximum number of rows per chunk; at least 1.
+
+    Output:
+        generator[list[dict]]: Consecutive chunks of rows.
+
+    Raises:
+        ValueError: If size is less than 1 (raised when iteration starts).
+    """
+    if size < 1:
+        raise ValueError(f"Chunk size must be at least 1, got {size}")
+    rows = iter(rows)
+    while chunk := list(islice(rows, size)):
+        yield chunk
 
 
 def create_table(conn):
@@ -98,9 +136,12 @@ def insert_data(conn, data):
         conn.commit()
 
 
-def load_data_to_db(file_path, initial_load=False, connection_string=None):
+def load_data_to_db(file_path, initial_load=False, connection_string=None, chunk_size=CHUNK_SIZE):
     """Load applicant data from a JSONL file into PostgreSQL.
 
+    The file is streamed and inserted chunk_size rows at a time, so peak
+    memory does not grow with file size.
+
     Input:
         file_path (str): Path to the json file containing applicant data.
         initial_load (bool, optional): If True, drop and recreate the table
@@ -108,15 +149,18 @@ def load_data_to_db(file_path, initial_load=False, connection_string=None):
         connection_string (str, optional): A postgres connection string.
             If not provided, defaults to
             "dbname=thegradcafe user=postgres host=localhost port=5432".
+        chunk_size (int, optional): Number of rows read and inserted per chunk.
+            Defaults to CHUNK_SIZE.
 
     Output:
         None. Loads data into the applicants table.
     """
     connection_string = connection_string or "dbname=thegradcafe user=postgres host=localhost port=5432"
 
-    # Initialize the data from the JSONL file
-    data = load_jsonl(file_path)
-    if not data:
+    # Stream the JSONL file in chunks; peek at the first before connecting
+    chunks = iter_chunks(iter_jsonl(file_path), chunk_size)
+    first_chunk = next(chunks, None)
+    if not first_chunk:
         print(f"No data found in {file_path}")
         return
 
@@ -127,14 +171,21 @@ def load_data_to_db(file_path, initial_load=False, connection_string=None):
         else:
             print("Appending new entries to existing table...")
 
-        insert_data(conn, data)
-        print(f"Loaded {len(data)} entries into the applicants table.")
+        total = 0
+        for chunk_num, chunk in enumerate(chain([first_chunk], chunks), start=1):
+            insert_data(conn, chunk)
+            total += len(chunk)
+            print(f"Chunk {chunk_num}: loaded {total} entries so far...")
+        print(f"Loaded {total} entries into the applicants table.")
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Load JSONL applicant data into PostgreSQL")
     parser.add_argument("file", help="Path to JSONL file")
     parser.add_argument("--initial", action="store_true", help="Drop table and reload all data")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Rows read and inserted per chunk")
     args = parser.parse_args()
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
 
-    load_data_to_db(args.file, initial_load=args.initial)
+    load_data_to_db(args.file, initial_load=args.initial, chunk_size=args.chunk_size)
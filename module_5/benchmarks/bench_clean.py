@@ -0,0 +1,105 @@
+"""
+Before/after benchmark for `src.clean.clean_data`.
+
+Compares the current implementation against the previous one, which built a
+new ``BeautifulSoup`` for every field of every entry. Entries are synthetic
+but shaped like `scrape_page` output (plain-text values); ``--markup`` wraps
+each value in a label ``<span>`` to exercise the parsing path instead.
+
+Usage (from the module_5 folder):
+    python -m benchmarks.bench_clean --entries 50000 [--markup]
+"""
+
+#!/usr/bin/env python3
+import argparse
+import time
+
+from bs4 import BeautifulSoup
+
+from src import clean
+
+VALUES = {
+    "Program": "Computer Science",
+    "Institution": "Johns Hopkins University",
+    "Notes": "Got the email this morning!",
+    "Decision": "Accepted",
+    "Notification": "on 15/04/2025 via E-mail",
+    "Degree's Country of Origin": "American",
+    "Degree Type": "Masters",
+    "Undergrad GPA": "3.85",
+    "Date Added": "April 15, 2025",
+    "Term": "Fall 2025",
+    "GRE Score": "330",
+    "GRE V Score": "165",
+    "GRE AW": "4.5",
+}
+
+
+def make_entries(count, markup=False):
+    """Build ``count`` raw entries, optionally wrapping values in label spans."""
+    entries = []
+    for i in range(count):
+        data = {
+            label: f"<span>{label}</span>{value}" if markup else value
+            for label, value in VALUES.items()
+        }
+        entries.append({"url": f"https://www.thegradcafe.com/result/{i}", "data": data})
+    return entries
+
+
+def _legacy_extract_label_text(raw_html, label):
+    """Previous implementation: one parse (and two get_text calls) per field."""
+    soup = BeautifulSoup(raw_html, "html.parser")
+    span_label = soup.find("span", string=lambda t: t and t.strip() == label)
+    if span_label and span_label.next_sibling:
+        return span_label.next_sibling.get_text(strip=True)
+    return soup.get_text(strip=True) if soup.get_text(strip=True) else None
+
+
+def legacy_clean_data(raw_entries, target_count):
+    """Previous `clean_data`, reusing the unchanged helpers from src.clean."""
+    # pylint: disable=protected-access
+    cleaned = []
+    for entry in raw_entries:
+        pairs = entry["data"]
+        record = {}
+        for field, labels in clean.FIELD_MAP.items():
+            value = None
+            for label in labels:
+                raw_html = pairs.get(label)
+                if raw_html and raw_html.strip():
+                    value = _legacy_extract_label_text(raw_html, label)
+                    if value:
+                        break
+            record[field] = value
+        record["program"] = clean._combine_program_and_university(record)
+        record["URL"] = entry.get("url")
+        clean._apply_decision_logic(record, pairs)
+        cleaned.append(record)
+    return cleaned[:target_count]
+
+
+def _run(label, func, entries):
+    """Time one clean_data implementation and print entries/sec."""
+    start = time.perf_counter()
+    result = func(entries, target_count=len(entries))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<8} {elapsed:8.2f}s  {len(entries) / elapsed:10.0f} entries/sec")
+    return result
+
+
+def main():
+    """Run both implementations on the same entries and check they agree."""
+    parser = argparse.ArgumentParser(description="Benchmark clean_data")
+    parser.add_argument("--entries", type=int, default=50000)
+    parser.add_argument("--markup", action="store_true")
+    args = parser.parse_args()
+
+    entries = make_entries(args.entries, markup=args.markup)
+    before = _run("before", legacy_clean_data, entries)
+    after = _run("after", clean.clean_data, entries)
+    print(f"identical output: {before == after}")
+
+
+if __name__ == "__main__":
+    main()
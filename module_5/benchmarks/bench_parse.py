@@ -0,0 +1,122 @@
+"""
+Parse-throughput benchmark for the scraper's HTML parser backends.
+
+Parses saved survey and result pages (``benchmarks/fixtures`` by default) with
+the previous CSS-selector/``html.parser`` code and with each available
+`src.scrape.PARSER_BACKENDS` entry, and checks every backend produces
+identical entry dicts (ignoring the ``listing`` fields the legacy code did not
+parse).
+
+Usage (from the module_5 folder):
+    python -m benchmarks.bench_parse [--survey PATH] [--result PATH] [--repeat N]
+"""
+
+#!/usr/bin/env python3
+# pylint: disable=duplicate-code
+import argparse
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from src import scrape
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+def legacy_parse_survey(html):
+    """Previous survey parsing: html.parser plus select/select_one per row."""
+    # pylint: disable=protected-access
+    soup = BeautifulSoup(html, "html.parser")
+    entries = []
+    rows = soup.select("tr")
+    i = 0
+    while i < len(rows):
+        link_tag = rows[i].select_one("a[href^='/result/']")
+        if not link_tag:
+            i += 1
+            continue
+        badges_row = rows[i + 1] if i + 1 < len(rows) else None
+        record_data = (
+            scrape._parse_badge_texts(
+                (
+                    div.get_text(strip=True)
+                    for div in badges_row.find_all("div", class_="tw-inline-flex")
+                ),
+                scrape.TERM_PATTERN,
+            )
+            if badges_row
+            else {}
+        )
+        result_id, date_added = scrape._parse_entry_id_and_date(
+            link_tag, rows[i].select_one("td:nth-child(3)")
+        )
+        if result_id:
+            entry = {"id": result_id, "date_added": date_added}
+            entry.update(record_data)
+            entries.append(entry)
+        i += 2
+    return entries
+
+
+def legacy_parse_result(html):
+    """Previous result parsing: html.parser plus a ``dl > div`` CSS query."""
+    soup = BeautifulSoup(html, "html.parser")
+    pairs = {}
+    for block in soup.select("dl > div"):
+        dt = block.find("dt")
+        dd = block.find("dd")
+        if dt and dd:
+            pairs[dt.get_text(strip=True)] = dd.get_text(strip=True)
+    return pairs
+
+
+def _without_listing(result):
+    """Drop survey entries' ``listing`` fields, which the legacy code lacks."""
+    if isinstance(result, list):
+        return [{k: v for k, v in e.items() if k != "listing"} for e in result]
+    return result
+
+
+def _time(label, func, html, repeat):
+    """Parse ``html`` ``repeat`` times and print pages/sec."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func(html)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<14} {repeat / elapsed:10.1f} pages/sec")
+    return result
+
+
+def main():
+    """Benchmark each backend on the survey and result fixtures."""
+    parser = argparse.ArgumentParser(description="Benchmark scraper parsing")
+    parser.add_argument("--survey", default=FIXTURES / "survey_page.html")
+    parser.add_argument("--result", default=FIXTURES / "result_page.html")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    pages = {
+        "survey": (Path(args.survey).read_bytes(), legacy_parse_survey),
+        "result": (Path(args.result).read_bytes(), legacy_parse_result),
+    }
+    parse_funcs = {
+        "survey": scrape.parse_survey_html,
+        "result": scrape.parse_result_html,
+    }
+
+    for kind, (html, legacy) in pages.items():
+        print(f"{kind} page ({len(html)} bytes)")
+        expected = _time("legacy", legacy, html, args.repeat)
+        for backend in scrape.PARSER_BACKENDS:
+            try:
+                scrape.set_parser_backend(backend)
+            except ValueError as e:
+                print(f"  {backend:<14} skipped: {e}")
+                continue
+            actual = _time(backend, parse_funcs[kind], html, args.repeat)
+            print(f"  {'':<14} identical: {_without_listing(actual) == expected}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,19 +6,25 @@ Defines the main web routes for the Grad Cafe application:
 - `/analysis` (alias `/`): Render SQL query results.
 - `/scrape`: Scrape, pre-clean, and LLM-clean new entries.
 - `/refresh_queries`: Load cleaned entries into PostgreSQL.
-- `/scraper_status`: Return the scraper's busy/idle state.
+- `/scraper_status`: Return the scraper's busy/idle state and fetch metrics.
 """
 
 #!/usr/bin/env python3
 import json
+import os
+import re
 from pathlib import Path
 
 from flask import Blueprint, render_template
 
 from src.clean import clean_data, clean_with_llm
-from src.load_data import load_data_to_db
-from src.query_data import get_max_id, run_queries
-from src.scrape import scrape_new_entries
+from src.load_data import iter_jsonl, load_data_to_db
+from src.query_data import get_result_ids, run_queries
+from src.scrape import get_metrics, scrape_new_entries
+from src.scrape_async import scrape_new_entries_async
+from src.scrape_distributed import scrape_new_entries_distributed
+from src.retry_queue import RetryQueue
+from src.seen_ids import SeenIdSet
 
 # Initialize blueprint
 bp = Blueprint("pages", __name__)
@@ -30,6 +36,22 @@ _scraper_state = {"running": False}
 ROOT_DIR = Path(__file__).resolve().parents[2]  # module_5
 DATA_DIR = ROOT_DIR / "src" / "data"
 
+# Scraping engine for /scrape: "threads" (default), "async", or "processes"
+SCRAPE_ENGINE = os.getenv("SCRAPE_ENGINE", "threads")
+
+# Result IDs already loaded into the database, kept in DATA_DIR (see
+# src/seen_ids.py); IDs are added only once /refresh_queries has loaded them
+SEEN_IDS_FILE = "seen_ids.bin"
+
+# Result ID in an entry URL (same pattern as `query_data.get_result_ids`)
+RESULT_ID_RE = re.compile(r"/result/([0-9]+)$")
+
+# Result pages that failed to fetch, retried first by the next /scrape
+RETRY_QUEUE_FILE = "retry_queue.json"
+
+# Work queue shared by the "processes" engine's workers (see src/work_queue.py)
+WORK_QUEUE_FILE = "work_queue.sqlite3"
+
 
 @bp.route("/")
 @bp.route("/analysis")
@@ -53,8 +75,30 @@ def scrape():
 
     _scraper_state["running"] = True
     try:
-        max_id = get_max_id()
-        new_data = scrape_new_entries(max_id=max_id, target_count=1000)
+        seen = SeenIdSet(DATA_DIR / SEEN_IDS_FILE)
+        if not seen:  # first run: seed once from the database
+            seen.update(get_result_ids())
+        if SCRAPE_ENGINE == "async":
+            new_data = scrape_new_entries_async(
+                seen=seen,
+                target_count=1000,
+                retry_queue=RetryQueue(DATA_DIR / RETRY_QUEUE_FILE),
+            )
+        elif SCRAPE_ENGINE == "processes":
+            new_data = scrape_new_entries_distributed(
+                DATA_DIR / WORK_QUEUE_FILE,
+                seen=seen,
+                target_count=1000,
+                retry_queue=RetryQueue(DATA_DIR / RETRY_QUEUE_FILE),
+            )
+        else:
+            new_data = scrape_new_entries(
+                target_count=1000,
+                stores={
+                    "seen": seen,
+                    "retry_queue": RetryQueue(DATA_DIR / RETRY_QUEUE_FILE),
+                },
+            )
 
         raw_file = DATA_DIR / "new_entries.json"
         with open(raw_file, "w", encoding="utf-8") as f:
@@ -91,6 +135,7 @@ def refresh_queries():
 
     try:
         load_data_to_db(str(cleaned_file), initial_load=False)
+        _mark_loaded_ids_seen(cleaned_file)
         return {"ok": True}, 200
     except (OSError, ValueError, RuntimeError) as e:
         return {"error": str(e)}, 500
@@ -98,12 +143,26 @@ def refresh_queries():
         return {"error": str(e)}, 500
 
 
+def _mark_loaded_ids_seen(loaded_file) -> None:
+    """Add the result IDs of a file just loaded into the DB to the seen set."""
+    ids = []
+    for row in iter_jsonl(loaded_file):
+        match = RESULT_ID_RE.search(str(row.get("URL") or ""))
+        if match:
+            ids.append(int(match.group(1)))
+    SeenIdSet(DATA_DIR / SEEN_IDS_FILE).update(ids)
+
+
 @bp.route("/scraper_status")
 def scraper_status():
     """
     Return the current scraper status.
+
+    ``metrics`` holds the fetch metrics of the running (or last) scrape; see
+    `src.scrape.get_metrics`. The process engine's workers report theirs
+    when the scrape finishes.
     """
-    return {"is_scraping": _scraper_state["running"]}
+    return {"is_scraping": _scraper_state["running"], "metrics": get_metrics()}
 
 
 # --- Scraper state helpers (public API for tests and internals) ---
@@ -116,3 +175,12 @@ def set_scraper_running(state: bool) -> None:
 def is_scraper_running() -> bool:
     """Check whether the scraper is currently running."""
     return _scraper_state["running"]
+
+
+def reset_seen_ids() -> None:
+    """
+    Drop the seen-ID set, e.g. after the applicants table is reloaded.
+
+    The next /scrape seeds it again from the database.
+    """
+    (DATA_DIR / SEEN_IDS_FILE).unlink(missing_ok=True)
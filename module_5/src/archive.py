@@ -0,0 +1,190 @@
+"""
+Content-addressed on-disk archive of raw scraped HTML.
+
+An archive is a directory holding:
+
+- ``segment-NNNNN.gz`` files: each response body is appended as its own
+  gzip member, so every segment is also a valid multi-member gzip file.
+  A new segment is started once the current one exceeds ``segment_bytes``.
+- ``index.jsonl``: one line per stored URL with the body's SHA-256 and its
+  segment, offset, and compressed length. Identical bodies are stored once;
+  a URL fetched again points at its latest body.
+
+Writers serialise on a lock file in the directory (``archive.lock``), so
+several processes can record into one archive: each appends under the lock
+after catching up on the index lines the others wrote.
+
+`set_archive` makes an archive the active one, either recording fetches into
+it or replaying them from it, so parsing changes can be re-run locally
+without network access; `src.scrape` sets it from ``SCRAPE_ARCHIVE`` and
+``SCRAPE_ARCHIVE_MODE``.
+"""
+
+#!/usr/bin/env python3
+import gzip
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from filelock import FileLock
+
+from src.jsonl_log import read_records
+
+# Start a new segment file once the current one reaches this size
+SEGMENT_BYTES = 64 * 1024 * 1024
+
+INDEX_NAME = "index.jsonl"
+LOCK_NAME = "archive.lock"
+
+# Fetch archive: "record" stores every fetched page, "replay" serves them
+ARCHIVE_MODES = ("record", "replay")
+_active = {"archive": None, "mode": None}
+
+
+class HtmlArchive:
+    """
+    Thread- and process-safe archive of response bodies keyed by URL and
+    content hash.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        Archive directory; created if it does not exist.
+    segment_bytes : int, optional
+        Size at which a new segment file is started.
+    """
+
+    def __init__(self, path, segment_bytes=SEGMENT_BYTES):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._segment_bytes = segment_bytes
+        # Held by one thread of one process at a time: each thread locks the
+        # file through its own descriptor
+        self._lock = FileLock(self.path / LOCK_NAME)
+        self._urls = {}  # url -> sha256
+        self._blobs = {}  # sha256 -> (segment name, offset, length)
+        self._index_size = 0  # bytes of the index read so far
+        self._segment_num = 0
+        with self._lock:
+            self._load_index()
+
+    def _load_index(self):
+        """
+        Read index lines written since the last call (caller holds the lock).
+
+        A torn final line left by a crash is cut off; holding the lock
+        guarantees no other writer is midway through a line.
+        """
+        index = self.path / INDEX_NAME
+        for record in read_records(index, self._index_size):
+            self._urls[record["url"]] = record["sha256"]
+            self._blobs[record["sha256"]] = (
+                record["segment"],
+                record["offset"],
+                record["length"],
+            )
+        self._index_size = os.path.getsize(index) if index.exists() else 0
+
+    def __contains__(self, url):
+        return url in self._urls
+
+    def __len__(self):
+        return len(self._urls)
+
+    def get(self, url):
+        """
+        Return the archived body for ``url``, or None if it was never stored.
+        """
+        sha = self._urls.get(url)
+        if sha is None:
+            return None
+        segment, offset, length = self._blobs[sha]
+        with open(self.path / segment, "rb") as f:
+            f.seek(offset)
+            return gzip.decompress(f.read(length))
+
+    def put(self, url, body: bytes) -> str:
+        """
+        Store ``body`` as the response for ``url``.
+
+        Returns
+        -------
+        str
+            The SHA-256 hex digest of the body.
+        """
+        sha = hashlib.sha256(body).hexdigest()
+        with self._lock:
+            self._load_index()
+            if sha not in self._blobs:
+                self._blobs[sha] = self._append_blob(gzip.compress(body))
+            segment, offset, length = self._blobs[sha]
+            self._urls[url] = sha
+            record = {
+                "url": url,
+                "sha256": sha,
+                "segment": segment,
+                "offset": offset,
+                "length": length,
+            }
+            line = (json.dumps(record) + "\n").encode()
+            with open(self.path / INDEX_NAME, "ab") as f:
+                f.write(line)
+            self._index_size += len(line)
+        return sha
+
+    def _append_blob(self, blob: bytes):
+        """Append a compressed body to the current segment (caller holds the lock)."""
+        segment = self.path / f"segment-{self._segment_num:05d}.gz"
+        # Another process may have rolled over to a newer segment
+        while segment.exists() and (
+            segment.stat().st_size >= self._segment_bytes
+            or segment.with_name(f"segment-{self._segment_num + 1:05d}.gz").exists()
+        ):
+            self._segment_num += 1
+            segment = self.path / f"segment-{self._segment_num:05d}.gz"
+        with open(segment, "ab") as f:
+            offset = f.tell()
+            f.write(blob)
+        return segment.name, offset, len(blob)
+
+
+def set_archive(path, mode: str = "record") -> None:
+    """
+    Record fetched pages into an archive, or replay fetches from it.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path or None
+        Archive directory (see `HtmlArchive`). None disables the
+        archive and fetches from the site again.
+    mode : str, optional
+        ``"record"`` (default) fetches from the site and stores every
+        successful response; ``"replay"`` serves every fetch from the archive
+        and treats pages missing from it as failed fetches.
+
+    Raises
+    ------
+    ValueError
+        If the mode is unknown.
+    """
+    if mode not in ARCHIVE_MODES:
+        raise ValueError(f"Unknown archive mode: {mode!r}")
+    _active["archive"] = HtmlArchive(path) if path else None
+    _active["mode"] = mode if path else None
+
+
+def get_archive_mode():
+    """Return ``"record"``, ``"replay"``, or None when no archive is set."""
+    return _active["mode"]
+
+
+def replay_page(url):
+    """Return the active archive's body for ``url`` (None if it was never stored)."""
+    return _active["archive"].get(url)
+
+
+def record_page(url, body) -> None:
+    """Store a fetched ``body`` for ``url`` when recording (None is skipped)."""
+    if _active["mode"] == "record" and body is not None:
+        _active["archive"].put(url, body)
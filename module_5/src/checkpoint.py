@@ -0,0 +1,79 @@
+"""
+Append-only checkpoint log for long scrapes.
+
+Each line of the log is one JSON record:
+
+- ``{"type": "batch", "next_page": int, "entries": [...]}``: a batch of
+  survey pages finished; ``entries`` are its new survey entries and
+  ``next_page`` is the page frontier to resume from.
+- ``{"type": "surveyed"}``: the survey phase finished.
+- ``{"type": "detail", "record": {...}}``: a result page was scraped.
+
+Records are flushed as they are written, and fsynced at batch boundaries,
+so a crash or Ctrl-C loses at most the result pages still in flight.
+`load_checkpoint` replays the log and drops a torn final line left by a
+crash mid-write (`src.jsonl_log`).
+"""
+
+#!/usr/bin/env python3
+import json
+import os
+
+from src.jsonl_log import read_records
+
+
+def new_checkpoint_state() -> dict:
+    """Return the state of a scrape that has not started yet."""
+    return {"next_page": 1, "entries": [], "surveyed": False, "details": {}}
+
+
+def load_checkpoint(path) -> dict:
+    """
+    Replay a checkpoint log into a resumable scrape state.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        Path to the log. A missing file yields a fresh state.
+
+    Returns
+    -------
+    dict
+        ``next_page`` (int), ``entries`` (list of survey entries),
+        ``surveyed`` (bool), and ``details`` (dict of result records by ID).
+    """
+    state = new_checkpoint_state()
+    for record in read_records(path):
+        if record["type"] == "batch":
+            state["next_page"] = record["next_page"]
+            state["entries"].extend(record["entries"])
+        elif record["type"] == "surveyed":
+            state["surveyed"] = True
+        elif record["type"] == "detail":
+            state["details"][record["record"]["id"]] = record["record"]
+    return state
+
+
+def append_checkpoint(log, record: dict, sync: bool = False) -> None:
+    """
+    Append one record to an open checkpoint log.
+
+    Parameters
+    ----------
+    log : file object
+        The log, opened in text append mode.
+    record : dict
+        The JSON-serializable record to write.
+    sync : bool, optional
+        If True, fsync the log so the record survives a power loss.
+    """
+    log.write(json.dumps(record) + "\n")
+    log.flush()
+    if sync:
+        os.fsync(log.fileno())
+
+
+def remove_checkpoint(path) -> None:
+    """Delete a checkpoint log once its results have been saved elsewhere."""
+    if os.path.exists(path):
+        os.remove(path)
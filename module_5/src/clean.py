@@ -6,17 +6,23 @@ parses decision dates, and provides an interface to run external LLM-based
 cleaning. It includes:
 
 - `_parse_decision_date`: Extracts DD/MM/YYYY dates from notifications.
-- `clean_data`: Cleans raw HTML fields into standardized Python records.
-- `clean_with_llm`: Invokes an external LLM script to perform advanced
-  data cleaning and save results to disk.
+- `clean_data`: Cleans raw HTML fields into standardized Python records,
+  optionally sharded across a process pool.
+- `clean_with_llm`: Sends entries to the warm LLM standardizer service
+  (``llm_hosting/app.py --serve``), or invokes the LLM script in a
+  subprocess if the service is not running, and saves the results to disk.
 """
 
 #!/usr/bin/env python3
 
 import json
+import os
 import re
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 
+import urllib3
 from bs4 import BeautifulSoup
 
 
@@ -38,6 +44,35 @@ FIELD_MAP = {
     "GRE AW": ["GRE AW"],
 }
 
+# Every raw label consulted by FIELD_MAP, in a stable order
+_FIELD_LABELS = tuple(dict.fromkeys(l for labels in FIELD_MAP.values() for l in labels))
+
+# Wrapper tag used to parse all of an entry's markup values in one pass
+_VALUE_TAG = "entry-value"
+
+# Markup that can run past its wrapper in a shared parse: comments and other
+# "<!"/"<?" constructs, raw-text elements (whose content extends to their own
+# end tag), and tags left unterminated by the end of the value
+_UNSAFE_MARKUP = re.compile(
+    r"<[!?]|<(?:script|style|textarea|title|xmp|plaintext|iframe|noembed"
+    r"|noframes|noscript)\b|<[^>]*(?:<|$)",
+    re.IGNORECASE,
+)
+
+# Long-running standardizer (`llm_hosting/app.py --serve`) that keeps the
+# model loaded between scrapes; set to an empty string to always use the
+# subprocess
+LLM_SERVICE_URL = os.getenv("LLM_SERVICE_URL", "http://127.0.0.1:8000")
+
+# Rows sent per /standardize request
+LLM_SERVICE_CHUNK = 100
+
+# Seconds to wait for one chunk's response before falling back to the
+# subprocess
+LLM_SERVICE_TIMEOUT = float(os.getenv("LLM_SERVICE_TIMEOUT", "600"))
+
+llm_http = urllib3.PoolManager(retries=False)
+
 
 def _parse_decision_date(notification_str):
     """
@@ -61,24 +96,65 @@ def _parse_decision_date(notification_str):
     return match.group(0) if match else None
 
 
-def _extract_label_text(raw_html: str, label: str) -> str | None:
-    """Extract the text content after a specific label span in raw HTML."""
-    soup = BeautifulSoup(raw_html, "html.parser")
+def _has_markup(value: str) -> bool:
+    """Return True if a raw value contains HTML tags or character references."""
+    return "<" in value or "&" in value
+
+
+def _parse_markup_values(pairs: dict) -> dict:
+    """Parse all of an entry's markup-bearing values with a single parser pass."""
+    labels = [
+        label
+        for label in _FIELD_LABELS
+        if isinstance(pairs.get(label), str) and _has_markup(pairs[label])
+    ]
+    # Values that could break the shared parse are parsed on their own
+    parsed = {
+        label: BeautifulSoup(pairs[label], "html.parser")
+        for label in labels
+        if _VALUE_TAG in pairs[label] or _UNSAFE_MARKUP.search(pairs[label])
+    }
+    shared = [label for label in labels if label not in parsed]
+    if not shared:
+        return parsed
+
+    doc = "".join(f"<{_VALUE_TAG}>{pairs[label]}</{_VALUE_TAG}>" for label in shared)
+    nodes = BeautifulSoup(doc, "html.parser").find_all(_VALUE_TAG, recursive=False)
+    if len(nodes) != len(shared):
+        nodes = [BeautifulSoup(pairs[label], "html.parser") for label in shared]
+    parsed.update(zip(shared, nodes))
+    return parsed
+
+
+def _extract_label_text(raw_html: str, label: str, soup=None) -> str | None:
+    """
+    Extract the text content after a specific label span in raw HTML.
+
+    Values with markup are read from ``soup``, their pre-parsed node from
+    `_parse_markup_values`, or parsed here if it is not given; values without
+    markup (what `scrape_page` stores) are returned as stripped text without
+    any parsing.
+    """
+    if soup is None:
+        if not _has_markup(raw_html):
+            return raw_html.strip() or None
+        soup = BeautifulSoup(raw_html, "html.parser")
     span_label = soup.find("span", string=lambda t: t and t.strip() == label)
     if span_label and span_label.next_sibling:
         return span_label.next_sibling.get_text(strip=True)
-    return soup.get_text(strip=True) if soup.get_text(strip=True) else None
+    return soup.get_text(strip=True) or None
 
 
 def _build_record(pairs: dict) -> dict:
     """Extract raw fields into a normalized record dictionary."""
     record = {}
+    parsed = _parse_markup_values(pairs)
     for field, labels in FIELD_MAP.items():
         value = None
         for label in labels:
             raw_html = pairs.get(label)
             if raw_html and raw_html.strip():
-                value = _extract_label_text(raw_html, label)
+                value = _extract_label_text(raw_html, label, parsed.get(label))
                 if value:
                     break
         record[field] = value
@@ -109,18 +185,32 @@ def _apply_decision_logic(record: dict, pairs: dict) -> None:
         record["acceptance_date"] = None
 
 
-def clean_data(raw_entries, target_count):
+def _clean_entry(entry: dict) -> dict:
+    """Clean a single raw entry (module-level so worker processes can run it)."""
+    pairs = entry["data"]
+    record = _build_record(pairs)
+    record["program"] = _combine_program_and_university(record)
+    record["URL"] = entry.get("url")
+    _apply_decision_logic(record, pairs)
+    return record
+
+
+def clean_data(raw_entries, target_count, workers=None):
     """
     Clean and normalize raw admissions data into structured records.
 
     Parameters
     ----------
-    raw_entries : list of dict
-        A list of raw scraped admission entries. Each entry has a ``data`` field
+    raw_entries : iterable of dict
+        Raw scraped admission entries. Each entry has a ``data`` field
         containing HTML snippets keyed by labels.
-    target_count : int
-        Maximum number of cleaned records to return. If more entries exist,
-        the list will be trimmed.
+    target_count : int or None
+        Maximum number of cleaned records to return. Entries past this count
+        are never cleaned; None cleans every entry.
+    workers : int, optional
+        Number of worker processes. If greater than 1, entries are sharded
+        across a ``ProcessPoolExecutor`` in chunks; output order is preserved.
+        Defaults to None (clean in the current process).
 
     Returns
     -------
@@ -129,26 +219,70 @@ def clean_data(raw_entries, target_count):
         (program, university, comments, status, GPA, GRE, etc.), along with
         acceptance/rejection dates parsed from notifications.
     """
-    cleaned = []
+    # Each entry yields exactly one record, so stop reading at target_count
+    # (None keeps every entry)
+    limit = None if target_count is None else max(target_count, 0)
+    entries = list(islice(raw_entries, limit))
+
+    if not workers or workers <= 1 or len(entries) < 2:
+        return [_clean_entry(entry) for entry in entries]
+
+    chunksize = max(1, len(entries) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_clean_entry, entries, chunksize=chunksize))
+
 
-    for entry in raw_entries:
-        pairs = entry["data"]
-        record = _build_record(pairs)
-        record["program"] = _combine_program_and_university(record)
-        record["URL"] = entry.get("url")
-        _apply_decision_logic(record, pairs)
-        cleaned.append(record)
+def _standardize_with_service(input_file: str, output_file: str) -> bool:
+    """
+    Standardize the rows of ``input_file`` with the LLM service.
 
-    return cleaned[:target_count]
+    Writes the returned rows to ``output_file`` as JSONL. Returns False if
+    the service is disabled, not running, times out, returns a malformed
+    response (including a different number of rows than it was sent), or
+    fails partway, so the caller can fall back to the
+    subprocess (which rewrites ``output_file``).
+    """
+    if not LLM_SERVICE_URL:
+        return False
+    url = LLM_SERVICE_URL.rstrip("/")
+    try:
+        if llm_http.request("GET", url + "/", timeout=2.0).status != 200:
+            return False
+
+        with open(input_file, encoding="utf-8") as f:
+            payload = json.load(f)
+        rows = payload if isinstance(payload, list) else payload.get("rows") or []
+
+        with open(output_file, "w", encoding="utf-8") as out:
+            for start in range(0, len(rows), LLM_SERVICE_CHUNK):
+                chunk = rows[start : start + LLM_SERVICE_CHUNK]
+                response = llm_http.request(
+                    "POST",
+                    url + "/standardize",
+                    json={"rows": chunk},
+                    timeout=urllib3.Timeout(connect=2.0, read=LLM_SERVICE_TIMEOUT),
+                )
+                if response.status != 200:
+                    return False
+                cleaned = response.json()["rows"]
+                if len(cleaned) != len(chunk):  # rows were dropped or added
+                    return False
+                for row in cleaned:
+                    out.write(json.dumps(row, ensure_ascii=False) + "\n")
+    except (urllib3.exceptions.HTTPError, ValueError, KeyError, TypeError):
+        return False
+    return True
 
 
 def clean_with_llm(input_file: str, output_file: str):
     """
-    Run an LLM process on an input JSONL file and return the cleaned results.
+    Run the LLM standardizer on an input JSON file and return the cleaned results.
 
-    This function calls an external LLM script (`src/llm_hosting/app.py`)
-    to process entries from a JSONL file, writes the cleaned output to another
-    JSONL file, and then reads the results back into Python objects.
+    Rows are sent to the standardizer service at `LLM_SERVICE_URL`, which
+    keeps the model loaded between calls. If it is not running, this function
+    calls the LLM script (`src/llm_hosting/app.py`) in a subprocess instead,
+    which loads the model for this one file. Either way the cleaned output
+    is written to a JSONL file and then read back into Python objects.
 
     Parameters
     ----------
@@ -169,21 +303,24 @@ def clean_with_llm(input_file: str, output_file: str):
         If the LLM subprocess fails and returns a non-zero exit code.
     """
     print(f"Cleaning entries with LLM. Input: {input_file}, Output: {output_file}")
-    cmd = [
-        "python",
-        "src/llm_hosting/app.py",
-        "--file",
-        input_file,
-        "--out",
-        output_file,
-    ]
+    if _standardize_with_service(input_file, output_file):
+        print(f"Finished cleaning with LLM service. Output saved to: {output_file}")
+    else:
+        cmd = [
+            "python",
+            "src/llm_hosting/app.py",
+            "--file",
+            input_file,
+            "--out",
+            output_file,
+        ]
 
-    result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
 
-    if result.returncode != 0:
-        raise RuntimeError(f"LLM failed: {result.stderr}")
+        if result.returncode != 0:
+            raise RuntimeError(f"LLM failed: {result.stderr}")
 
-    print(f"Finished cleaning with LLM. Output saved to: {output_file}")
+        print(f"Finished cleaning with LLM. Output saved to: {output_file}")
 
     with open(output_file, encoding="utf-8") as f:
         cleaned_data = [json.loads(line) for line in f]
@@ -194,3 +331,8 @@ def clean_with_llm(input_file: str, output_file: str):
 def parse_decision_date_for_test(s: str):
     """Public wrapper to test the private _parse_decision_date."""
     return _parse_decision_date(s)
+
+
+def extract_label_text_for_test(raw_html: str, label: str, soup=None):
+    """Public wrapper to test the private _extract_label_text."""
+    return _extract_label_text(raw_html, label, soup)
@@ -0,0 +1,92 @@
+"""
+Instrumented urllib3 connection pooling for the scraper.
+
+`InstrumentedPoolManager` is a ``urllib3.PoolManager`` whose per-host pools
+count how connections are obtained:
+
+- ``created``: requests that open a connection (each a TCP + TLS
+  handshake): a new one, or a pooled one the server has closed.
+- ``reused``: requests served by an idle kept-alive connection that is
+  still open, counted as the pool hands it out.
+- ``waited``: requests that found every connection busy and blocked until
+  one was returned (only with ``block=True``).
+
+Size ``maxsize`` to the number of concurrent workers, so each worker keeps a
+connection alive instead of opening and discarding throwaway ones.
+"""
+
+#!/usr/bin/env python3
+import threading
+
+import urllib3
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class _CountingPoolMixin:  # pylint: disable=too-few-public-methods
+    """Count created, reused, and waited-for connections into ``self.stats``."""
+
+    # Shared with the owning manager by InstrumentedPoolManager._new_pool
+    stats = {"requests": 0, "created": 0, "reused": 0, "waited": 0}
+    stats_lock = threading.Lock()
+
+    def _get_conn(self, timeout=None):
+        waited = self.pool is not None and self.pool.empty()
+        conn = super()._get_conn(timeout)
+        # New connections, and pooled ones the server dropped (closed by
+        # urllib3 above), connect on first use
+        reused = conn.is_connected
+        with self.stats_lock:
+            self.stats["requests"] += 1
+            self.stats["reused" if reused else "created"] += 1
+            self.stats["waited"] += waited
+        return conn
+
+
+class _CountingHTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _CountingHTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class InstrumentedPoolManager(urllib3.PoolManager):
+    """
+    ``urllib3.PoolManager`` that reports connection reuse statistics.
+
+    Parameters
+    ----------
+    maxsize : int
+        Connections kept alive per host; match the worker thread count.
+    block : bool, optional
+        If True (default), requests wait for a free connection instead of
+        opening one that is discarded afterwards.
+    **kwargs
+        Passed to ``urllib3.PoolManager``.
+    """
+
+    def __init__(self, maxsize, block=True, **kwargs):
+        super().__init__(maxsize=maxsize, block=block, **kwargs)
+        self.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+        self._stats = {"requests": 0, "created": 0, "reused": 0, "waited": 0}
+        self._stats_lock = threading.Lock()
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super()._new_pool(scheme, host, port, request_context)
+        pool.stats = self._stats
+        pool.stats_lock = self._stats_lock
+        return pool
+
+    def stats(self) -> dict:
+        """
+        Return connection counters across all hosts.
+
+        ``requests`` counts every connection checkout (one per request sent,
+        including urllib3's own retries and redirects); each is either
+        ``created`` or ``reused``.
+        """
+        with self._stats_lock:
+            return dict(self._stats)
@@ -0,0 +1,54 @@
+"""
+Reader for append-only JSON Lines logs.
+
+The checkpoint log (`src.checkpoint`) and the archive index (`src.archive`)
+are written one JSON record per line. A crash mid-write can leave a torn
+final line, i.e. one without its newline (even if it happens to parse);
+`read_records` cuts it off, so the next record appended to the log starts
+on a line of its own. A corrupt line inside the log is skipped, and the
+records after it are still read.
+"""
+
+#!/usr/bin/env python3
+import json
+import os
+
+
+def read_records(path, start=0):
+    """
+    Yield each record of a JSON Lines log, dropping torn and corrupt lines.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        Path to the log. A missing file yields nothing.
+    start : int, optional
+        Byte offset of a line start to read from (default: the beginning).
+
+    Yields
+    ------
+    dict
+        The decoded records, in file order; complete lines that are not
+        valid JSON are skipped. Once the records are exhausted, a final
+        line without a newline is truncated from the file.
+    """
+    if not os.path.exists(path):
+        return
+
+    good_offset = start
+    with open(path, "rb") as f:
+        f.seek(start)
+        for line in f:
+            if not line.endswith(b"\n"):
+                break  # torn final write
+            good_offset += len(line)
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            yield record
+
+    # Cut off a torn write so new records are not appended onto it
+    if good_offset < os.path.getsize(path):
+        with open(path, "r+b") as f:
+            f.truncate(good_offset)
@@ -5,17 +5,24 @@ This module handles reading JSONL files of scraped/cleaned data and loading
 them into a PostgreSQL database. It includes:
 
 - `load_jsonl`: Read JSONL files into Python lists of dictionaries.
+- `iter_jsonl`: Lazily yield dictionaries from a JSONL file.
+- `iter_chunks`: Group an iterable of rows into fixed-size lists.
 - `create_table`: Drop and recreate the `applicants` table.
 - `insert_data`: Insert applicant records into the database.
+- `bulk_insert_data`: Stream applicant records through ``COPY`` into a
+  staging table and merge them into the database in one statement.
 - `load_data_to_db`: Main entry point to load a JSONL dataset into Postgres,
-  supporting both initial full reloads and incremental appends.
+  supporting both initial full reloads and incremental appends. Files are
+  streamed in fixed-size chunks so memory stays bounded for large dumps.
 """
 
 import argparse
 #!/usr/bin/env python3
 import json
+from itertools import chain, islice
 
 import psycopg
+from psycopg import sql
 
 # Dictionary to map jsonl keys to the column names in the db
 KEY_MAP = {
@@ -35,6 +42,17 @@ KEY_MAP = {
     "llm-generated-university": "llm_generated_university",
 }
 
+# Number of rows read, inserted, and committed at a time by load_data_to_db
+CHUNK_SIZE = 5000
+
+# Ordered list of db columns used by the bulk COPY loader
+COPY_COLUMNS = list(KEY_MAP.values())
+
+
+def _map_row(row: dict) -> dict:
+    """Map JSONL keys of a single row to database column names."""
+    return {KEY_MAP[k]: v for k, v in row.items() if k in KEY_MAP}
+
 
 def load_jsonl(filename: str):
     """
@@ -50,8 +68,55 @@ def load_jsonl(filename: str):
     list of dict
         A list of dictionaries, one per line of JSON in the file.
     """
+    return list(iter_jsonl(filename))
+
+
+def iter_jsonl(filename: str):
+    """
+    Lazily read data from a JSONL (JSON Lines) file.
+
+    Parameters
+    ----------
+    filename : str
+        Path to the JSONL file.
+
+    Yields
+    ------
+    dict
+        One dictionary per non-empty line of JSON in the file.
+    """
     with open(filename, "r", encoding="utf-8") as f:
-        return [json.loads(line) for line in f if line.strip()]
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_chunks(rows, size: int):
+    """
+    Group an iterable of rows into lists of at most ``size`` rows.
+
+    Parameters
+    ----------
+    rows : iterable of dict
+        Rows to group, consumed lazily.
+    size : int
+        Maximum number of rows per chunk; at least 1.
+
+    Yields
+    ------
+    list of dict
+        Consecutive chunks of rows; only the last may be shorter than ``size``.
+
+    Raises
+    ------
+    ValueError
+        If ``size`` is less than 1 (raised when iteration starts).
+    """
+    if size < 1:
+        raise ValueError(f"Chunk size must be at least 1, got {size}")
+    rows = iter(rows)
+    while chunk := list(islice(rows, size)):
+        yield chunk
 
 
 def create_table(conn):
@@ -113,26 +178,89 @@ def insert_data(conn, data):
     """
     with conn.cursor() as cur:
         for row in data:
-            mapped_row = {KEY_MAP[k]: v for k, v in row.items() if k in KEY_MAP}
+            mapped_row = _map_row(row)
 
             if not mapped_row or "url" not in mapped_row:
                 continue  # skip rows without a URL
 
             columns = ", ".join(mapped_row.keys())
             placeholders = ", ".join(f"%({k})s" for k in mapped_row.keys())
-            sql = f"""
+            insert_sql = f"""
                 INSERT INTO applicants ({columns})
                 VALUES ({placeholders})
                 ON CONFLICT (url) DO NOTHING;
             """
-            cur.execute(sql, mapped_row)
+            cur.execute(insert_sql, mapped_row)
+        conn.commit()
+
+
+def bulk_insert_data(conn, data):
+    """
+    Bulk insert rows into the PostgreSQL `applicants` table using ``COPY``.
+
+    Rows are streamed through ``COPY ... FROM STDIN`` into a temporary staging
+    table and then merged into `applicants` with a single
+    ``INSERT ... SELECT ... ON CONFLICT (url) DO NOTHING``.
+
+    Parameters
+    ----------
+    conn : psycopg.Connection
+        A live PostgreSQL connection.
+    data : iterable of dict
+        Dictionaries with applicant data. Keys correspond to JSONL fields and
+        will be mapped to database columns. Rows without a URL are skipped.
+
+    Returns
+    -------
+    None
+        Commits inserted rows into the database.
+    """
+    tbl = sql.Identifier("applicants")
+    staging = sql.Identifier("applicants_staging")
+    cols = sql.SQL(", ").join(sql.Identifier(c) for c in COPY_COLUMNS)
+
+    with conn.cursor() as cur:
+        cur.execute(
+            sql.SQL(
+                "CREATE TEMP TABLE {staging} ON COMMIT DROP AS "
+                "SELECT {cols} FROM {tbl} WITH NO DATA"
+            ).format(staging=staging, cols=cols, tbl=tbl)
+        )
+
+        with cur.copy(
+            sql.SQL("COPY {staging} ({cols}) FROM STDIN").format(
+                staging=staging, cols=cols
+            )
+        ) as copy:
+            for row in data:
+                mapped_row = _map_row(row)
+                if "url" not in mapped_row:
+                    continue  # skip rows without a URL
+                copy.write_row([mapped_row.get(c) for c in COPY_COLUMNS])
+
+        cur.execute(
+            sql.SQL(
+                "INSERT INTO {tbl} ({cols}) SELECT {cols} FROM {staging} "
+                "ON CONFLICT (url) DO NOTHING"
+            ).format(tbl=tbl, cols=cols, staging=staging)
+        )
         conn.commit()
 
 
-def load_data_to_db(file_path, initial_load=False, connection_string=None):
+def load_data_to_db(
+    file_path,
+    initial_load=False,
+    connection_string=None,
+    bulk=False,
+    chunk_size=CHUNK_SIZE,
+):
     """
     Load applicant data from a JSONL file into PostgreSQL.
 
+    The file is streamed and inserted ``chunk_size`` rows at a time, with a
+    commit and a progress message after each chunk, so peak memory does not
+    grow with file size.
+
     Parameters
     ----------
     file_path : str
@@ -142,6 +270,11 @@ def load_data_to_db(file_path, initial_load=False, connection_string=None):
     connection_string : str, optional
         PostgreSQL connection string. Defaults to
         ``"dbname=thegradcafe user=postgres host=localhost port=5432"``.
+    bulk : bool, optional
+        If True, load rows with `bulk_insert_data` (``COPY`` into a staging
+        table) instead of one ``INSERT`` per row (default False).
+    chunk_size : int, optional
+        Number of rows read and inserted per chunk (default `CHUNK_SIZE`).
 
     Returns
     -------
@@ -152,9 +285,10 @@ def load_data_to_db(file_path, initial_load=False, connection_string=None):
         connection_string or "dbname=thegradcafe user=postgres host=localhost port=5432"
     )
 
-    # Initialize the data from the JSONL file
-    data = load_jsonl(file_path)
-    if not data:
+    # Stream the JSONL file in chunks; peek at the first before connecting
+    chunks = iter_chunks(iter_jsonl(file_path), chunk_size)
+    first_chunk = next(chunks, None)
+    if not first_chunk:
         print(f"No data found in {file_path}")
         return
 
@@ -165,8 +299,13 @@ def load_data_to_db(file_path, initial_load=False, connection_string=None):
         else:
             print("Appending new entries to existing table...")
 
-        insert_data(conn, data)
-        print(f"Loaded {len(data)} entries into the applicants table.")
+        insert = bulk_insert_data if bulk else insert_data
+        total = 0
+        for chunk_num, chunk in enumerate(chain([first_chunk], chunks), start=1):
+            insert(conn, chunk)
+            total += len(chunk)
+            print(f"Chunk {chunk_num}: loaded {total} entries so far...")
+        print(f"Loaded {total} entries into the applicants table.")
 
 
 if __name__ == "__main__":
@@ -177,6 +316,24 @@ if __name__ == "__main__":
     parser.add_argument(
         "--initial", action="store_true", help="Drop table and reload all data"
     )
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="Load rows with COPY into a staging table instead of row-by-row",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=CHUNK_SIZE,
+        help=f"Rows read and inserted per chunk (default {CHUNK_SIZE})",
+    )
     args = parser.parse_args()
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
 
-    load_data_to_db(args.file, initial_load=args.initial)
+    load_data_to_db(
+        args.file,
+        initial_load=args.initial,
+        bulk=args.bulk,
+        chunk_size=args.chunk_size,
+    )
@@ -0,0 +1,371 @@
+"""
+HTML parsing for The Grad Cafe survey listing and result pages.
+
+- `set_parser_backend` / `get_parser_backend`: Choose the parser
+  (BeautifulSoup with ``html.parser`` or ``lxml``, or direct lxml XPath via
+  ``lxml-xpath``); defaults to the ``SCRAPE_PARSER`` environment variable.
+- `parse_survey_html`: Survey listing rows to entry dictionaries, including
+  the result-page labels each row already shows (``listing``).
+- `parse_result_html`: A result page's ``<dl>`` label/value pairs.
+
+Every backend returns the same results; `src.scrape` fetches the pages.
+"""
+
+#!/usr/bin/env python3
+import os
+import re
+from datetime import datetime
+from bs4 import BeautifulSoup, FeatureNotFound
+
+try:
+    from lxml import html as lxml_html
+except ImportError:  # lxml is optional; the lxml backends are then unavailable
+    lxml_html = None  # pylint: disable=invalid-name
+
+# Supported parser backends, slowest to fastest. The first two are
+# BeautifulSoup parsers; "lxml-xpath" bypasses BeautifulSoup entirely.
+PARSER_BACKENDS = ("html.parser", "lxml", "lxml-xpath")
+
+# XPath helpers for the "lxml-xpath" backend (text mirrors get_text(strip=True))
+_XPATH_TEXT = ".//text()[not(ancestor::script) and not(ancestor::style)]"
+_XPATH_RESULT_LINK = ".//a[starts-with(@href, '/result/')]"
+_XPATH_BADGE = (
+    ".//div[contains(concat(' ', normalize-space(@class), ' '), ' tw-inline-flex ')]"
+)
+
+# Active parser stored in a dict (avoids `global`)
+_parser_state = {"backend": "html.parser"}
+
+TERM_PATTERN = re.compile(
+    r"^(Fall|Spring|Summer|Winter|F|S|Su|W)\s*\d{2,4}$", re.IGNORECASE
+)
+
+# Listing decision badge, e.g. "Accepted on 27 Sep"
+DECISION_PATTERN = re.compile(
+    r"^(?P<decision>.+?)\s+on\s+(?P<day>\d{1,2})\s+(?P<month>[A-Za-z]{3})"
+)
+
+# Listing badges for the degree's country of origin
+COUNTRY_BADGES = ("American", "International")
+
+
+def set_parser_backend(backend: str) -> None:
+    """
+    Select the parser used for survey and result pages.
+
+    Parameters
+    ----------
+    backend : str
+        One of `PARSER_BACKENDS`.
+
+    Raises
+    ------
+    ValueError
+        If the backend is unknown or its library is not installed.
+    """
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend: {backend!r}")
+    try:
+        BeautifulSoup("", "lxml" if backend == "lxml-xpath" else backend)
+    except FeatureNotFound as e:
+        raise ValueError(f"Parser backend {backend!r} is not installed") from e
+    _parser_state["backend"] = backend
+
+
+def get_parser_backend() -> str:
+    """Return the name of the active parser backend."""
+    return _parser_state["backend"]
+
+
+set_parser_backend(os.getenv("SCRAPE_PARSER", "html.parser"))
+
+
+def _is_result_link(href) -> bool:
+    """Match links to individual result pages."""
+    return bool(href) and href.startswith("/result/")
+
+
+def _third_cell(row):
+    """Return the row's third cell if it is a ``td`` (``td:nth-child(3)``)."""
+    cells = row.find_all(True, recursive=False)
+    return cells[2] if len(cells) > 2 and cells[2].name == "td" else None
+
+
+def _lxml_text(element) -> str:
+    """lxml equivalent of BeautifulSoup's ``get_text(strip=True)``."""
+    return "".join(t.strip() for t in element.xpath(_XPATH_TEXT))
+
+
+def _parse_result_id(href: str):
+    """Extract the numeric result ID from a ``/result/<id>`` link."""
+    try:
+        return int(href.split("/result/")[1].split("#")[0])
+    except (ValueError, AttributeError, IndexError):
+        return None
+
+
+def _parse_badge_texts(texts, term_pattern):
+    """Classify badge texts into term and GRE fields."""
+    record_data = {}
+    for text in texts:
+        if term_pattern.match(text):
+            record_data["term"] = text
+        elif text.startswith("GRE ") and not text.startswith(("GRE V", "GRE AW")):
+            record_data["GRE Score"] = text.replace("GRE", "").strip()
+        elif text.startswith("GRE V"):
+            record_data["GRE V Score"] = text.replace("GRE V", "").strip()
+        elif text.startswith("GRE AW"):
+            record_data["GRE AW"] = text.replace("GRE AW", "").strip()
+    return record_data
+
+
+def _parse_entry_id_and_date(link_tag, date_tag):
+    """Extract entry ID and date safely from HTML tags."""
+    result_id = _parse_result_id(link_tag["href"])
+    if result_id is None:
+        return None, None
+    date_added = date_tag.get_text(strip=True) if date_tag else None
+    return result_id, date_added
+
+
+def _notification_from_listing(day, month, date_added):
+    """
+    Rebuild a result-page style ``on DD/MM/YYYY`` notification.
+
+    The listing shows only day and month; the year is the one the entry was
+    added in, or the year before if that date would fall after it.
+    """
+    try:
+        added = datetime.strptime(date_added or "", "%B %d, %Y")
+        decided = datetime.strptime(f"{day} {month} {added.year}", "%d %b %Y")
+    except ValueError:
+        return f"on {day} {month}"
+    if decided > added:
+        decided = decided.replace(year=added.year - 1)
+    return f"on {decided:%d/%m/%Y}"
+
+
+def _listing_pairs(cell_texts, program_texts, badge_texts, notes, date_added):
+    """
+    Map a listing row's texts onto result-page labels.
+
+    Parameters
+    ----------
+    cell_texts : list of str
+        Stripped text of the row's cells (school, program, date, decision).
+    program_texts : list of str
+        Text of the program cell's spans: program, then degree type.
+    badge_texts : list of str
+        Text of the badges below the row.
+    notes : str or None
+        The row's comment, if any.
+    date_added : str or None
+        The entry's date added, used to date the decision.
+
+    Returns
+    -------
+    dict
+        Result-page labels (``Institution``, ``Program``, ...) found in the row.
+    """
+    pairs = {}
+    if cell_texts and cell_texts[0]:
+        pairs["Institution"] = cell_texts[0]
+    if program_texts and program_texts[0]:
+        pairs["Program"] = program_texts[0]
+    if len(program_texts) > 1 and program_texts[-1]:
+        pairs["Degree Type"] = program_texts[-1]
+
+    decision = cell_texts[3] if len(cell_texts) > 3 else ""
+    match = DECISION_PATTERN.match(decision)
+    if match:
+        pairs["Decision"] = match["decision"]
+        pairs["Notification"] = _notification_from_listing(
+            match["day"], match["month"], date_added
+        )
+    elif decision:
+        pairs["Decision"] = decision
+
+    for text in badge_texts:
+        if text in COUNTRY_BADGES:
+            pairs["Degree's Country of Origin"] = text
+        elif text.startswith("GPA "):
+            pairs["Undergrad GPA"] = text[4:].strip()
+    if notes:
+        pairs["Notes"] = notes
+    return pairs
+
+
+
+def _notes_row(rows, i):
+    """Return the comment row for entry row ``i`` (one of the next two rows)."""
+    for row in rows[i + 1 : i + 3]:
+        if row is not None and row.find("a", href=_is_result_link):
+            return None
+        if row is not None and row.find("p"):
+            return row
+    return None
+
+
+
+def parse_survey_html(html) -> list:
+    """
+    Parse survey listing HTML into entry dictionaries.
+
+    Parameters
+    ----------
+    html : bytes or str
+        Raw survey page HTML.
+
+    Returns
+    -------
+    list of dict
+        Entries with ``id``, ``date_added`` and any term/GRE badges.
+    """
+    if get_parser_backend() == "lxml-xpath":
+        return _parse_survey_lxml(html)
+
+    soup = BeautifulSoup(html, get_parser_backend())
+    entries = []
+    rows = soup.find_all("tr")
+
+    i = 0
+    while i < len(rows):
+        row = rows[i]
+        link_tag = row.find("a", href=_is_result_link)
+        if not link_tag:
+            i += 1
+            continue
+
+        badges_row = rows[i + 1] if i + 1 < len(rows) else None
+        badge_texts = (
+            [
+                div.get_text(strip=True)
+                for div in badges_row.find_all("div", class_="tw-inline-flex")
+            ]
+            if badges_row
+            else []
+        )
+        record_data = _parse_badge_texts(badge_texts, TERM_PATTERN)
+
+        result_id, date_added = _parse_entry_id_and_date(link_tag, _third_cell(row))
+        if result_id:
+            entry = {"id": result_id, "date_added": date_added}
+            entry.update(record_data)
+            cells = row.find_all("td", recursive=False)
+            notes_row = _notes_row(rows, i)
+            entry["listing"] = _listing_pairs(
+                [c.get_text(strip=True) for c in cells],
+                (
+                    [span.get_text(strip=True) for span in cells[1].find_all("span")]
+                    if len(cells) > 1
+                    else []
+                ),
+                badge_texts,
+                notes_row.find("p").get_text(strip=True) if notes_row else None,
+                date_added,
+            )
+            entries.append(entry)
+
+        i += 2
+
+    return entries
+
+
+
+def parse_result_html(html) -> dict:
+    """
+    Parse the ``<dl>`` label/value pairs of a result detail page.
+
+    Parameters
+    ----------
+    html : bytes or str
+        Raw result page HTML.
+
+    Returns
+    -------
+    dict
+        Mapping of ``dt`` label text to ``dd`` value text.
+    """
+    if get_parser_backend() == "lxml-xpath":
+        return _parse_result_lxml(html)
+
+    soup = BeautifulSoup(html, get_parser_backend())
+    pairs = {}
+    for dl in soup.find_all("dl"):
+        for block in dl.find_all("div", recursive=False):
+            dt = block.find("dt")
+            dd = block.find("dd")
+            if dt and dd:
+                pairs[dt.get_text(strip=True)] = dd.get_text(strip=True)
+    return pairs
+
+
+def _lxml_document(html):
+    """Parse HTML (bytes are decoded as UTF-8) into an lxml tree, or None if empty."""
+    if isinstance(html, bytes):
+        html = html.decode("utf-8", errors="replace")
+    return lxml_html.fromstring(html) if html.strip() else None
+
+
+def _parse_survey_lxml(html) -> list:
+    """`parse_survey_html` implemented with lxml XPath instead of BeautifulSoup."""
+    doc = _lxml_document(html)
+    rows = list(doc.iter("tr")) if doc is not None else []
+    entries = []
+
+    i = 0
+    while i < len(rows):
+        links = rows[i].xpath(_XPATH_RESULT_LINK)
+        if not links:
+            i += 1
+            continue
+
+        badge_texts = []
+        if i + 1 < len(rows):
+            badge_texts = [_lxml_text(b) for b in rows[i + 1].xpath(_XPATH_BADGE)]
+        record_data = _parse_badge_texts(badge_texts, TERM_PATTERN)
+
+        result_id = _parse_result_id(links[0].get("href"))
+        if result_id:
+            cells = [c for c in rows[i] if isinstance(c.tag, str)]
+            date_tag = cells[2] if len(cells) > 2 and cells[2].tag == "td" else None
+            date_added = _lxml_text(date_tag) if date_tag is not None else None
+            entry = {"id": result_id, "date_added": date_added}
+            entry.update(record_data)
+            tds = [c for c in cells if c.tag == "td"]
+            notes = _lxml_notes(rows, i)
+            entry["listing"] = _listing_pairs(
+                [_lxml_text(c) for c in tds],
+                [_lxml_text(s) for s in tds[1].iter("span")] if len(tds) > 1 else [],
+                badge_texts,
+                notes,
+                date_added,
+            )
+            entries.append(entry)
+
+        i += 2
+
+    return entries
+
+
+def _lxml_notes(rows, i):
+    """lxml version of `_notes_row`, returning the comment text."""
+    for row in rows[i + 1 : i + 3]:
+        if row.xpath(_XPATH_RESULT_LINK):
+            return None
+        paragraphs = list(row.iter("p"))
+        if paragraphs:
+            return _lxml_text(paragraphs[0])
+    return None
+
+
+def _parse_result_lxml(html) -> dict:
+    """`parse_result_html` implemented with lxml XPath instead of BeautifulSoup."""
+    doc = _lxml_document(html)
+    pairs = {}
+    for block in doc.xpath("//dl/div") if doc is not None else []:
+        dt = block.xpath(".//dt")
+        dd = block.xpath(".//dd")
+        if dt and dd:
+            pairs[_lxml_text(dt[0])] = _lxml_text(dd[0])
+    return pairs
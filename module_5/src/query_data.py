@@ -9,6 +9,7 @@ Functions
 - _get_questions_and_queries: returns list of (question, composed SQL)
 - run_queries: executes queries and returns results as dicts
 - get_max_id: fetch the maximum applicant result ID from the DB
+- get_result_ids: fetch every applicant result ID (seeds the scraper's seen-ID set)
 - main: CLI entry point that prints results to stdout
 """
 
@@ -164,6 +165,22 @@ def get_max_id() -> int:
         conn.close()
 
 
+def get_result_ids() -> List[int]:
+    """Get every applicant result ID in the database."""
+    conn: Connection = get_db_connection()  # type: ignore
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                sql.SQL(
+                    "SELECT CAST(split_part(url, '/result/', 2) AS INTEGER) "
+                    "FROM {tbl} WHERE url ~ '/result/[0-9]+$'"
+                ).format(tbl=sql.Identifier("applicants"))
+            )
+            return [row[0] for row in cur.fetchall()]
+    finally:
+        conn.close()
+
+
 def main() -> None:
     """Run queries and print them to stdout."""
     for item in run_queries():
@@ -0,0 +1,118 @@
+"""
+Durable queue of survey entries whose result page could not be fetched.
+
+Each queued entry keeps its attempt count and the time it next becomes
+eligible. The wait doubles after every failed attempt, from ``base_delay``
+up to ``max_delay``. An entry that fails ``max_attempts`` times is given up
+on (e.g. a deleted post that keeps returning 404), so the queue cannot grow
+without bound. The queue is a JSON file, replaced atomically on every save,
+so misses survive restarts and are retried by later scrapes.
+"""
+
+#!/usr/bin/env python3
+import json
+import os
+import time
+from pathlib import Path
+
+# Wait before the first retry, and the cap on the doubling wait (seconds)
+BASE_DELAY = 60.0
+MAX_DELAY = 24 * 60 * 60.0
+
+# Failed attempts after which an entry is dropped from the queue
+MAX_ATTEMPTS = 8
+
+
+class RetryQueue:
+    """
+    Failed result fetches, keyed by result ID.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        The queue file; a missing file is an empty queue.
+    base_delay : float, optional
+        Seconds before the first retry.
+    max_delay : float, optional
+        Longest wait between retries.
+    max_attempts : int, optional
+        Failed attempts after which an entry is dropped.
+    """
+
+    def __init__(
+        self,
+        path,
+        base_delay=BASE_DELAY,
+        max_delay=MAX_DELAY,
+        max_attempts=MAX_ATTEMPTS,
+    ):
+        self.path = Path(path)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_attempts = max_attempts
+        self._items = {}
+        if self.path.exists():
+            with open(self.path, encoding="utf-8") as f:
+                self._items = {int(k): v for k, v in json.load(f).items()}
+
+    def __contains__(self, result_id):
+        return result_id in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+    def attempts(self, result_id) -> int:
+        """Return how many times the entry has failed (0 if not queued)."""
+        item = self._items.get(result_id)
+        return item["attempts"] if item else 0
+
+    def due(self, now=None) -> list:
+        """Return the queued survey entries eligible for a retry, oldest first."""
+        now = time.time() if now is None else now
+        items = sorted(self._items.values(), key=lambda item: item["next_attempt"])
+        return [item["entry"] for item in items if item["next_attempt"] <= now]
+
+    def record_failure(self, entry: dict, now=None) -> None:
+        """
+        Queue ``entry`` (or bump its attempts) and schedule its next retry.
+
+        An entry failing for the ``max_attempts``-th time is dropped instead.
+        """
+        now = time.time() if now is None else now
+        attempts = self.attempts(entry["id"]) + 1
+        if attempts >= self.max_attempts:
+            self._items.pop(entry["id"], None)
+            return
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempts - 1))
+        self._items[entry["id"]] = {
+            "entry": entry,
+            "attempts": attempts,
+            "next_attempt": now + delay,
+        }
+
+    def record_success(self, result_id) -> None:
+        """Drop an entry whose result page has now been fetched."""
+        self._items.pop(result_id, None)
+
+    def update(self, results, now=None) -> None:
+        """
+        Apply a finished scrape's detail fetches and save the queue.
+
+        ``results`` are ``(entry, record)`` pairs: entries with a record are
+        dropped from the queue, and entries whose record is None are queued
+        (see `record_failure`).
+        """
+        for entry, record in results:
+            if record:
+                self.record_success(record["id"])
+            else:
+                self.record_failure(entry, now)
+        self.save()
+
+    def save(self) -> None:
+        """Write the queue to disk atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({str(k): v for k, v in self._items.items()}, f)
+        os.replace(tmp_path, self.path)
@@ -15,6 +15,7 @@ Usage:
 from pathlib import Path
 
 from src.app import create_app
+from src.app.pages import reset_seen_ids
 from src.load_data import load_data_to_db
 
 # Path to jsonl data from module 2
@@ -24,4 +25,5 @@ app = create_app()  # create Flask app instance
 
 if __name__ == "__main__":
     load_data_to_db(FILE_PATH, initial_load=True)
+    reset_seen_ids()  # the table was recreated; reseed from it on next scrape
     app.run(debug=True, host="0.0.0.0", port=8080)
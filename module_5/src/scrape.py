@@ -5,46 +5,200 @@ This module is responsible for retrieving admissions data from
 https://www.thegradcafe.com/survey. It includes:
 
 - `scrape_survey_page`: Fetch and parse survey listing pages.
-- `scrape_page`: Fetch and parse individual result detail pages.
+- `scrape_page`: Fetch and parse individual result detail pages; with
+  ``SCRAPE_STREAM_DETAILS=1`` only the page up to its ``<dl>`` block is read.
+- `build_listing_record`: Build the same record from a survey listing row
+  alone (listing-only mode, ``SCRAPE_LISTING_ONLY``).
+- Pages are parsed by `src.parsing` (its HTML parser backend defaults to the
+  ``SCRAPE_PARSER`` environment variable), and fetches are recorded into or
+  replayed from the archive in `src.archive` set by the ``SCRAPE_ARCHIVE``
+  and ``SCRAPE_ARCHIVE_MODE`` variables.
 - `scrape_new_entries`: Orchestrate scraping in batches, filter out
-  already-seen entries, and return cleaned dictionaries.
+  already-seen entries, and return cleaned dictionaries; optionally
+  checkpoint progress to a log and resume from it (`src.checkpoint`).
+- `scrape_survey_batches`, `known_ids`, and `next_batch_size`: The
+  checkpointed survey phase, its frontier test, and its adaptive batch size,
+  shared with the asyncio and distributed engines.
+- `get_metrics`: Latency, size, status, queueing and backoff, and network
+  versus parse time of the survey and detail fetches (`src.scrape_metrics`),
+  live during a run and printed as JSON at its end.
 
 The scraped data is later processed by `clean.py`.
 """
 
 #!/usr/bin/env python3
-import re
+import json
+import math
+import os
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 import urllib3
-from bs4 import BeautifulSoup
 
-http = urllib3.PoolManager()
+from src.archive import get_archive_mode, record_page, replay_page, set_archive
+from src.checkpoint import append_checkpoint, load_checkpoint, new_checkpoint_state
+from src.http_pool import InstrumentedPoolManager
+from src.parsing import parse_result_html, parse_survey_html
+from src.scrape_metrics import ScrapeMetrics
+from src.streaming import read_until
+from src.throttle import AdaptiveLimiter, backoff_delay
 
+# Worker threads per phase; the limiter decides how many requests run at once
+MAX_CONCURRENCY = int(os.getenv("SCRAPE_MAX_CONCURRENCY", "300"))
 
-def _parse_badges_row(badges_row, term_pattern):
-    """Parse GRE/term badges row into a dictionary."""
-    record_data = {}
-    for div in badges_row.find_all("div", class_="tw-inline-flex"):
-        text = div.get_text(strip=True)
-        if term_pattern.match(text):
-            record_data["term"] = text
-        elif text.startswith("GRE ") and not text.startswith(("GRE V", "GRE AW")):
-            record_data["GRE Score"] = text.replace("GRE", "").strip()
-        elif text.startswith("GRE V"):
-            record_data["GRE V Score"] = text.replace("GRE V", "").strip()
-        elif text.startswith("GRE AW"):
-            record_data["GRE AW"] = text.replace("GRE AW", "").strip()
-    return record_data
+# One kept-alive connection per worker; workers wait for a free connection
+# rather than opening throwaway ones
+POOL_MAXSIZE = int(os.getenv("SCRAPE_POOL_MAXSIZE", str(MAX_CONCURRENCY)))
+http = InstrumentedPoolManager(maxsize=POOL_MAXSIZE, block=True)
 
+limiter = AdaptiveLimiter(
+    max_limit=MAX_CONCURRENCY, max_rps=float(os.getenv("SCRAPE_MAX_RPS", "0"))
+)
 
-def _parse_entry_id_and_date(link_tag, date_tag):
-    """Extract entry ID and date safely from HTML tags."""
-    try:
-        result_id = int(link_tag["href"].split("/result/")[1].split("#")[0])
-        date_added = date_tag.get_text(strip=True) if date_tag else None
-        return result_id, date_added
-    except (ValueError, AttributeError, IndexError):
-        return None, None
+# Latency, size, status, and timing metrics of the current (or last) run
+metrics = ScrapeMetrics()
+
+# Retries for throttled (429/5xx) responses and network errors
+RETRY_POLICY = {"retries": 3, "base_delay": 0.5, "max_delay": 30.0}
+
+# urllib3 retries nothing itself (RETRY_POLICY does) but follows redirects
+URLLIB3_RETRIES = urllib3.Retry(
+    total=None, connect=0, read=0, status=0, other=0, redirect=3
+)
+
+SURVEY_URL = "https://www.thegradcafe.com/survey/?page={page_num}"
+RESULT_URL = "https://www.thegradcafe.com/result/{page_id}"
+
+# fsync the checkpoint log after every this many scraped result pages
+CHECKPOINT_SYNC_EVERY = 500
+
+# Result-page fields a listing row must provide to skip the detail fetch
+LISTING_REQUIRED = ("Program", "Institution", "Decision", "Degree Type")
+
+# Listing-only mode: build records from survey rows, fetching result pages
+# only for entries whose listing row is missing fields
+LISTING_ONLY = os.getenv("SCRAPE_LISTING_ONLY", "") == "1"
+
+# Stream result pages and stop reading once their <dl> block has arrived; a
+# cut-off page missing RESULT_REQUIRED labels is fetched again in full
+STREAM_DETAILS = os.getenv("SCRAPE_STREAM_DETAILS", "") == "1"
+RESULT_END_MARKER = b"</dl>"
+RESULT_REQUIRED = ("Program",)
+
+set_archive(os.getenv("SCRAPE_ARCHIVE"), os.getenv("SCRAPE_ARCHIVE_MODE", "record"))
+
+
+def get_metrics() -> dict:
+    """
+    Return the current (or last) run's metrics as a JSON-serializable dict.
+
+    Combines `metrics.summary` (see `src.scrape_metrics`) with the limiter's
+    request counters (``limiter``) and the connection pool's (``pool``).
+    Safe to call while a scrape is running.
+    """
+    return {**metrics.summary(), "limiter": limiter.stats(), "pool": http.stats()}
+
+
+def _retry_after(response):
+    """Return a numeric ``Retry-After`` header in seconds, if present."""
+    value = response.headers.get("Retry-After")
+    return float(value) if isinstance(value, str) and value.isdigit() else None
+
+
+def _request(url, kind, stream=False):
+    """
+    GET ``url`` under the adaptive limiter, retrying with jittered backoff.
+
+    429/5xx responses and network errors shrink the concurrency limit and are
+    retried up to ``RETRY_POLICY["retries"]`` times; urllib3 does not retry
+    (`URLLIB3_RETRIES`). Returns the last response and the seconds spent in
+    its requests; a network error on the final attempt propagates. With
+    ``stream=True`` the body is left unread (``preload_content=False``) and
+    the caller must release the response. Every attempt's status or
+    exception is counted in `metrics` under ``kind``, as is the time spent
+    waiting for the limiter and in backoff.
+    """
+    attempt = 0
+    seconds = 0.0
+    while True:
+        queued = time.perf_counter()
+        started = limiter.acquire()
+        requested = time.perf_counter()
+        metrics.record_wait(kind, queued=requested - queued)
+        retry_after = None
+        try:
+            response = http.request(
+                "GET",
+                url,
+                timeout=10.0,
+                retries=URLLIB3_RETRIES,
+                preload_content=not stream,
+            )
+        except urllib3.exceptions.HTTPError as e:
+            seconds += time.perf_counter() - requested
+            limiter.release(started, overloaded=True)
+            metrics.record_exception(kind, getattr(e, "reason", None) or e)
+            if attempt >= RETRY_POLICY["retries"]:
+                raise
+        else:
+            seconds += time.perf_counter() - requested
+            metrics.record_response(kind, response.status)
+            overloaded = response.status == 429 or response.status >= 500
+            limiter.release(started, overloaded=overloaded)
+            if not overloaded or attempt >= RETRY_POLICY["retries"]:
+                return response, seconds
+            retry_after = _retry_after(response)
+            if stream:
+                response.drain_conn()
+                response.release_conn()
+        delay = backoff_delay(
+            attempt,
+            RETRY_POLICY["base_delay"],
+            RETRY_POLICY["max_delay"],
+            retry_after,
+        )
+        metrics.record_wait(kind, backoff=delay)
+        time.sleep(delay)
+        attempt += 1
+
+
+def _get(url, kind, until=None):
+    """
+    Fetch ``url`` through the active archive, timing it in `metrics`.
+
+    Returns the response body, or None for a non-200 response (or a page
+    missing from the archive in replay mode). Network errors propagate.
+    With ``until``, the body is streamed and cut off after the first
+    occurrence of that byte string (see `src.streaming`); the archive then
+    stores the truncated body. ``kind`` is ``"survey"`` or ``"detail"``.
+    The recorded latency covers the requests and the body read only.
+    """
+    if get_archive_mode() == "replay":
+        started = time.perf_counter()
+        body = replay_page(url)
+        seconds = time.perf_counter() - started
+    else:
+        body, seconds = _fetch_body(url, kind, until)
+        record_page(url, body)
+    metrics.record_fetch(kind, seconds, len(body) if body is not None else 0)
+    return body
+
+
+def _fetch_body(url, kind, until):
+    """Return the body for `_get` from the network, and its network seconds."""
+    if until is None:
+        response, seconds = _request(url, kind)
+        return (response.data if response.status == 200 else None), seconds
+
+    response, seconds = _request(url, kind, stream=True)
+    if response.status != 200:
+        response.drain_conn()
+        response.release_conn()
+        return None, seconds
+    started = time.perf_counter()
+    body = read_until(response, until)
+    return body, seconds + time.perf_counter() - started
 
 
 def scrape_survey_page(page_num: int):
@@ -62,45 +216,19 @@ def scrape_survey_page(page_num: int):
         A list of entry dictionaries extracted from the survey page.
     """
     try:
-        response = http.request(
-            "GET", f"https://www.thegradcafe.com/survey/?page={page_num}", timeout=10.0
-        )
-        if response.status != 200:
+        html = _get(SURVEY_URL.format(page_num=page_num), "survey")
+        if html is None:
             return []
     except urllib3.exceptions.HTTPError:
         return []
 
-    soup = BeautifulSoup(response.data, "html.parser")
-    entries = []
-    rows = soup.select("tr")
-    term_pattern = re.compile(
-        r"^(Fall|Spring|Summer|Winter|F|S|Su|W)\s*\d{2,4}$", re.IGNORECASE
-    )
-
-    i = 0
-    while i < len(rows):
-        row = rows[i]
-        link_tag = row.select_one("a[href^='/result/']")
-        if not link_tag:
-            i += 1
-            continue
-
-        badges_row = rows[i + 1] if i + 1 < len(rows) else None
-        record_data = _parse_badges_row(badges_row, term_pattern) if badges_row else {}
-
-        result_id, date_added = _parse_entry_id_and_date(
-            link_tag, row.select_one("td:nth-child(3)")
-        )
-        if result_id:
-            entry = {"id": result_id, "date_added": date_added}
-            entry.update(record_data)
-            entries.append(entry)
-
-        i += 2
-
+    started = time.perf_counter()
+    entries = parse_survey_html(html)
+    metrics.record_parse("survey", time.perf_counter() - started)
     return entries
 
 
+
 def scrape_page(page_entry: dict):
     """
     Scrape the detailed results page for a single entry.
@@ -115,44 +243,277 @@ def scrape_page(page_entry: dict):
     dict or None
         A dictionary with detailed scraped fields, or ``None`` if scraping fails.
     """
-    page_id = page_entry["id"]
-    url = f"https://www.thegradcafe.com/result/{page_id}"
+    url = RESULT_URL.format(page_id=page_entry["id"])
 
     try:
-        response = http.request("GET", url, timeout=10.0)
-        if response.status != 200:
+        html = _get(url, "detail", RESULT_END_MARKER if STREAM_DETAILS else None)
+        if html is None:
             return None
 
-        soup = BeautifulSoup(response.data, "html.parser")
-        pairs = {}
-        for block in soup.select("dl > div"):
-            dt = block.find("dt")
-            dd = block.find("dd")
-            if dt and dd:
-                key = dt.get_text(strip=True)
-                value = dd.get_text(strip=True)
-                pairs[key] = value
-
-        pairs["Date Added"] = page_entry["date_added"]
-        pairs["Term"] = page_entry.get("term")
-        pairs["GRE Score"] = page_entry.get("GRE Score")
-        pairs["GRE V Score"] = page_entry.get("GRE V Score")
-        pairs["GRE AW"] = page_entry.get("GRE AW")
-
-        return {"id": page_id, "url": url, "data": pairs}
+        started = time.perf_counter()
+        pairs = parse_result_html(html)
+        if STREAM_DETAILS and not set(RESULT_REQUIRED) <= pairs.keys():
+            # The cutoff hit some other <dl> first: read the whole page
+            html = _get(url, "detail")
+            if html is None:
+                return None
+            started = time.perf_counter()
+            pairs = parse_result_html(html)
+        record = _entry_record(page_entry, pairs)
+        metrics.record_parse("detail", time.perf_counter() - started)
+        return record
     except urllib3.exceptions.HTTPError:
         return None
     except Exception:  # pylint: disable=broad-exception-caught
         return None
 
 
-def scrape_new_entries(max_id=None, target_count=30000, batch_size=5):
+def build_detail_record(page_entry: dict, html) -> dict:
+    """
+    Combine a survey entry with the fields parsed from its result page.
+
+    Parameters
+    ----------
+    page_entry : dict
+        Survey entry with at least ``id`` and ``date_added``.
+    html : bytes or str
+        Raw result page HTML.
+
+    Returns
+    -------
+    dict
+        ``{"id": ..., "url": ..., "data": pairs}`` as returned by `scrape_page`.
+    """
+    return _entry_record(page_entry, parse_result_html(html))
+
+
+def build_listing_record(page_entry: dict) -> dict:
+    """
+    Build a `scrape_page`-style record from a survey entry's listing row alone.
+
+    Parameters
+    ----------
+    page_entry : dict
+        Survey entry as returned by `parse_survey_html`.
+
+    Returns
+    -------
+    dict
+        ``{"id": ..., "url": ..., "data": pairs}`` with the result-page labels
+        the listing row provides.
+    """
+    return _entry_record(page_entry, dict(page_entry.get("listing") or {}))
+
+
+def _entry_record(page_entry: dict, pairs: dict) -> dict:
+    """Add the survey-only fields to ``pairs`` and wrap them in a record."""
+    page_id = page_entry["id"]
+    pairs["Date Added"] = page_entry["date_added"]
+    pairs["Term"] = page_entry.get("term")
+    pairs["GRE Score"] = page_entry.get("GRE Score")
+    pairs["GRE V Score"] = page_entry.get("GRE V Score")
+    pairs["GRE AW"] = page_entry.get("GRE AW")
+    return {"id": page_id, "url": RESULT_URL.format(page_id=page_id), "data": pairs}
+
+
+def _fetch_survey_pages(page_range):
+    """
+    Yield each page's survey entries in page order, fetching concurrently.
+
+    Closing the generator cancels the rest: queued fetches never start and
+    in-flight ones are abandoned.
+    """
+    stop = threading.Event()
+
+    def fetch(page_num):
+        return [] if stop.is_set() else scrape_survey_page(page_num)
+
+    executor = ThreadPoolExecutor(max_workers=min(len(page_range), MAX_CONCURRENCY))
+    futures = [executor.submit(fetch, n) for n in page_range]
+    try:
+        for future in futures:
+            try:
+                entries = future.result()
+            except Exception:  # pylint: disable=broad-exception-caught
+                entries = []
+            yield entries
+    finally:
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _scrape_survey_range(page_range, is_known, collected, fetch_pages=None):
+    """
+    Fetch survey pages and read them in page order.
+
+    Entries whose IDs are in ``collected`` (already taken earlier in this run,
+    e.g. after pagination shifted) are skipped. Stops at the frontier, the
+    first page holding a known entry (``is_known(id)``), and closes the
+    ``fetch_pages(page_range)`` generator (default `_fetch_survey_pages`) to
+    cancel the pages after it. Returns the new entries, the number of entries
+    read (old and new), and whether the frontier was reached.
+    """
+    pages = (fetch_pages or _fetch_survey_pages)(page_range)
+    new_entries, read, frontier = [], 0, False
+    try:
+        for entries in pages:
+            read += len(entries)
+            entries = [e for e in entries if e["id"] not in collected]
+            fresh = [e for e in entries if not is_known(e["id"])]
+            new_entries.extend(fresh)
+            collected.update(e["id"] for e in fresh)
+            if len(fresh) < len(entries):
+                frontier = True
+                break
+    finally:
+        pages.close()
+    return new_entries, read, frontier
+
+
+def next_batch_size(remaining, entries_per_page, expected_new=None):
+    """
+    Return how many survey pages to request next.
+
+    Enough pages for the ``remaining`` entries still wanted, or for the
+    ``expected_new`` entries left above ``max_id`` if that is fewer, bounded
+    by the worker count.
+    """
+    if expected_new is not None:
+        remaining = min(remaining, expected_new)
+    pages = math.ceil(max(remaining, 1) / max(entries_per_page, 1))
+    return max(1, min(pages, MAX_CONCURRENCY))
+
+
+def scrape_survey_batches(state, known, target_count, batch_size, fetch_pages=None):
+    """
+    Extend ``state["entries"]`` batch by batch, yielding checkpoint records.
+
+    ``state`` is a checkpoint state (`src.checkpoint`); a ``"batch"`` record
+    is yielded after each batch that found entries and a ``"surveyed"`` record
+    at the end, for the caller to append to its log. ``known`` is
+    ``(is_known, floor)`` as returned by `known_ids`. ``fetch_pages(page_range)``
+    yields each page's survey entries in page order (default: fetched
+    concurrently in this process); see `_scrape_survey_range`.
+    """
+    all_entries = state["entries"]
+    collected = {e["id"] for e in all_entries}
+    page_num = state["next_page"]
+    pages_read = entries_read = 0
+    top_id = max(collected, default=None)
+
+    while len(all_entries) < target_count:
+        print(f"Scraping survey pages {page_num}–{page_num + batch_size - 1}...")
+        batch_entries, read, frontier = _scrape_survey_range(
+            range(page_num, page_num + batch_size), known[0], collected, fetch_pages
+        )
+        if batch_entries:
+            all_entries.extend(batch_entries)
+            top_id = max(top_id or 0, max(e["id"] for e in batch_entries))
+        page_num += batch_size
+        if batch_entries:
+            yield {"type": "batch", "next_page": page_num, "entries": batch_entries}
+
+        if frontier:
+            print("Reached already-scraped entries. Stopping.")
+            break
+        if not batch_entries:
+            print("No new entries found in this batch. Stopping early.")
+            break
+
+        # Size the next batch from the entries still wanted per page read; IDs
+        # are sequential, so at most top_id - floor new entries exist
+        pages_read += batch_size
+        entries_read += read
+        batch_size = next_batch_size(
+            target_count - len(all_entries),
+            entries_read / pages_read,
+            top_id - known[1] - len(all_entries) if known[1] else None,
+        )
+
+    yield {"type": "surveyed"}
+
+
+def listing_missing_fields(page_entry: dict) -> list:
+    """
+    Return the `LISTING_REQUIRED` fields an entry's listing row lacks.
+
+    A decided (accepted or rejected) entry also needs a fully dated
+    ``Notification``.
+    """
+    listing = page_entry.get("listing") or {}
+    missing = [label for label in LISTING_REQUIRED if not listing.get(label)]
+    if listing.get("Decision") in ("Accepted", "Rejected") and "/" not in (
+        listing.get("Notification") or ""
+    ):
+        missing.append("Notification")
+    return missing
+
+
+
+def _scrape_from_listing(page_entry: dict):
+    """Use the entry's listing row, or its result page if the row lacks fields."""
+    if listing_missing_fields(page_entry):
+        return scrape_page(page_entry)
+    return build_listing_record(page_entry)
+
+
+def _scrape_details(entries, details, log, listing_only=False, retry_queue=None):
+    """
+    Scrape result pages missing from ``details``, checkpointing each one.
+
+    Failed fetches are queued in ``retry_queue`` (if given); entries that
+    succeed are removed from it.
+    """
+    pending = [e for e in entries if e["id"] not in details]
+    fetch = scrape_page
+    if listing_only:
+        fetch = _scrape_from_listing
+        complete = sum(not listing_missing_fields(e) for e in pending)
+        print(
+            f"Listing rows complete for {complete} of {len(pending)} entries; "
+            f"fetching {len(pending) - complete} result pages."
+        )
+
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENCY) as executor:
+        results = zip(pending, executor.map(fetch, pending))
+        for n, (entry, record) in enumerate(results, start=1):
+            if not record:
+                if retry_queue is not None:
+                    retry_queue.record_failure(entry)
+                continue
+            if retry_queue is not None:
+                retry_queue.record_success(record["id"])
+            details[record["id"]] = record
+            if log:
+                sync = n % CHECKPOINT_SYNC_EVERY == 0
+                append_checkpoint(log, {"type": "detail", "record": record}, sync)
+
+
+def known_ids(max_id, seen):
+    """
+    Return ``(is_known, floor)`` for the survey phase of a scrape.
+
+    ``is_known(id)`` tests for already-scraped IDs (in ``seen`` if given,
+    otherwise ``<= max_id``) and ``floor`` is the ID new entries are expected
+    above (None if unknown).
+    """
+    if seen is not None:
+        return seen.__contains__, seen.max() or None
+    if max_id:
+        return (lambda result_id: result_id <= max_id), max_id
+    return (lambda _result_id: False), None
+
+
+def scrape_new_entries(
+    max_id=None, target_count=30000, batch_size=5, listing_only=None, stores=None
+):
     """
     Scrape new survey entries from the site until a target count is reached.
 
     This function scrapes entries in batches of pages, filters out entries that
     are already known (based on ``max_id``), and then fetches detailed information
-    for each entry.
+    for each entry. Survey pages are read newest first, so the first page holding
+    a known entry is the frontier: later pages are cancelled and scraping stops.
 
     Parameters
     ----------
@@ -162,42 +523,87 @@ def scrape_new_entries(max_id=None, target_count=30000, batch_size=5):
     target_count : int, optional
         The total number of new entries to collect. Defaults to 30,000.
     batch_size : int, optional
-        The number of pages to scrape in each batch. Defaults to 5.
+        The number of pages in the first batch. Later batches are sized to the
+        entries still expected. Defaults to 5.
+    listing_only : bool, optional
+        Build records from the survey listing rows, fetching a result page only
+        for entries whose row lacks a `LISTING_REQUIRED` field (or the full
+        decision date). Defaults to `LISTING_ONLY` (``SCRAPE_LISTING_ONLY=1``).
+    stores : dict, optional
+        Durable state of the scrape, under any of these keys:
+
+        ``checkpoint`` (str or pathlib.Path)
+            Path to an append-only checkpoint log (see `src.checkpoint`).
+            Progress is recorded there as it is made, and a scrape restarted
+            with the same log resumes from the last checkpoint instead of
+            refetching pages. Remove the log (`checkpoint.remove_checkpoint`)
+            once the results are saved.
+        ``seen`` (src.seen_ids.SeenIdSet)
+            Already-scraped IDs. When given, it replaces ``max_id``: only
+            unseen entries are fetched (including late-posted lower IDs), and
+            the first page with a seen entry is the frontier. The caller adds
+            the returned IDs once they are in the database.
+        ``retry_queue`` (src.retry_queue.RetryQueue)
+            Durable queue of failed result fetches. Entries due for a retry
+            are fetched first (without counting toward ``target_count``), new
+            failures are queued with a backoff, and the queue is saved at the
+            end.
+
+        Defaults to None (no checkpoint, seen-ID set, or retry queue).
 
     Returns
     -------
     list of dict
         A list of dictionaries containing the scraped entry details.
     """
-    all_entries = []
-    page_num = 1  # Initial page to start from
-
-    while len(all_entries) < target_count:
-        page_range = range(page_num, page_num + batch_size)
-        print(f"Scraping survey pages {page_range[0]}–{page_range[-1]}...")
-
-        with ThreadPoolExecutor(max_workers=100) as executor:
-            try:
-                results = list(executor.map(scrape_survey_page, page_range))
-            except Exception:  # pylint: disable=broad-exception-caught
-                results = [[]]
-
-        batch_entries = [e for sublist in results for e in sublist]
-
-        if max_id:
-            batch_entries = [e for e in batch_entries if e["id"] > max_id]
+    stores = stores or {}
+    checkpoint, retry_queue = stores.get("checkpoint"), stores.get("retry_queue")
+    metrics.reset()
+    state = load_checkpoint(checkpoint) if checkpoint else new_checkpoint_state()
+    if state["entries"]:
+        print(
+            f"Resuming from checkpoint: {len(state['entries'])} survey entries, "
+            f"{len(state['details'])} detail pages already scraped."
+        )
 
-        if not batch_entries:
-            print("No new entries found in this batch. Stopping early.")
-            break
+    retries = retry_queue.due() if retry_queue is not None else []
+
+    with (
+        open(checkpoint, "a", encoding="utf-8") if checkpoint else nullcontext()
+    ) as log:
+        if not state["surveyed"]:
+            for record in scrape_survey_batches(
+                state, known_ids(max_id, stores.get("seen")), target_count, batch_size
+            ):
+                if log:
+                    append_checkpoint(log, record, sync=True)
+
+        survey_entries = state["entries"][:target_count]
+        survey_ids = {e["id"] for e in survey_entries}
+        all_entries = [e for e in retries if e["id"] not in survey_ids]
+        print(
+            f"Collected {len(survey_entries)} survey entries and "
+            f"{len(all_entries)} queued retries. Fetching details..."
+        )
+        all_entries += survey_entries
+        _scrape_details(
+            all_entries,
+            state["details"],
+            log,
+            LISTING_ONLY if listing_only is None else listing_only,
+            retry_queue,
+        )
 
-        all_entries.extend(batch_entries)
-        page_num += batch_size
+    if retry_queue is not None:
+        retry_queue.save()
+        print(f"{len(retry_queue)} failed result pages queued for retry.")
+    metrics.finish()
+    print(f"Scrape metrics: {json.dumps(get_metrics())}")
 
-    all_entries = all_entries[:target_count]
-    print(f"Collected {len(all_entries)} survey entries. Fetching details...")
+    details = state["details"]
+    return [details[e["id"]] for e in all_entries if e["id"] in details]
 
-    with ThreadPoolExecutor(max_workers=300) as executor:
-        detailed = list(executor.map(scrape_page, all_entries))
 
-    return [d for d in detailed if d]
+def request_for_test(url, kind):
+    """Public wrapper to test the private _request (returns the response)."""
+    return _request(url, kind)[0]
@@ -0,0 +1,276 @@
+"""
+Asyncio scraping engine for The Grad Cafe admissions survey.
+
+An alternative to the thread-pool engine in `scrape.py` that runs every
+request on one event loop with a shared ``httpx.AsyncClient``:
+
+- A global semaphore bounds the number of in-flight requests.
+- The client's connection pool bounds (and keeps alive) the connections to
+  the site; all requests go to one host, so this is the per-host limit.
+- Survey pages are pipelined into detail fetches: each entry's result page
+  is scheduled as soon as its survey page is parsed, while the next survey
+  pages are still downloading.
+
+Parsing reuses `scrape.parse_survey_html` and `scrape.build_detail_record`
+in worker threads (`asyncio.to_thread`), so the event loop keeps issuing
+requests while pages are parsed and results are identical to
+`scrape.scrape_new_entries`. The engine also honours that function's
+``seen`` set and retry queue, records its fetches in `scrape.metrics`, and
+records into or replays from the same fetch archive (`src.archive`).
+"""
+
+#!/usr/bin/env python3
+import asyncio
+import json
+import time
+
+import httpx
+
+from src.archive import get_archive_mode, record_page, replay_page
+from src.scrape import (
+    RESULT_URL,
+    SURVEY_URL,
+    build_detail_record,
+    get_metrics,
+    known_ids,
+    metrics,
+    next_batch_size,
+    parse_survey_html,
+)
+
+# Default bounds: in-flight requests and open connections to the site
+DEFAULT_LIMITS = {"concurrency": 100, "per_host": 20}
+
+
+async def _fetch(client, semaphore, url, kind):
+    """
+    Fetch ``url`` through the active archive (`src.archive`), timing it.
+
+    Returns the body, or None on failure (or for a page missing from the
+    archive in replay mode). Archive reads and writes run in worker threads.
+    The recorded latency excludes the wait for the semaphore.
+    """
+    if get_archive_mode() == "replay":
+        started = time.perf_counter()
+        body = await asyncio.to_thread(replay_page, url)
+        seconds = time.perf_counter() - started
+    else:
+        body, seconds = await _request(client, semaphore, url, kind)
+        await asyncio.to_thread(record_page, url, body)
+    metrics.record_fetch(kind, seconds, len(body) if body is not None else 0)
+    return body
+
+
+async def _request(client, semaphore, url, kind):
+    """
+    GET ``url`` under the semaphore; return the body (None on failure).
+
+    Also returns the seconds spent on the request and body read; the wait
+    for the semaphore is recorded in `metrics` as queueing time.
+    """
+    queued = time.perf_counter()
+    async with semaphore:
+        started = time.perf_counter()
+        metrics.record_wait(kind, queued=started - queued)
+        try:
+            response = await client.get(url, timeout=10.0)
+        except httpx.HTTPError as e:
+            metrics.record_exception(kind, e)
+            response = None
+        seconds = time.perf_counter() - started
+    body = None
+    if response is not None:
+        metrics.record_response(kind, response.status_code)
+        if response.status_code == 200:
+            body = response.content
+    return body, seconds
+
+
+async def _parse(kind, parse, *args):
+    """Run ``parse(*args)`` in a worker thread, timing it in `metrics`."""
+    started = time.perf_counter()
+    result = await asyncio.to_thread(parse, *args)
+    metrics.record_parse(kind, time.perf_counter() - started)
+    return result
+
+
+async def _scrape_survey_page(client, semaphore, page_num):
+    """Fetch and parse one survey page (empty list on failure)."""
+    url = SURVEY_URL.format(page_num=page_num)
+    try:
+        html = await _fetch(client, semaphore, url, "survey")
+        return await _parse("survey", parse_survey_html, html) if html else []
+    except Exception:  # pylint: disable=broad-exception-caught
+        return []
+
+
+async def _scrape_page(client, semaphore, page_entry):
+    """Fetch and parse one result page (None on failure)."""
+    url = RESULT_URL.format(page_id=page_entry["id"])
+    try:
+        html = await _fetch(client, semaphore, url, "detail")
+        if not html:
+            return None
+        return await _parse("detail", build_detail_record, page_entry, html)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return None
+
+
+async def _scrape(
+    client, semaphore, known, target_count, batch_size, retries=()
+):  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+    """
+    Pipeline survey batches into detail fetches and gather results in order.
+
+    ``known`` is ``(is_known, floor)`` as returned by `scrape.known_ids`.
+    Known entries, and entries already taken earlier in the run (pagination
+    shifted), are skipped. As in `scrape.scrape_new_entries`, the first page
+    holding a known entry is the frontier: the survey pages after it are
+    cancelled and scraping stops, and later batches are sized with
+    `scrape.next_batch_size`.
+    ``retries`` are fetched first without counting toward ``target_count``.
+    Returns ``(entry, record)`` pairs, with None records for failures.
+    """
+    collected = {e["id"] for e in retries}
+    entries = list(retries)
+    detail_tasks = [
+        asyncio.create_task(_scrape_page(client, semaphore, e)) for e in entries
+    ]
+    new_count = 0
+    page_num = 1
+    pages_read = entries_read = 0
+    top_id = None
+
+    while new_count < target_count:
+        print(f"Scraping survey pages {page_num}–{page_num + batch_size - 1}...")
+        survey_tasks = [
+            asyncio.create_task(_scrape_survey_page(client, semaphore, n))
+            for n in range(page_num, page_num + batch_size)
+        ]
+
+        found, frontier = 0, False
+        try:
+            for task in survey_tasks:  # in page order, so results stay ordered
+                page = await task
+                entries_read += len(page)
+                page = [e for e in page if e["id"] not in collected]
+                fresh = [e for e in page if not known[0](e["id"])]
+                for entry in fresh:
+                    found += 1
+                    collected.add(entry["id"])
+                    top_id = max(top_id or 0, entry["id"])
+                    if new_count < target_count:
+                        new_count += 1
+                        entries.append(entry)
+                        detail_tasks.append(
+                            asyncio.create_task(
+                                _scrape_page(client, semaphore, entry)
+                            )
+                        )
+                if len(fresh) < len(page):
+                    frontier = True
+                    break
+        finally:
+            for task in survey_tasks:
+                task.cancel()
+
+        if frontier:
+            print("Reached already-scraped entries. Stopping.")
+            break
+        if not found:
+            print("No new entries found in this batch. Stopping early.")
+            break
+        page_num += batch_size
+
+        # Size the next batch as the threaded engine does
+        pages_read += batch_size
+        batch_size = next_batch_size(
+            target_count - new_count,
+            entries_read / pages_read,
+            top_id - known[1] - new_count if known[1] else None,
+        )
+
+    print(
+        f"Collected {new_count} survey entries and {len(retries)} queued "
+        "retries. Fetching details..."
+    )
+    return list(zip(entries, await asyncio.gather(*detail_tasks)))
+
+
+async def _run(
+    limits, transport, known, target_count, batch_size, retries
+):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    """Open the shared client and run the pipelined scrape."""
+    semaphore = asyncio.Semaphore(limits["concurrency"])
+    pool = httpx.Limits(
+        max_connections=limits["per_host"],
+        max_keepalive_connections=limits["per_host"],
+    )
+    async with httpx.AsyncClient(limits=pool, transport=transport) as client:
+        return await _scrape(
+            client, semaphore, known, target_count, batch_size, retries
+        )
+
+
+def scrape_new_entries_async(
+    max_id=None,
+    target_count=30000,
+    batch_size=5,
+    limits=None,
+    transport=None,
+    seen=None,
+    retry_queue=None,
+):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    """
+    Scrape new survey entries with the asyncio engine.
+
+    Takes the same core arguments and returns the same records as
+    `scrape.scrape_new_entries`.
+
+    Parameters
+    ----------
+    max_id : int, optional
+        Entries with IDs <= max_id are ignored. Defaults to None.
+    target_count : int, optional
+        The total number of new entries to collect. Defaults to 30,000.
+    batch_size : int, optional
+        The number of survey pages in the first batch. Later batches are
+        sized to the entries still expected. Defaults to 5.
+    limits : dict, optional
+        ``concurrency`` (maximum in-flight requests) and ``per_host``
+        (maximum open, kept-alive connections to the site). Missing keys
+        fall back to `DEFAULT_LIMITS`.
+    transport : httpx.AsyncBaseTransport, optional
+        Custom transport (e.g. ``httpx.MockTransport`` in tests).
+    seen : src.seen_ids.SeenIdSet, optional
+        Already-scraped IDs; replaces ``max_id`` as in `scrape.scrape_new_entries`.
+    retry_queue : src.retry_queue.RetryQueue, optional
+        Durable queue of failed result fetches, used as in
+        `scrape.scrape_new_entries`.
+
+    Returns
+    -------
+    list of dict
+        A list of dictionaries containing the scraped entry details.
+    """
+    limits = {**DEFAULT_LIMITS, **(limits or {})}
+    metrics.reset()
+    retries = retry_queue.due() if retry_queue is not None else []
+    results = asyncio.run(
+        _run(
+            limits,
+            transport,
+            known_ids(max_id, seen),
+            target_count,
+            batch_size,
+            retries,
+        )
+    )
+
+    if retry_queue is not None:
+        retry_queue.update(results)
+        print(f"{len(retry_queue)} failed result pages queued for retry.")
+    metrics.finish()
+    print(f"Scrape metrics: {json.dumps(get_metrics())}")
+
+    return [record for _, record in results if record]
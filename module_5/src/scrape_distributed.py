@@ -0,0 +1,292 @@
+"""
+Multi-process scraping engine for The Grad Cafe admissions survey.
+
+The thread-pool engine in `scrape.py` parses every page in one process, so
+the GIL caps BeautifulSoup throughput however many threads fetch. This
+engine spreads fetching *and* parsing over worker processes that share a
+`src.work_queue.WorkQueue` (one SQLite file):
+
+- The coordinator (`scrape_new_entries_distributed`) enqueues survey pages
+  batch by batch and reads their parsed entries back in page order, with
+  the same frontier, ``seen``, and batch-sizing logic as
+  `scrape.scrape_new_entries`. It then enqueues one detail task per new
+  entry, closes the queue, and collects the records in entry order.
+- Workers (`run_worker`) each run a pool of threads that claim tasks, fetch
+  and parse them with `scrape.scrape_survey_page` / `scrape.scrape_page`,
+  and store the results in the queue. On exit, each reports its fetch
+  metrics (`scrape.metrics`) to the queue, and the coordinator merges the
+  reports of its local workers into its own metrics once they have exited.
+
+The coordinator starts ``processes`` local workers. More workers on the
+same host (the queue cannot be shared across hosts, see `src.work_queue`)
+can join a running scrape with::
+
+    python -m src.scrape_distributed QUEUE_FILE [--threads N] [--share N]
+
+Every process has its own `scrape.limiter`, so ``SCRAPE_MAX_RPS`` and the
+AIMD concurrency ceiling would apply per worker. Local workers are given
+an equal share of them; pass ``--share`` (the total number of workers) to
+split them the same way for workers started by hand.
+"""
+
+#!/usr/bin/env python3
+import argparse
+import json
+import multiprocessing
+import os
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src import scrape
+from src.checkpoint import new_checkpoint_state
+from src.scrape import known_ids, scrape_survey_batches
+from src.throttle import AdaptiveLimiter
+from src.work_queue import WorkQueue
+
+# Local worker processes and fetch threads per worker
+DEFAULT_WORKERS = {"processes": os.cpu_count() or 1, "threads": 20}
+
+# Seconds between polls of the queue while waiting
+POLL_SECONDS = 0.2
+
+
+def _handle(queue, kind, key, payload):
+    """Fetch and parse one task and store its result (or record the failure)."""
+    try:
+        if kind == "survey":
+            result = scrape.scrape_survey_page(key)
+        else:
+            result = scrape.scrape_page(payload)
+    except Exception:  # pylint: disable=broad-exception-caught
+        result = None
+    if result is None:
+        queue.fail(kind, key)
+    else:
+        queue.complete(kind, key, result)
+
+
+def _share_limiter(share, threads):
+    """Replace this process's `scrape.limiter` with 1/``share`` of its budget."""
+    max_rps = scrape.limiter.max_rps
+    scrape.limiter = AdaptiveLimiter(
+        max_limit=max(1, min(threads, scrape.limiter.bounds[1] // share)),
+        max_rps=max_rps / share if max_rps else max_rps,
+    )
+
+
+def run_worker(queue_path, threads=None, poll=POLL_SECONDS, share=1) -> int:
+    """
+    Process tasks from a shared queue until it is drained.
+
+    Parameters
+    ----------
+    queue_path : str or pathlib.Path
+        The queue's SQLite file.
+    threads : int, optional
+        Concurrent fetch threads. Defaults to ``DEFAULT_WORKERS["threads"]``.
+    poll : float, optional
+        Seconds to wait before checking an empty queue again.
+    share : int, optional
+        Number of workers splitting the request budget; above 1, this
+        process's limiter gets 1/``share`` of ``SCRAPE_MAX_RPS`` and of the
+        concurrency ceiling.
+
+    Returns
+    -------
+    int
+        The number of tasks this worker processed.
+    """
+    queue = WorkQueue(queue_path)
+    owner = f"{socket.gethostname()}:{os.getpid()}"
+
+    def loop():
+        handled = 0
+        while True:
+            task = queue.claim(f"{owner}:{threading.get_ident()}")
+            if task is None:
+                if queue.drained():
+                    return handled
+                time.sleep(poll)
+                continue
+            _handle(queue, *task)
+            handled += 1
+
+    threads = threads or DEFAULT_WORKERS["threads"]
+    if share > 1:
+        _share_limiter(share, threads)
+    try:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            return sum(executor.map(lambda _: loop(), range(threads)))
+    finally:
+        queue.report(owner, scrape.metrics.export())
+        queue.close()
+
+
+def _merge_worker_metrics(queue):
+    """Merge the workers' metric reports into `scrape.metrics`."""
+    # Workers running in this process already record into its metrics
+    own = f"{socket.gethostname()}:{os.getpid()}"
+    for owner, exported in queue.reports().items():
+        if owner != own:
+            scrape.metrics.merge(exported)
+
+
+def _wait_for(queue, kind, key, processes, poll):
+    """Block until a task is finished; return its result (None if it failed)."""
+    while True:
+        status, result = queue.get(kind, key) or ("failed", None)
+        if status in ("done", "failed"):
+            return result
+        if processes and not any(p.is_alive() for p in processes):
+            raise RuntimeError("All scraper worker processes exited early.")
+        time.sleep(poll)
+
+
+def _queued_survey_pages(queue, processes, poll):
+    """Return a `scrape.scrape_survey_batches` page fetcher backed by the queue."""
+
+    def fetch_pages(page_range):
+        queue.put("survey", [(n, None) for n in page_range])
+        try:
+            for page_num in page_range:
+                yield _wait_for(queue, "survey", page_num, processes, poll) or []
+        finally:
+            queue.cancel("survey", page_range)
+
+    return fetch_pages
+
+
+def _survey_entries(fetch_pages, known, target_count, batch_size):
+    """Run `scrape.scrape_survey_batches` on the queue and return its entries."""
+    state = new_checkpoint_state()
+    for _record in scrape_survey_batches(  # there is no checkpoint log to write
+        state, known, target_count, batch_size, fetch_pages
+    ):
+        pass
+    return state["entries"][:target_count]
+
+
+def _detail_entries(survey_entries, retries):
+    """Return the due retries not surveyed again, followed by the survey entries."""
+    survey_ids = {e["id"] for e in survey_entries}
+    entries = [e for e in retries if e["id"] not in survey_ids]
+    print(
+        f"Collected {len(survey_entries)} survey entries and "
+        f"{len(entries)} queued retries. Fetching details..."
+    )
+    return entries + survey_entries
+
+
+def scrape_new_entries_distributed(
+    queue_path,
+    max_id=None,
+    target_count=30000,
+    batch_size=5,
+    seen=None,
+    workers=None,
+    retry_queue=None,
+):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    """
+    Scrape new survey entries with worker processes sharing a queue.
+
+    Takes the same core arguments and returns the same records as
+    `scrape.scrape_new_entries`. The queue is reset at the start of a run.
+
+    Parameters
+    ----------
+    queue_path : str or pathlib.Path
+        The shared queue's SQLite file.
+    max_id : int, optional
+        Entries with IDs <= max_id are ignored. Defaults to None.
+    target_count : int, optional
+        The total number of new entries to collect. Defaults to 30,000.
+    batch_size : int, optional
+        The number of pages in the first survey batch. Defaults to 5.
+    seen : src.seen_ids.SeenIdSet, optional
+        Already-scraped IDs; replaces ``max_id`` as in `scrape.scrape_new_entries`.
+    workers : dict, optional
+        ``processes`` (local worker processes; 0 to rely on workers started
+        separately) and ``threads`` (fetch threads per local worker). Missing
+        keys fall back to `DEFAULT_WORKERS`.
+    retry_queue : src.retry_queue.RetryQueue, optional
+        Durable queue of failed result fetches, used as in
+        `scrape.scrape_new_entries`.
+
+    Returns
+    -------
+    list of dict
+        A list of dictionaries containing the scraped entry details.
+    """
+    workers = {**DEFAULT_WORKERS, **(workers or {})}
+    scrape.metrics.reset()
+    queue = WorkQueue(queue_path)
+    queue.reset()
+
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(
+            target=run_worker,
+            args=(queue_path, workers["threads"], POLL_SECONDS, workers["processes"]),
+        )
+        for _ in range(workers["processes"])
+    ]
+    retries = retry_queue.due() if retry_queue is not None else []
+    for process in processes:
+        process.start()
+
+    try:
+        survey_entries = _survey_entries(
+            _queued_survey_pages(queue, processes, POLL_SECONDS),
+            known_ids(max_id, seen),
+            target_count,
+            batch_size,
+        )
+        entries = _detail_entries(survey_entries, retries)
+        queue.put("detail", [(e["id"], e) for e in entries])
+        queue.close_queue()
+        records = [
+            _wait_for(queue, "detail", e["id"], processes, POLL_SECONDS)
+            for e in entries
+        ]
+        print(f"Work queue: {queue.counts()}")
+    except BaseException:
+        queue.reset()  # drop unclaimed tasks so the workers stop
+        raise
+    finally:
+        queue.close_queue()
+        for process in processes:
+            process.join()
+        _merge_worker_metrics(queue)
+        queue.close()
+
+    if retry_queue is not None:
+        retry_queue.update(zip(entries, records))
+        print(f"{len(retry_queue)} failed result pages queued for retry.")
+    scrape.metrics.finish()
+    print(f"Scrape metrics: {json.dumps(scrape.get_metrics())}")
+
+    return [r for r in records if r]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Run a scraper worker against a shared work queue"
+    )
+    parser.add_argument("queue", help="Path to the work queue's SQLite file")
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=DEFAULT_WORKERS["threads"],
+        help="Concurrent fetch threads",
+    )
+    parser.add_argument(
+        "--share",
+        type=int,
+        default=1,
+        help="Workers splitting the request budget (SCRAPE_MAX_RPS)",
+    )
+    args = parser.parse_args()
+    processed = run_worker(args.queue, args.threads, share=args.share)
+    print(f"Processed {processed} tasks.")
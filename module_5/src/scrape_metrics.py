@@ -0,0 +1,200 @@
+"""
+Per-run instrumentation of the scraper's survey and detail fetches.
+
+`ScrapeMetrics` collects, for each kind of page (``"survey"`` and
+``"detail"``):
+
+- fetch latency percentiles and response sizes. Latency is network time
+  only: the HTTP requests of every attempt and the body read;
+- time spent queued for a request slot (limiter or semaphore) and sleeping
+  in retry backoff, reported separately from latency;
+- a histogram of HTTP status codes (every attempt, so retried 429/5xx
+  responses are counted) and counts of network exceptions by type;
+- total network time versus parse time.
+
+It also buckets completed fetches by time since the run started, giving
+pages per second over the course of the run. `summary` returns all of this
+as a JSON-serializable dict, and is safe to call while a scrape is running;
+once the run calls `ScrapeMetrics.finish`, its elapsed time stops growing.
+`ScrapeMetrics.export` and `ScrapeMetrics.merge` carry the raw counters of
+another process (e.g. a distributed worker) into this one.
+"""
+
+#!/usr/bin/env python3
+import copy
+import math
+import threading
+import time
+
+# Fetch kinds tracked separately
+KINDS = ("survey", "detail")
+
+# Latency percentiles reported by `ScrapeMetrics.summary`
+PERCENTILES = (50, 90, 99)
+
+# Width of the pages-per-second buckets (seconds)
+THROUGHPUT_WINDOW = 10.0
+
+
+def _percentile(ordered, pct):
+    """Return the nearest-rank percentile of a sorted list (None if empty)."""
+    if not ordered:
+        return None
+    return ordered[max(math.ceil(pct / 100 * len(ordered)) - 1, 0)]
+
+
+def _new_kind_stats():
+    """Return empty counters for one fetch kind."""
+    return {
+        "latencies": [],
+        "bytes": 0,
+        "statuses": {},
+        "exceptions": {},
+        "network_seconds": 0.0,
+        "queue_seconds": 0.0,
+        "backoff_seconds": 0.0,
+        "parse_seconds": 0.0,
+        "parsed": 0,
+    }
+
+
+class ScrapeMetrics:
+    """
+    Thread-safe counters for one scrape run.
+
+    Parameters
+    ----------
+    window : float, optional
+        Width in seconds of the pages-per-second buckets.
+    """
+
+    def __init__(self, window=THROUGHPUT_WINDOW):
+        self.window = window
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._finished = None
+        self._kinds = {kind: _new_kind_stats() for kind in KINDS}
+        self._buckets = {}  # bucket index -> completed fetches
+
+    def reset(self) -> None:
+        """Clear all counters and restart the run clock."""
+        with self._lock:
+            self._started = time.monotonic()
+            self._finished = None
+            self._kinds = {kind: _new_kind_stats() for kind in KINDS}
+            self._buckets = {}
+
+    def finish(self) -> None:
+        """Stop the run clock; `summary` then reports the run up to now."""
+        with self._lock:
+            self._finished = time.monotonic()
+
+    def record_response(self, kind: str, status: int) -> None:
+        """Count one HTTP response (any attempt) by status code."""
+        with self._lock:
+            statuses = self._kinds[kind]["statuses"]
+            statuses[str(status)] = statuses.get(str(status), 0) + 1
+
+    def record_exception(self, kind: str, error: Exception) -> None:
+        """Count one failed attempt by exception type."""
+        with self._lock:
+            exceptions = self._kinds[kind]["exceptions"]
+            name = type(error).__name__
+            exceptions[name] = exceptions.get(name, 0) + 1
+
+    def record_wait(self, kind: str, queued: float = 0.0, backoff: float = 0.0) -> None:
+        """Record time spent queued for a request slot and in retry backoff."""
+        with self._lock:
+            self._kinds[kind]["queue_seconds"] += queued
+            self._kinds[kind]["backoff_seconds"] += backoff
+
+    def record_fetch(self, kind: str, seconds: float, nbytes: int = 0) -> None:
+        """Record a finished fetch: its network latency and the body size read."""
+        with self._lock:
+            stats = self._kinds[kind]
+            stats["latencies"].append(seconds)
+            stats["bytes"] += nbytes
+            stats["network_seconds"] += seconds
+            bucket = int((time.monotonic() - self._started) // self.window)
+            self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+
+    def record_parse(self, kind: str, seconds: float) -> None:
+        """Record the time spent parsing one page."""
+        with self._lock:
+            self._kinds[kind]["parse_seconds"] += seconds
+            self._kinds[kind]["parsed"] += 1
+
+    def export(self) -> dict:
+        """
+        Return the raw counters as a JSON-serializable dict for `merge`.
+
+        The run's start is given as wall-clock time, so throughput buckets
+        can be aligned across processes.
+        """
+        with self._lock:
+            return {
+                "started": time.time() - (time.monotonic() - self._started),
+                "kinds": copy.deepcopy(self._kinds),
+                "buckets": {str(b): n for b, n in self._buckets.items()},
+            }
+
+    def merge(self, exported: dict) -> None:
+        """Add counters returned by another process's `export` to this run."""
+        with self._lock:
+            started = time.time() - (time.monotonic() - self._started)
+            shift = round((exported["started"] - started) / self.window)
+            for kind, other in exported["kinds"].items():
+                stats = self._kinds[kind]
+                stats["latencies"].extend(other["latencies"])
+                for name in ("statuses", "exceptions"):
+                    for key, n in other[name].items():
+                        stats[name][key] = stats[name].get(key, 0) + n
+                for name, value in other.items():
+                    if isinstance(value, (int, float)):
+                        stats[name] += value
+            for bucket, n in exported["buckets"].items():
+                bucket = max(int(bucket) + shift, 0)
+                self._buckets[bucket] = self._buckets.get(bucket, 0) + n
+
+    def summary(self) -> dict:
+        """
+        Return the metrics gathered so far.
+
+        Returns
+        -------
+        dict
+            ``elapsed_seconds``, per-kind ``survey``/``detail`` sections, and
+            ``pages_per_second``: one rate per ``window`` seconds from the
+            start of the run to its `finish` (or to now while it is running;
+            the last, partial window is rated over its elapsed part).
+        """
+        with self._lock:
+            elapsed = (self._finished or time.monotonic()) - self._started
+            kinds = {}
+            for kind, stats in self._kinds.items():
+                ordered = sorted(stats["latencies"])
+                fetches = len(ordered)
+                kinds[kind] = {
+                    "fetches": fetches,
+                    "latency_seconds": {
+                        **{f"p{p}": _percentile(ordered, p) for p in PERCENTILES},
+                        "max": ordered[-1] if ordered else None,
+                    },
+                    "bytes": stats["bytes"],
+                    "mean_bytes": stats["bytes"] / fetches if fetches else None,
+                    "statuses": dict(stats["statuses"]),
+                    "exceptions": dict(stats["exceptions"]),
+                    "network_seconds": stats["network_seconds"],
+                    "queue_seconds": stats["queue_seconds"],
+                    "backoff_seconds": stats["backoff_seconds"],
+                    "parse_seconds": stats["parse_seconds"],
+                    "parsed": stats["parsed"],
+                }
+            buckets = dict(self._buckets)
+
+        last = int(elapsed // self.window)
+        rates = []
+        for bucket in range(last + 1):
+            span = min(self.window, elapsed - bucket * self.window)
+            rates.append(buckets.get(bucket, 0) / span if span > 0 else 0.0)
+        return {"elapsed_seconds": elapsed, **kinds, "pages_per_second": rates}
@@ -0,0 +1,71 @@
+"""
+Persistent set of already-scraped result IDs.
+
+The set is stored as a sorted array of unsigned 32-bit integers (4 bytes
+per ID, so 50k IDs take about 200 KB). Membership is a binary search.
+Updates merge the new IDs in and replace the file atomically, so a crash
+never leaves a half-written file.
+
+The scraper consults it before any detail fetch. Entries seen in an earlier
+run (or earlier in the same run, after pagination shifts) cost no extra
+requests. Late-posted entries with lower IDs are still picked up.
+"""
+
+#!/usr/bin/env python3
+import heapq
+import os
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+
+
+class SeenIdSet:
+    """
+    Sorted-array file of result IDs.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        The ID file; a missing file is an empty set.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._ids = array("I")
+        if self.path.exists():
+            self._ids.frombytes(self.path.read_bytes())
+
+    def __contains__(self, result_id):
+        i = bisect_left(self._ids, result_id)
+        return i < len(self._ids) and self._ids[i] == result_id
+
+    def __len__(self):
+        return len(self._ids)
+
+    def max(self) -> int:
+        """Return the largest ID, or 0 for an empty set."""
+        return self._ids[-1] if self._ids else 0
+
+    def update(self, result_ids) -> int:
+        """
+        Add IDs and save the file.
+
+        Parameters
+        ----------
+        result_ids : iterable of int
+            IDs to add; ``None`` values and IDs already present are ignored.
+
+        Returns
+        -------
+        int
+            The number of IDs added.
+        """
+        new_ids = {i for i in result_ids if i is not None and i not in self}
+        if not new_ids:
+            return 0
+        self._ids = array("I", heapq.merge(self._ids, sorted(new_ids)))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_bytes(self._ids.tobytes())
+        os.replace(tmp_path, self.path)
+        return len(new_ids)
@@ -0,0 +1,47 @@
+"""
+Partial reads of streamed urllib3 responses.
+
+`read_until` stops reading a response once a marker (e.g. a result page's
+closing ``</dl>``) has arrived, and either drains a short remainder so the
+connection can be kept alive, or closes the connection.
+"""
+
+#!/usr/bin/env python3
+
+# Bytes requested from the response per read
+STREAM_CHUNK_BYTES = 16 * 1024
+
+# A streamed response with at most this many unread bytes is drained so its
+# connection stays alive; a longer remainder closes the connection instead
+STREAM_DRAIN_BYTES = 64 * 1024
+
+
+def read_until(response, marker: bytes) -> bytes:
+    """
+    Read a streamed response up to and including ``marker``, then release it.
+
+    The whole body is returned if the marker never appears. When reading
+    stops early, a short remainder is drained so the connection can be
+    reused; a longer one (or one of unknown length) is abandoned by closing
+    the connection, which then is not kept alive.
+    """
+    body = bytearray()
+    found = False
+    try:
+        for chunk in response.stream(STREAM_CHUNK_BYTES):
+            # Search only the new chunk plus enough overlap for a split marker
+            start = max(len(body) - len(marker) + 1, 0)
+            body += chunk
+            end = body.find(marker, start)
+            if end >= 0:
+                del body[end + len(marker) :]
+                found = True
+                break
+    finally:
+        remaining = response.length_remaining
+        if not found or (remaining is not None and remaining <= STREAM_DRAIN_BYTES):
+            response.drain_conn()
+        else:
+            response.close()
+        response.release_conn()
+    return bytes(body)
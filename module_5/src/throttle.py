@@ -0,0 +1,117 @@
+"""
+Adaptive (AIMD) concurrency limiter for the scraper's HTTP requests.
+
+`AdaptiveLimiter` bounds the number of in-flight requests and adjusts that
+bound from the responses it sees, like TCP congestion control:
+
+- Slow start: until the first sign of overload, every healthy response
+  (fast enough success) raises the limit by one.
+- Additive increase: afterwards, healthy responses raise it by ``1/limit``,
+  i.e. by about one per full window of requests.
+- Multiplicative decrease: 429/5xx responses and network errors or timeouts
+  halve the limit, at most once per ``target_latency`` so one burst of
+  failures is a single decrease.
+
+An optional requests-per-second ceiling spaces request starts evenly.
+`backoff_delay` gives the jittered wait before a retry.
+"""
+
+#!/usr/bin/env python3
+import random
+import threading
+import time
+
+
+def backoff_delay(attempt: int, base: float, cap: float, retry_after=None) -> float:
+    """
+    Return the wait before retry number ``attempt`` (starting at 0).
+
+    Uses "full jitter" (uniform between 0 and ``base * 2**attempt``, capped
+    at ``cap``), but never less than a server-provided ``Retry-After``.
+    """
+    delay = random.uniform(0, min(cap, base * 2**attempt))
+    return max(delay, min(retry_after or 0.0, cap))
+
+
+class AdaptiveLimiter:
+    """
+    Thread-safe AIMD limit on concurrent requests, with an optional RPS cap.
+
+    Parameters
+    ----------
+    initial : int, optional
+        Starting concurrency limit.
+    max_limit : int, optional
+        Largest concurrency limit (match the worker thread count).
+    min_limit : int, optional
+        Smallest concurrency limit.
+    target_latency : float, optional
+        Responses slower than this many seconds do not raise the limit.
+    max_rps : float, optional
+        Ceiling on request starts per second; None or 0 for no ceiling.
+    """
+
+    def __init__(
+        self, initial=10, max_limit=300, min_limit=1, target_latency=2.0, max_rps=None
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self.limit = float(initial)
+        self.bounds = (min_limit, max_limit)
+        self.target_latency = target_latency
+        self.max_rps = max_rps
+        self._cond = threading.Condition()
+        self._state = {
+            "in_flight": 0,
+            "slow_start": True,
+            "last_decrease": float("-inf"),
+            "next_start": 0.0,
+        }
+        self._stats = {"requests": 0, "overloads": 0, "decreases": 0, "peak_limit": 0}
+
+    def acquire(self) -> float:
+        """Block until a request may start; return its start time."""
+        with self._cond:
+            while self._state["in_flight"] >= int(self.limit):
+                self._cond.wait()
+            self._state["in_flight"] += 1
+            self._stats["requests"] += 1
+            start = time.monotonic()
+            wait = 0.0
+            if self.max_rps:
+                slot = max(start, self._state["next_start"])
+                self._state["next_start"] = slot + 1.0 / self.max_rps
+                wait = slot - start
+        if wait > 0:
+            time.sleep(wait)
+        return time.monotonic()
+
+    def release(self, started: float, overloaded: bool = False) -> None:
+        """
+        Finish a request started at ``started`` and adapt the limit.
+
+        Parameters
+        ----------
+        started : float
+            The value returned by `acquire`.
+        overloaded : bool, optional
+            True for 429/5xx responses, timeouts, and network errors.
+        """
+        now = time.monotonic()
+        with self._cond:
+            self._state["in_flight"] -= 1
+            if overloaded:
+                self._stats["overloads"] += 1
+                if now - self._state["last_decrease"] >= self.target_latency:
+                    self.limit = max(self.bounds[0], self.limit / 2)
+                    self._state["last_decrease"] = now
+                    self._state["slow_start"] = False
+                    self._stats["decreases"] += 1
+            elif now - started <= self.target_latency:
+                step = 1.0 if self._state["slow_start"] else 1.0 / self.limit
+                self.limit = min(self.bounds[1], self.limit + step)
+            self._stats["peak_limit"] = max(self._stats["peak_limit"], int(self.limit))
+            self._cond.notify_all()
+
+    def stats(self) -> dict:
+        """Return request/overload counters and the current and peak limits."""
+        with self._cond:
+            return {**self._stats, "limit": int(self.limit)}
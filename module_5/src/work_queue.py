@@ -0,0 +1,247 @@
+"""
+SQLite-backed work queue shared by scraper worker processes.
+
+A queue is one SQLite database file holding a ``tasks`` table. Each task is
+identified by its kind (``"survey"`` or ``"detail"``) and an integer key
+(page number or result ID). It carries a JSON payload, a status, and, once
+done, a JSON result, so the same table is also the common result sink.
+
+A task moves through these statuses:
+
+- ``pending``: waiting to be claimed.
+- ``claimed``: a worker is processing it. A claim older than ``lease``
+  seconds is treated as abandoned (its worker crashed) and claimed again,
+  unless it has used up its attempts.
+- ``done``: its result is stored.
+- ``failed``: it failed, or was abandoned, ``max_attempts`` times.
+
+Claims run in ``BEGIN IMMEDIATE`` transactions, so any number of processes
+(and threads, each sharing a `WorkQueue` per process) can claim
+concurrently without handing out a task twice. The database uses WAL
+journaling, so readers do not block the writer. WAL relies on shared memory
+that does not work over network filesystems, so a queue can only be shared
+by processes on one host.
+"""
+
+#!/usr/bin/env python3
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+# Seconds after which a claimed task is assumed abandoned
+LEASE_SECONDS = 300.0
+
+# Attempts before a task is marked failed
+MAX_ATTEMPTS = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    kind TEXT NOT NULL,
+    key INTEGER NOT NULL,
+    payload TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    owner TEXT,
+    claimed_at REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    PRIMARY KEY (kind, key)
+);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status);
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+class WorkQueue:
+    """
+    Durable task queue and result sink in one SQLite file.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        The database file; created (with its tables) if missing.
+    lease : float, optional
+        Seconds before a claimed task can be claimed again.
+    max_attempts : int, optional
+        Failed attempts before a task is marked ``failed``.
+    """
+
+    def __init__(self, path, lease=LEASE_SECONDS, max_attempts=MAX_ATTEMPTS):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lease = lease
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, timeout=60.0, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def _write(self, sql, params=()):
+        """Run one write statement in its own immediate transaction."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = self._conn.execute(sql, params)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            return cursor.rowcount
+
+    def reset(self) -> None:
+        """Delete every task and reopen the queue for a new run."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.execute("DELETE FROM tasks")
+            self._conn.execute("DELETE FROM meta")
+            self._conn.execute("COMMIT")
+
+    def put(self, kind: str, items) -> int:
+        """
+        Enqueue tasks; tasks already in the queue are left unchanged.
+
+        Parameters
+        ----------
+        kind : str
+            Task kind.
+        items : iterable of (int, object)
+            ``(key, payload)`` pairs; payloads must be JSON-serializable.
+
+        Returns
+        -------
+        int
+            The number of tasks added.
+        """
+        rows = [(kind, key, json.dumps(payload)) for key, payload in items]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO tasks (kind, key, payload) VALUES (?, ?, ?)",
+                rows,
+            )
+            self._conn.execute("COMMIT")
+            return self._conn.total_changes - before
+
+    def claim(self, owner: str, now=None):
+        """
+        Claim the oldest available task, survey tasks first.
+
+        Expired claims that have used up ``max_attempts`` are marked failed
+        rather than handed out again.
+
+        Returns
+        -------
+        tuple or None
+            ``(kind, key, payload)``, or None if nothing is available.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.execute(
+                "UPDATE tasks SET status = 'failed' WHERE status = 'claimed'"
+                " AND claimed_at < ? AND attempts >= ?",
+                (now - self.lease, self.max_attempts),
+            )
+            row = self._conn.execute(
+                "SELECT kind, key, payload FROM tasks"
+                " WHERE status = 'pending' OR (status = 'claimed' AND claimed_at < ?)"
+                " ORDER BY kind = 'detail', rowid LIMIT 1",
+                (now - self.lease,),
+            ).fetchone()
+            if row is not None:
+                self._conn.execute(
+                    "UPDATE tasks SET status = 'claimed', owner = ?, claimed_at = ?,"
+                    " attempts = attempts + 1 WHERE kind = ? AND key = ?",
+                    (owner, now, row[0], row[1]),
+                )
+            self._conn.execute("COMMIT")
+        if row is None:
+            return None
+        return row[0], row[1], json.loads(row[2])
+
+    def complete(self, kind: str, key: int, result) -> None:
+        """Store a task's (JSON-serializable) result and mark it done."""
+        self._write(
+            "UPDATE tasks SET status = 'done', result = ? WHERE kind = ? AND key = ?",
+            (json.dumps(result), kind, key),
+        )
+
+    def fail(self, kind: str, key: int) -> None:
+        """Release a task for another attempt, or mark it failed if out of attempts."""
+        self._write(
+            "UPDATE tasks SET status = CASE WHEN attempts >= ? THEN 'failed'"
+            " ELSE 'pending' END WHERE kind = ? AND key = ?",
+            (self.max_attempts, kind, key),
+        )
+
+    def cancel(self, kind: str, keys) -> int:
+        """Drop the given tasks that no worker has claimed yet; return how many."""
+        keys = list(keys)
+        marks = ", ".join("?" * len(keys))
+        return self._write(
+            f"DELETE FROM tasks WHERE status = 'pending' AND kind = ?"
+            f" AND key IN ({marks})",
+            (kind, *keys),
+        )
+
+    def get(self, kind: str, key: int):
+        """Return ``(status, result)`` for a task, or None if it is not queued."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, result FROM tasks WHERE kind = ? AND key = ?",
+                (kind, key),
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1]) if row[1] is not None else None
+
+    def counts(self) -> dict:
+        """Return task counts as ``{kind: {status: n}}``."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT kind, status, COUNT(*) FROM tasks GROUP BY kind, status"
+            ).fetchall()
+        counts = {}
+        for kind, status, n in rows:
+            counts.setdefault(kind, {})[status] = n
+        return counts
+
+    def close_queue(self) -> None:
+        """Mark that no more tasks will be added, so idle workers can exit."""
+        self._write("INSERT OR REPLACE INTO meta (name, value) VALUES ('closed', '1')")
+
+    def drained(self) -> bool:
+        """Return True once the queue is closed and every task is finished."""
+        with self._lock:
+            closed = self._conn.execute(
+                "SELECT 1 FROM meta WHERE name = 'closed'"
+            ).fetchone()
+            busy = self._conn.execute(
+                "SELECT 1 FROM tasks WHERE status IN ('pending', 'claimed') LIMIT 1"
+            ).fetchone()
+        return closed is not None and busy is None
+
+    def report(self, name: str, value) -> None:
+        """Store a JSON-serializable ``value`` under ``name`` until the next `reset`."""
+        self._write(
+            "INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)",
+            (f"report:{name}", json.dumps(value)),
+        )
+
+    def reports(self) -> dict:
+        """Return the values stored with `report`, by name."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT name, value FROM meta WHERE name LIKE 'report:%'"
+            ).fetchall()
+        return {name.split(":", 1)[1]: json.loads(value) for name, value in rows}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
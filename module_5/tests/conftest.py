@@ -28,7 +28,7 @@ def run_scrape_pipeline(test_client, monkeypatch, tmp_path):
     """Helper to simulate running the scrape pipeline with patched functions."""
     monkeypatch.setattr("src.app.pages.DATA_DIR", tmp_path)
 
-    with patch("src.app.pages.get_max_id", return_value=0), \
+    with patch("src.app.pages.get_result_ids", return_value=[]), \
          patch("src.app.pages.scrape_new_entries",
                return_value=[{"id": 1, "question": "Q?", "answer": "A"}]) as mock_scrape, \
          patch("src.app.pages.clean_data",
@@ -0,0 +1,87 @@
+"""
+Tests for src.archive (content-addressed raw HTML archive).
+"""
+
+import gzip
+import threading
+
+import pytest
+
+from src.archive import INDEX_NAME, HtmlArchive
+
+
+@pytest.mark.analysis
+def test_archive_round_trip_and_reopen(tmp_path):
+    """Stored bodies are returned by URL, including after reopening the archive."""
+    archive = HtmlArchive(tmp_path)
+    archive.put("https://example.com/a", b"<html>a</html>")
+    archive.put("https://example.com/b", b"<html>b</html>")
+
+    assert archive.get("https://example.com/a") == b"<html>a</html>"
+    assert archive.get("https://example.com/missing") is None
+
+    reopened = HtmlArchive(tmp_path)
+    assert len(reopened) == 2
+    assert "https://example.com/b" in reopened
+    assert reopened.get("https://example.com/b") == b"<html>b</html>"
+
+
+@pytest.mark.analysis
+def test_archive_deduplicates_and_rolls_segments(tmp_path):
+    """Identical bodies are stored once; full segments roll over to a new file."""
+    archive = HtmlArchive(tmp_path, segment_bytes=1)
+    sha = archive.put("https://example.com/1", b"same")
+    assert archive.put("https://example.com/2", b"same") == sha
+    archive.put("https://example.com/3", b"different")
+
+    segments = sorted(p.name for p in tmp_path.glob("segment-*.gz"))
+    assert segments == ["segment-00000.gz", "segment-00001.gz"]
+    # each segment is a plain (multi-member) gzip file
+    assert gzip.decompress((tmp_path / segments[0]).read_bytes()) == b"same"
+
+    archive.put("https://example.com/1", b"changed")
+    assert HtmlArchive(tmp_path).get("https://example.com/1") == b"changed"
+
+
+@pytest.mark.analysis
+def test_archive_skips_torn_index_line(tmp_path):
+    """A partial index line from a crash is cut off on load."""
+    HtmlArchive(tmp_path).put("https://example.com/a", b"a")
+    with open(tmp_path / INDEX_NAME, "a", encoding="utf-8") as f:
+        f.write('{"url": "https://exa')
+    archive = HtmlArchive(tmp_path)
+    assert len(archive) == 1
+    archive.put("https://example.com/b", b"b")
+
+    reopened = HtmlArchive(tmp_path)
+    assert len(reopened) == 2
+    assert reopened.get("https://example.com/b") == b"b"
+
+
+@pytest.mark.analysis
+def test_archive_independent_writers_share_segments(tmp_path):
+    """Independent writers on one directory (one per process) never clobber each other."""
+    first = HtmlArchive(tmp_path, segment_bytes=64)
+    second = HtmlArchive(tmp_path, segment_bytes=64)
+    bodies = {f"https://example.com/{n}": f"<html>{n}</html>".encode() * 5 for n in range(40)}
+
+    def record(archive, urls):
+        for url in urls:
+            archive.put(url, bodies[url])
+
+    urls = sorted(bodies)
+    threads = [
+        threading.Thread(target=record, args=(first, urls[0::2])),
+        threading.Thread(target=record, args=(second, urls[1::2])),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    reopened = HtmlArchive(tmp_path)
+    assert len(reopened) == len(bodies)
+    assert all(reopened.get(url) == body for url, body in bodies.items())
+    # a writer catches up on the other's entries before it appends
+    second.put("https://example.com/extra", b"extra")
+    assert second.get(urls[0]) == bodies[urls[0]]
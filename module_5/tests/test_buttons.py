@@ -69,10 +69,11 @@ def test_busy_gating_refresh_and_scrape(client):
 
 
 @pytest.mark.buttons
-def test_scrape_generic_exception(client, monkeypatch):
+def test_scrape_generic_exception(client, monkeypatch, tmp_path):
     """Force scrape() to raise a generic exception and verify 500 is returned."""
     monkeypatch.setattr("src.app.pages._scraper_state", {"running": False})
-    with patch("src.app.pages.get_max_id", side_effect=Exception("boom")):
+    monkeypatch.setattr("src.app.pages.DATA_DIR", tmp_path)
+    with patch("src.app.pages.get_result_ids", side_effect=Exception("boom")):
         resp = client.post("/scrape")
         assert resp.status_code == 500
         assert "boom" in resp.json["error"]
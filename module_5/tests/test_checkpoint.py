@@ -0,0 +1,60 @@
+"""
+Tests for src.checkpoint (append-only scrape checkpoint log).
+"""
+
+import json
+
+import pytest
+
+from src import checkpoint
+
+
+@pytest.mark.analysis
+def test_load_checkpoint_missing_file_is_fresh(tmp_path):
+    """A log that does not exist yet replays to a fresh state."""
+    state = checkpoint.load_checkpoint(tmp_path / "scrape.jsonl")
+    assert state == checkpoint.new_checkpoint_state()
+
+
+@pytest.mark.analysis
+def test_load_checkpoint_replays_records(tmp_path):
+    """Batches, the survey marker, and detail records are all replayed."""
+    path = tmp_path / "scrape.jsonl"
+    with open(path, "a", encoding="utf-8") as log:
+        checkpoint.append_checkpoint(
+            log, {"type": "batch", "next_page": 3, "entries": [{"id": 1}]}
+        )
+        checkpoint.append_checkpoint(
+            log, {"type": "batch", "next_page": 5, "entries": [{"id": 2}]}, sync=True
+        )
+        checkpoint.append_checkpoint(log, {"type": "surveyed"})
+        checkpoint.append_checkpoint(log, {"type": "detail", "record": {"id": 2}})
+
+    state = checkpoint.load_checkpoint(path)
+    assert state["next_page"] == 5
+    assert state["entries"] == [{"id": 1}, {"id": 2}]
+    assert state["surveyed"] is True
+    assert state["details"] == {2: {"id": 2}}
+
+
+@pytest.mark.analysis
+def test_load_checkpoint_truncates_torn_line(tmp_path):
+    """A partial final line is ignored and cut off so appends stay valid."""
+    path = tmp_path / "scrape.jsonl"
+    good = json.dumps({"type": "batch", "next_page": 2, "entries": [{"id": 7}]})
+    path.write_text(good + '\n{"type": "detail", "rec', encoding="utf-8")
+
+    state = checkpoint.load_checkpoint(path)
+    assert state["entries"] == [{"id": 7}]
+    assert not state["details"]
+    assert path.read_text(encoding="utf-8") == good + "\n"
+
+
+@pytest.mark.analysis
+def test_remove_checkpoint(tmp_path):
+    """Removing a log deletes it, and removing a missing log is a no-op."""
+    path = tmp_path / "scrape.jsonl"
+    path.write_text("", encoding="utf-8")
+    checkpoint.remove_checkpoint(path)
+    checkpoint.remove_checkpoint(path)
+    assert not path.exists()
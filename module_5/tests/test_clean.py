@@ -5,9 +5,13 @@ Covers:
 - parse_decision_date_for_test (wrapper around private parser).
 - clean_data trimming, acceptance/rejection fields.
 - clean_with_llm subprocess interactions (success/failure).
+- clean_with_llm via the standardizer service, and its subprocess fallback.
 """
 
+import json
 import subprocess
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from types import SimpleNamespace
 
 import pytest
@@ -47,6 +51,7 @@ def test_clean_data_acceptance_and_trim():
     entries = [make_entry() for _ in range(5)]
     cleaned = clean.clean_data(entries, target_count=3)
     assert len(cleaned) == 3
+    assert len(clean.clean_data(iter(entries), target_count=None)) == 5
     rec = cleaned[0]
     assert rec["program"].startswith("CS, JHU")
     assert rec["URL"] == "http://example.com/1"
@@ -71,6 +76,77 @@ def test_clean_data_rejection_and_other():
     assert rec_other["rejection_date"] is None
 
 
+@pytest.mark.analysis
+def test_clean_data_plain_text_skips_parser(monkeypatch):
+    """Plain-text values (as stored by scrape_page) should never hit BeautifulSoup."""
+    def boom(*_a, **_k):
+        raise AssertionError("BeautifulSoup should not be called")
+
+    monkeypatch.setattr(clean, "BeautifulSoup", boom)
+    entry = {
+        "url": "http://example.com/2",
+        "data": {"Program": " CS ", "Institution": "JHU", "Decision": "Accepted"},
+    }
+    rec = clean.clean_data([entry], target_count=1)[0]
+    assert rec["program"] == "CS, JHU"
+    assert rec["applicant_status"] == "Accepted"
+
+
+@pytest.mark.analysis
+def test_clean_data_parses_markup_once_per_entry(monkeypatch):
+    """All markup values of one entry should be parsed in a single pass."""
+    calls = []
+    real_soup = clean.BeautifulSoup
+
+    def counting_soup(*a, **k):
+        calls.append(a[0])
+        return real_soup(*a, **k)
+
+    monkeypatch.setattr(clean, "BeautifulSoup", counting_soup)
+    cleaned = clean.clean_data([make_entry(), make_entry()], target_count=2)
+    assert len(calls) == 2
+    assert cleaned[1]["program"] == "CS, JHU"
+    assert cleaned[1]["acceptance_date"] == "15/04/2025"
+
+
+@pytest.mark.analysis
+def test_clean_data_stray_wrapper_markup_falls_back():
+    """Values that break the shared wrapper document are parsed one by one."""
+    entry = make_entry()
+    entry["data"]["Notes"] = "</entry-value>stray"
+    rec = clean.clean_data([entry], target_count=1)[0]
+    assert rec["comments"] == "stray"
+    assert rec["program"] == "CS, JHU"
+
+
+@pytest.mark.analysis
+@pytest.mark.parametrize(
+    "program", ["Math <b", "a<b", "Math <!-- note", "<script>x", "<textarea>x"]
+)
+def test_clean_data_unterminated_markup_matches_single_parse(program):
+    """Markup that would swallow later values gives the same fields as parsing alone."""
+    entry = make_entry(program=program)
+    entry["data"]["Notes"] = "<b>Funded</b>"
+    rec = clean.clean_data([entry], target_count=1)[0]
+
+    def alone(label):
+        soup = clean.BeautifulSoup(entry["data"][label], "html.parser")
+        return clean.extract_label_text_for_test(entry["data"][label], label, soup)
+
+    assert rec["program"] == f"{alone('Program')}, JHU".rstrip(", ")
+    assert rec["university"] == "JHU"
+    assert rec["comments"] == "Funded"
+    assert rec["acceptance_date"] == "15/04/2025"
+
+@pytest.mark.analysis
+def test_clean_data_workers_preserves_order_and_trims():
+    """Parallel cleaning should match serial output, in order, up to target_count."""
+    entries = [make_entry(program=f"P{i}") for i in range(10)]
+    serial = clean.clean_data(entries, target_count=7)
+    parallel = clean.clean_data(iter(entries), target_count=7, workers=2)
+    assert parallel == serial
+    assert [r["program"] for r in parallel] == [f"P{i}, JHU" for i in range(7)]
+
 
 # ---------- clean_with_llm ----------
 
@@ -114,6 +190,115 @@ def test_clean_with_llm_failure(monkeypatch, tmp_path):
     assert "LLM failed" in str(e.value)
 
 
+class _StandardizerHandler(BaseHTTPRequestHandler):
+    """Stand-in for ``llm_hosting/app.py --serve`` that upper-cases programs."""
+
+    requests = []
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Answer the liveness check."""
+        self._send({"ok": True, "model_loaded": True})
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Standardize the posted rows."""
+        rows = json.loads(self.rfile.read(int(self.headers["Content-Length"])))["rows"]
+        self.requests.append(len(rows))
+        for row in rows:
+            row["llm-generated-program"] = row["program"].upper()
+        self._send({"rows": rows})
+
+    def _send(self, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):  # pylint: disable=arguments-differ
+        """Silence request logging."""
+
+
+@pytest.mark.integration
+def test_clean_with_llm_uses_service_then_falls_back(tmp_path, monkeypatch):
+    """Rows go to a running service in chunks; without one, the subprocess runs."""
+    infile = tmp_path / "in.json"
+    outfile = tmp_path / "out.jsonl"
+    infile.write_text(json.dumps([{"program": f"p{i}"} for i in range(5)]))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandardizerHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(clean, "LLM_SERVICE_URL", f"http://127.0.0.1:{server.server_port}")
+    monkeypatch.setattr(clean, "LLM_SERVICE_CHUNK", 2)
+    monkeypatch.setattr(subprocess, "run", lambda *a, **kw: pytest.fail("subprocess"))
+    try:
+        data = clean.clean_with_llm(str(infile), str(outfile))
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert [r["llm-generated-program"] for r in data] == ["P0", "P1", "P2", "P3", "P4"]
+    assert _StandardizerHandler.requests == [2, 2, 1]
+
+    # The server is gone now, so the subprocess path is used
+    calls = []
+    monkeypatch.setattr(
+        subprocess,
+        "run",
+        lambda cmd, **kw: calls.append(cmd) or SimpleNamespace(returncode=0, stderr=""),
+    )
+    assert clean.clean_with_llm(str(infile), str(outfile)) == data
+    assert calls and "--file" in calls[0]
+
+
+class _BrokenStandardizerHandler(_StandardizerHandler):
+    """Service stand-in that answers /standardize with an HTML error page."""
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Reply with a body that is not JSON."""
+        body = b"<html>Internal error</html>"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class _ShortStandardizerHandler(_StandardizerHandler):
+    """Service stand-in that drops the last row of every chunk."""
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Reply with one row fewer than was posted."""
+        rows = json.loads(self.rfile.read(int(self.headers["Content-Length"])))["rows"]
+        self._send({"rows": rows[:-1]})
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "handler", [_BrokenStandardizerHandler, _ShortStandardizerHandler]
+)
+def test_clean_with_llm_malformed_service_response_falls_back(
+    tmp_path, monkeypatch, handler
+):
+    """A service reply that is not JSON, or is missing rows, falls back to the subprocess."""
+    infile = tmp_path / "in.json"
+    outfile = tmp_path / "out.jsonl"
+    infile.write_text(json.dumps([{"program": "p0"}]))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(clean, "LLM_SERVICE_URL", f"http://127.0.0.1:{server.server_port}")
+    calls = []
+
+    def fake_run(cmd, **_kw):
+        calls.append(cmd)
+        outfile.write_text('{"program": "p0", "llm-generated-program": "P0"}\n')
+        return SimpleNamespace(returncode=0, stderr="")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    try:
+        data = clean.clean_with_llm(str(infile), str(outfile))
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert calls and data == [{"program": "p0", "llm-generated-program": "P0"}]
+
+
 @pytest.mark.analysis
 def test_parse_decision_date_for_test_wrapper():
     """Wrapper should delegate to _parse_decision_date correctly."""
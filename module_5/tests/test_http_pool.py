@@ -0,0 +1,84 @@
+"""
+Tests for src.http_pool (instrumented urllib3 PoolManager).
+
+Requests go to a throwaway HTTP/1.1 server on localhost.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.http_pool import InstrumentedPoolManager
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    """Keep-alive handler that answers every GET with ``ok``."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Send a fixed-length ``ok`` body."""
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *_args):  # pylint: disable=arguments-differ
+        """Silence request logging."""
+
+
+class _ClosingHandler(_OkHandler):
+    """Handler that closes the connection after every response."""
+
+    def end_headers(self):
+        self.send_header("Connection", "close")
+        super().end_headers()
+
+
+def _serve(handler):
+    """Start a local server with ``handler``; return it and its URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}/"
+
+
+@pytest.fixture(name="server_url")
+def fixture_server_url():
+    """Yield the URL of a local keep-alive server."""
+    server, url = _serve(_OkHandler)
+    yield url
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.analysis
+def test_pool_reuses_connections_and_counts_waits(server_url):
+    """Concurrent workers share at most ``maxsize`` kept-alive connections."""
+    http = InstrumentedPoolManager(maxsize=2)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        bodies = list(
+            executor.map(lambda _: http.request("GET", server_url).data, range(40))
+        )
+
+    assert bodies == [b"ok"] * 40
+    stats = http.stats()
+    assert stats["requests"] == 40
+    assert stats["created"] <= 2
+    assert stats["reused"] == 40 - stats["created"]
+    assert stats["waited"] > 0
+
+
+@pytest.mark.analysis
+def test_pool_does_not_count_dropped_connections_as_reused():
+    """Connections the server closed are reopened, so they count as created."""
+    server, url = _serve(_ClosingHandler)
+    http = InstrumentedPoolManager(maxsize=1)
+    try:
+        assert [http.request("GET", url).data for _ in range(5)] == [b"ok"] * 5
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert http.stats() == {"requests": 5, "created": 5, "reused": 0, "waited": 0}
@@ -0,0 +1,48 @@
+"""
+Tests for src.jsonl_log (append-only JSON Lines log reader).
+"""
+
+import pytest
+
+from src.jsonl_log import read_records
+
+
+@pytest.mark.analysis
+def test_read_records_missing_file(tmp_path):
+    """A log that does not exist yet has no records and is not created."""
+    path = tmp_path / "log.jsonl"
+    assert not list(read_records(path))
+    assert not path.exists()
+
+
+@pytest.mark.analysis
+def test_read_records_truncates_torn_line(tmp_path):
+    """Complete records are yielded; a torn final line is cut off."""
+    path = tmp_path / "log.jsonl"
+    path.write_text('{"a": 1}\n{"b": 2}\n{"c": ', encoding="utf-8")
+
+    assert list(read_records(path)) == [{"a": 1}, {"b": 2}]
+    assert path.read_text(encoding="utf-8") == '{"a": 1}\n{"b": 2}\n'
+
+
+@pytest.mark.analysis
+def test_read_records_treats_unterminated_line_as_torn(tmp_path):
+    """A final line without its newline is cut off even if it parses."""
+    path = tmp_path / "log.jsonl"
+    path.write_text('{"a": 1}\n{"b": 2}', encoding="utf-8")
+
+    assert list(read_records(path)) == [{"a": 1}]
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"c": 3}\n')
+    assert list(read_records(path)) == [{"a": 1}, {"c": 3}]
+
+
+@pytest.mark.analysis
+def test_read_records_skips_corrupt_middle_line(tmp_path):
+    """A corrupt complete line is skipped; the records after it are kept."""
+    path = tmp_path / "log.jsonl"
+    text = '{"a": 1}\n{"b": \x00}\n\n{"c": 3}\n'
+    path.write_text(text, encoding="utf-8")
+
+    assert list(read_records(path)) == [{"a": 1}, {"c": 3}]
+    assert path.read_text(encoding="utf-8") == text
@@ -17,6 +17,25 @@ def make_fake_conn(monkeypatch):
     and patch psycopg.connect to use it.
     """
 
+    class FakeCopy:
+        """Stubbed psycopg COPY context that records written rows."""
+
+        def __init__(self, rows):
+            """Store a reference to the shared row log."""
+            self.rows = rows
+
+        def __enter__(self):
+            """Support context manager entry."""
+            return self
+
+        def __exit__(self, exc_type, exc_val, exc_tb):
+            """Support context manager exit (no cleanup)."""
+            return False
+
+        def write_row(self, row):
+            """Record a row written to COPY."""
+            self.rows.append(row)
+
     class FakeCursor:
         """Stubbed psycopg cursor that records executed queries and params."""
 
@@ -24,6 +43,12 @@ def make_fake_conn(monkeypatch):
             """Initialize an empty query log."""
             self.queries = []
             self.params = []
+            self.copied_rows = []
+
+        def copy(self, statement):
+            """Record the COPY statement and return a row-recording context."""
+            self.queries.append(statement)
+            return FakeCopy(self.copied_rows)
 
         def __enter__(self):
             """Support context manager entry."""
@@ -148,3 +173,90 @@ def test_load_data_to_db_appends(monkeypatch, tmp_path, capsys):
 
     captured = capsys.readouterr()
     assert "Appending new entries to existing table..." in captured.out
+
+
+@pytest.mark.db
+def test_bulk_insert_data_copies_rows_and_merges(monkeypatch):
+    """bulk_insert_data should COPY rows with a URL into staging and merge once."""
+    fake_conn = make_fake_conn(monkeypatch)
+
+    data = [
+        {"program": "CS", "URL": "http://example.com/1", "GPA": 3.9},
+        {"program": "Math"},  # missing URL
+    ]
+
+    loader.bulk_insert_data(fake_conn, data)
+
+    cur = fake_conn.cursor_obj
+    assert len(cur.copied_rows) == 1
+    row = dict(zip(loader.COPY_COLUMNS, cur.copied_rows[0]))
+    assert row["url"] == "http://example.com/1"
+    assert row["gpa"] == 3.9
+    assert row["comments"] is None
+
+    # CREATE staging, COPY, and a single INSERT ... SELECT merge
+    assert len(cur.queries) == 3
+    merge = cur.queries[-1].as_string(None)
+    assert "INSERT INTO" in merge and "ON CONFLICT (url) DO NOTHING" in merge
+    assert fake_conn.committed
+
+
+@pytest.mark.integration
+def test_cli_entrypoint_bulk(monkeypatch, tmp_path, capsys):
+    """The --bulk CLI flag should load rows through bulk_insert_data."""
+    f = tmp_path / "data.jsonl"
+    f.write_text('{"URL": "http://example.com/1", "program": "CS"}\n')
+
+    fake_conn = make_fake_conn(monkeypatch)
+    monkeypatch.setattr(sys, "argv", ["prog", str(f), "--bulk"])
+
+    runpy.run_module(loader.__name__, run_name="__main__")
+
+    captured = capsys.readouterr()
+    assert "Loaded 1 entries" in captured.out
+    assert len(fake_conn.cursor_obj.copied_rows) == 1
+
+
+@pytest.mark.db
+def test_iter_chunks_groups_rows():
+    """iter_chunks should yield fixed-size lists with a shorter final chunk."""
+    chunks = list(loader.iter_chunks(({"n": i} for i in range(5)), 2))
+    assert [len(c) for c in chunks] == [2, 2, 1]
+    assert chunks[-1] == [{"n": 4}]
+
+
+@pytest.mark.db
+@pytest.mark.parametrize("size", [0, -1])
+def test_iter_chunks_rejects_sizes_below_one(size):
+    """A chunk size below 1 raises instead of silently loading nothing."""
+    with pytest.raises(ValueError, match="at least 1"):
+        next(loader.iter_chunks([{"n": 1}], size))
+
+
+@pytest.mark.db
+def test_load_jsonl_skips_blank_lines(tmp_path):
+    """load_jsonl should return every non-empty JSON line as a dict."""
+    f = tmp_path / "data.jsonl"
+    f.write_text('{"a": 1}\n\n{"a": 2}\n')
+    assert loader.load_jsonl(str(f)) == [{"a": 1}, {"a": 2}]
+
+
+@pytest.mark.db
+def test_load_data_to_db_streams_in_chunks(monkeypatch, tmp_path, capsys):
+    """load_data_to_db should insert and report progress once per chunk."""
+    f = tmp_path / "data.jsonl"
+    f.write_text(
+        "".join(f'{{"URL": "http://example.com/{i}"}}\n\n' for i in range(3))
+    )
+
+    make_fake_conn(monkeypatch)
+    calls = []
+    monkeypatch.setattr(loader, "insert_data", lambda conn, data: calls.append(data))
+
+    loader.load_data_to_db(str(f), connection_string="fake://conn", chunk_size=2)
+
+    assert [len(c) for c in calls] == [2, 1]
+    captured = capsys.readouterr()
+    assert "Chunk 1: loaded 2 entries so far..." in captured.out
+    assert "Chunk 2: loaded 3 entries so far..." in captured.out
+    assert "Loaded 3 entries" in captured.out
@@ -13,13 +13,14 @@ def test_scraper_status_returns_flag(client):
     pages.set_scraper_running(True)
     resp = client.get("/scraper_status")
     assert resp.status_code == 200
-    assert resp.get_json() == {"is_scraping": True}
+    assert resp.get_json()["is_scraping"] is True
 
     # Simulate idle state
     pages.set_scraper_running(False)
     resp = client.get("/scraper_status")
     assert resp.status_code == 200
-    assert resp.get_json() == {"is_scraping": False}
+    assert resp.get_json()["is_scraping"] is False
+    assert {"survey", "detail", "pages_per_second"} <= set(resp.get_json()["metrics"])
 
 
 @pytest.mark.buttons
@@ -28,7 +29,7 @@ def test_scrape_handles_generic_exception(client, monkeypatch):
     If scrape_new_entries raises a non-specific error,
     /scrape returns 500 from broad except.
     """
-    monkeypatch.setattr("src.app.pages.get_max_id", lambda: 0)
+    monkeypatch.setattr("src.app.pages.get_result_ids", lambda: [])
     monkeypatch.setattr(
         "src.app.pages.scrape_new_entries",
         lambda **_kwargs: (_ for _ in ()).throw(RuntimeError("unexpected boom")),
@@ -56,6 +57,43 @@ def test_refresh_queries_handles_generic_exception(client, monkeypatch, tmp_path
     assert "error" in resp.json
 
 
+@pytest.mark.buttons
+def test_scrape_seeds_and_updates_seen_ids(client, monkeypatch, tmp_path):
+    """
+    /scrape seeds the seen-ID set from the DB once and passes it to the
+    scraper; IDs are added only after /refresh_queries loads them.
+    """
+    monkeypatch.setattr("src.app.pages.DATA_DIR", tmp_path)
+    seeds = []
+    monkeypatch.setattr(
+        "src.app.pages.get_result_ids", lambda: seeds.append(1) or [5]
+    )
+    calls = []
+
+    def fake_scrape(stores, **_kwargs):
+        calls.append(sorted(i for i in range(10) if i in stores["seen"]))
+        return [{"id": 8, "url": "u", "data": {}}]
+
+    monkeypatch.setattr("src.app.pages.scrape_new_entries", fake_scrape)
+    monkeypatch.setattr("src.app.pages.clean_data", lambda *_a, **_k: [])
+    monkeypatch.setattr("src.app.pages.clean_with_llm", lambda *_a, **_k: None)
+    monkeypatch.setattr("src.app.pages.load_data_to_db", lambda *_a, **_k: None)
+    (tmp_path / "cleaned_entries.jsonl").write_text(
+        '{"URL": "https://www.thegradcafe.com/result/8"}\n{"URL": null}\n'
+    )
+
+    assert client.post("/scrape").status_code == 200
+    assert client.post("/scrape").status_code == 200  # not loaded yet
+    assert client.post("/refresh_queries").status_code == 200
+    assert client.post("/scrape").status_code == 200
+    assert seeds == [1]
+    assert calls == [[5], [5], [5, 8]]
+
+    pages.reset_seen_ids()
+    assert client.post("/scrape").status_code == 200
+    assert seeds == [1, 1]
+
+
 @pytest.mark.buttons
 def test_is_scraper_running_helper_reflects_state():
     """Directly test the is_scraper_running() helper function."""
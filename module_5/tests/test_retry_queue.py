@@ -0,0 +1,66 @@
+"""
+Tests for src.retry_queue (durable queue of failed result fetches).
+"""
+
+import pytest
+
+from src.retry_queue import RetryQueue
+
+
+@pytest.mark.analysis
+def test_retry_queue_backoff_and_persistence(tmp_path):
+    """Failures back off exponentially, survive reloads, and clear on success."""
+    path = tmp_path / "data" / "retry_queue.json"
+    queue = RetryQueue(path, base_delay=10, max_delay=25)
+    entry = {"id": 7, "date_added": "May 1, 2025"}
+
+    queue.record_failure(entry, now=0)
+    queue.record_failure({"id": 8, "date_added": None}, now=5)
+    assert queue.due(now=9) == []
+    assert queue.due(now=15) == [entry, {"id": 8, "date_added": None}]
+
+    queue.record_failure(entry, now=100)  # 2nd failure waits 20s
+    queue.record_failure(entry, now=200)  # 3rd waits min(40, 25)
+    assert queue.attempts(7) == 3
+    assert queue.due(now=224) == [{"id": 8, "date_added": None}]
+    queue.save()
+
+    reloaded = RetryQueue(path)
+    assert len(reloaded) == 2 and 7 in reloaded
+    assert reloaded.due(now=225)[-1] == entry
+    reloaded.record_success(7)
+    reloaded.record_success(99)
+    assert 7 not in reloaded and reloaded.attempts(7) == 0
+
+
+@pytest.mark.analysis
+def test_retry_queue_drops_entries_after_max_attempts(tmp_path):
+    """An entry that keeps failing is dropped once it reaches max_attempts."""
+    queue = RetryQueue(tmp_path / "retry_queue.json", base_delay=0, max_attempts=3)
+    entry = {"id": 7, "date_added": None}
+
+    queue.record_failure(entry, now=0)
+    queue.record_failure(entry, now=1)
+    assert queue.attempts(7) == 2 and queue.due(now=2) == [entry]
+    queue.record_failure(entry, now=2)
+    assert 7 not in queue and queue.due(now=3) == []
+    queue.save()
+    assert len(RetryQueue(tmp_path / "retry_queue.json")) == 0
+
+
+@pytest.mark.analysis
+def test_retry_queue_update_applies_results_and_saves(tmp_path):
+    """Entries with a record are cleared, the rest queued, and the file saved."""
+    path = tmp_path / "retry_queue.json"
+    queue = RetryQueue(path, base_delay=10)
+    queue.record_failure({"id": 7, "date_added": None}, now=0)
+
+    queue.update(
+        [
+            ({"id": 7, "date_added": None}, {"id": 7, "url": "u", "data": {}}),
+            ({"id": 8, "date_added": None}, None),
+        ],
+        now=100,
+    )
+    assert 7 not in queue and queue.attempts(8) == 1
+    assert RetryQueue(path).due(now=110) == [{"id": 8, "date_added": None}]
@@ -7,11 +7,32 @@ Covers:
 - detail parsing in scrape_page
 """
 
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock
 import pytest
 import urllib3
 
-from src import scrape
+from src import archive as fetch_archive, parsing, scrape, streaming
+from src.archive import HtmlArchive
+from src.http_pool import InstrumentedPoolManager
+from src.retry_queue import RetryQueue
+from src.scrape_distributed import run_worker, scrape_new_entries_distributed
+from src.seen_ids import SeenIdSet
+from src.throttle import AdaptiveLimiter
+from src.work_queue import WorkQueue
+
+
+@pytest.fixture(name="fast_retries", autouse=True)
+def fixture_fast_retries():
+    """Use a fresh limiter and skip retry backoff sleeps."""
+    saved = scrape.limiter, dict(scrape.RETRY_POLICY)
+    scrape.limiter = AdaptiveLimiter()
+    scrape.RETRY_POLICY["base_delay"] = 0.0
+    yield
+    scrape.limiter = saved[0]
+    scrape.RETRY_POLICY.update(saved[1])
 
 
 @pytest.mark.analysis
@@ -174,6 +195,89 @@ def test_scrape_new_entries_bad_href(monkeypatch):
     assert not results
 
 
+@pytest.mark.analysis
+def test_scrape_new_entries_resumes_from_checkpoint(monkeypatch, tmp_path):
+    """A restarted scrape reuses checkpointed survey entries and detail pages."""
+    log = tmp_path / "scrape.jsonl"
+    survey_calls, detail_calls, failing = [], [], {2}
+
+    def survey(page_num):
+        survey_calls.append(page_num)
+        return [{"id": page_num, "date_added": "2025-09-18"}]
+
+    def detail(entry):
+        detail_calls.append(entry["id"])
+        if entry["id"] in failing:
+            return None  # as if the run crashed before this page finished
+        return {"id": entry["id"], "url": "u", "data": {}}
+
+    monkeypatch.setattr(scrape, "scrape_survey_page", survey)
+    monkeypatch.setattr(scrape, "scrape_page", detail)
+    first = scrape.scrape_new_entries(
+        target_count=2, batch_size=1, stores={"checkpoint": log}
+    )
+    assert [r["id"] for r in first] == [1]
+
+    survey_calls.clear()
+    detail_calls.clear()
+    failing.clear()
+    second = scrape.scrape_new_entries(
+        target_count=2, batch_size=1, stores={"checkpoint": log}
+    )
+    assert [r["id"] for r in second] == [1, 2]
+    assert not survey_calls
+    assert detail_calls == [2]
+
+
+@pytest.mark.analysis
+def test_scrape_new_entries_stops_at_max_id_frontier(monkeypatch):
+    """Pages after the first one holding an ID <= max_id are not waited for."""
+    release = threading.Event()
+    pages = {1: [30, 29], 2: [28, 10]}
+
+    def survey(page_num):
+        if page_num not in pages:
+            release.wait(timeout=5)
+            return [{"id": 5, "date_added": None}]
+        return [{"id": i, "date_added": None} for i in pages[page_num]]
+
+    monkeypatch.setattr(scrape, "scrape_survey_page", survey)
+    monkeypatch.setattr(
+        scrape, "scrape_page", lambda e: {"id": e["id"], "url": "u", "data": {}}
+    )
+    start = time.monotonic()
+    results = scrape.scrape_new_entries(max_id=10, target_count=100, batch_size=5)
+    elapsed = time.monotonic() - start
+    release.set()
+
+    assert [r["id"] for r in results] == [30, 29, 28]
+    assert elapsed < 2
+
+
+@pytest.mark.analysis
+def test_scrape_new_entries_sizes_batches_to_expected_entries(monkeypatch):
+    """Later batches request only the pages the remaining entries need."""
+    calls = []
+
+    def survey(page_num):
+        calls.append(page_num)
+        return [{"id": 1000 - page_num * 10 - i, "date_added": None} for i in range(10)]
+
+    monkeypatch.setattr(scrape, "scrape_survey_page", survey)
+    monkeypatch.setattr(
+        scrape, "scrape_page", lambda e: {"id": e["id"], "url": "u", "data": {}}
+    )
+    results = scrape.scrape_new_entries(target_count=45, batch_size=1)
+    assert len(results) == 45
+    assert sorted(calls) == [1, 2, 3, 4, 5]
+
+    # IDs are sequential: only 990 - 975 = 15 entries can be newer than max_id
+    calls.clear()
+    results = scrape.scrape_new_entries(max_id=975, target_count=1000, batch_size=1)
+    assert [r["id"] for r in results] == list(range(990, 975, -1))
+    assert sorted(calls) == [1, 2]
+
+
 @pytest.mark.analysis
 def test_scrape_survey_page_exception(monkeypatch):
     """Verify that HTTPError exceptions in http.request return an empty list."""
@@ -230,3 +334,495 @@ def test_scrape_page_generic_exception(monkeypatch):
     monkeypatch.setattr(scrape.http, "request", boom)
     result = scrape.scrape_page({"id": 2000, "date_added": "2025-09-18"})
     assert result is None
+
+
+# --- parser backends ---
+SURVEY_HTML = """
+<table>
+  <tr><th>School</th><th>Program</th><th>Added On</th></tr>
+  <tr><td><a href="/result/21">Link</a></td><td></td><td> 2025-09-18 </td></tr>
+  <tr><td><div class="tw-inline-flex x">Fall 2025</div>
+          <div class="tw-inline-flex">GRE 330</div>
+          <div class="tw-inline-flex">GRE V <b>165</b></div>
+          <div class="tw-inline-flex">GRE AW 4.5</div></td></tr>
+  <tr><td><a href="/result/bad">bad</a></td></tr>
+  <tr><td>no badges</td></tr>
+  <tr><td><a href="/result/22#x">Link</a></td></tr>
+</table>
+"""
+
+RESULT_HTML = """
+<html><body><dl>
+  <div><dt>Program</dt><dd> Computer <!-- c --><b>Science</b><script>x()</script></dd></div>
+  <div><dt>Notes</dt><dd>A &amp; B</dd></div>
+  <div><dt>Empty</dt></div>
+</dl></body></html>
+"""
+
+
+@pytest.fixture(name="parser_backend")
+def fixture_parser_backend():
+    """Yield a setter for the parser backend and restore html.parser afterwards."""
+    yield parsing.set_parser_backend
+    parsing.set_parser_backend("html.parser")
+
+
+@pytest.mark.analysis
+@pytest.mark.parametrize("backend", ["lxml", "lxml-xpath"])
+def test_parser_backends_produce_identical_entries(parser_backend, backend):
+    """Every backend should produce exactly the html.parser entry dicts."""
+    pytest.importorskip("lxml")
+    expected = (
+        parsing.parse_survey_html(SURVEY_HTML),
+        parsing.parse_result_html(RESULT_HTML),
+    )
+    assert expected[0][0]["GRE V Score"] == "165"
+    assert expected[1]["Program"] == "ComputerScience"
+
+    parser_backend(backend)
+    assert parsing.get_parser_backend() == backend
+    assert parsing.parse_survey_html(SURVEY_HTML.encode()) == expected[0]
+    assert parsing.parse_result_html(RESULT_HTML.encode()) == expected[1]
+    assert not parsing.parse_survey_html(b"  ")
+    assert not parsing.parse_result_html("")
+
+
+@pytest.mark.analysis
+def test_set_parser_backend_rejects_unknown_or_missing(parser_backend, monkeypatch):
+    """Unknown backends and backends whose library is missing raise ValueError."""
+    with pytest.raises(ValueError, match="Unknown parser backend"):
+        parser_backend("html5lib")
+
+    def missing(*_a, **_k):
+        raise parsing.FeatureNotFound("lxml")
+
+    monkeypatch.setattr(parsing, "BeautifulSoup", missing)
+    with pytest.raises(ValueError, match="not installed"):
+        parser_backend("lxml")
+    assert parsing.get_parser_backend() == "html.parser"
+
+
+@pytest.fixture(name="archive")
+def fixture_archive():
+    """Yield a setter for the fetch archive and disable it afterwards."""
+    yield fetch_archive.set_archive
+    fetch_archive.set_archive(None)
+
+
+@pytest.mark.analysis
+def test_archive_record_then_replay_offline(archive, monkeypatch, tmp_path):
+    """Recorded pages are replayed without network; unknown modes are rejected."""
+    pages = {
+        scrape.SURVEY_URL.format(page_num=1): SURVEY_HTML.encode(),
+        scrape.RESULT_URL.format(page_id=21): RESULT_HTML.encode(),
+        scrape.RESULT_URL.format(page_id=22): RESULT_HTML.encode(),
+    }
+
+    def online(_method, url, **_k):
+        return MagicMock(status=200 if url in pages else 404, data=pages.get(url))
+
+    monkeypatch.setattr(scrape.http, "request", online)
+    archive(tmp_path, "record")
+    assert fetch_archive.get_archive_mode() == "record"
+    recorded = scrape.scrape_new_entries(target_count=5, batch_size=1)
+    assert [r["id"] for r in recorded] == [21, 22]
+
+    def offline(*_a, **_k):
+        raise AssertionError("replay mode must not touch the network")
+
+    monkeypatch.setattr(scrape.http, "request", offline)
+    archive(tmp_path, "replay")
+    assert scrape.scrape_new_entries(target_count=5, batch_size=1) == recorded
+    assert scrape.scrape_page({"id": 999, "date_added": None}) is None
+
+    with pytest.raises(ValueError, match="Unknown archive mode"):
+        archive(tmp_path, "stream")
+    archive(None)
+    assert fetch_archive.get_archive_mode() is None
+
+
+@pytest.mark.analysis
+def test_request_retries_throttled_responses(monkeypatch):
+    """429/5xx and network errors are retried and shrink the limiter."""
+    responses = [
+        MagicMock(status=429, headers={"Retry-After": "0"}),
+        urllib3.exceptions.ReadTimeoutError(None, "u", "slow"),
+        MagicMock(status=503, headers={}),
+        MagicMock(status=200, data=RESULT_HTML.encode()),
+    ]
+
+    def flaky(*_a, **kwargs):
+        assert kwargs["retries"] is scrape.URLLIB3_RETRIES
+        result = responses.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    monkeypatch.setattr(scrape.http, "request", flaky)
+    record = scrape.scrape_page({"id": 21, "date_added": None})
+    assert record["data"]["Notes"] == "A & B"
+    stats = scrape.limiter.stats()
+    assert stats["requests"] == 4 and stats["overloads"] == 3
+    assert stats["limit"] < 10
+
+
+LISTING_HTML = """
+<table><tbody>
+<tr>
+  <td><div>Johns Hopkins University</div></td>
+  <td><div><span>Computer Science</span><svg></svg><span>PhD</span></div></td>
+  <td>January 5, 2025</td>
+  <td><div class="tw-inline-flex">Rejected on 20 Dec</div></td>
+  <td><a href="/result/31">See More</a></td>
+</tr>
+<tr><td colspan="3">
+  <div class="tw-inline-flex">Fall 2025</div>
+  <div class="tw-inline-flex">American</div>
+  <div class="tw-inline-flex">GPA 3.90</div>
+</td></tr>
+<tr><td colspan="3"><p>Funded &amp; happy</p></td></tr>
+<tr>
+  <td><div>MIT</div></td>
+  <td><div><span>Physics</span></div></td>
+  <td>January 4, 2025</td>
+  <td><div class="tw-inline-flex">Wait listed</div></td>
+  <td><a href="/result/30">See More</a></td>
+</tr>
+</tbody></table>
+"""
+
+
+@pytest.mark.analysis
+@pytest.mark.parametrize("backend", ["html.parser", "lxml-xpath"])
+def test_parse_survey_html_reads_listing_columns(parser_backend, backend):
+    """Listing rows map onto result-page labels the same way on every backend."""
+    pytest.importorskip("lxml")
+    parser_backend(backend)
+    entries = parsing.parse_survey_html(LISTING_HTML)
+    assert len(entries) == 2
+    first, second = entries[0], entries[1]
+
+    assert first["listing"] == {
+        "Institution": "Johns Hopkins University",
+        "Program": "Computer Science",
+        "Degree Type": "PhD",
+        "Decision": "Rejected",
+        "Notification": "on 20/12/2024",
+        "Degree's Country of Origin": "American",
+        "Undergrad GPA": "3.90",
+        "Notes": "Funded & happy",
+    }
+    assert not scrape.listing_missing_fields(first)
+    assert second["listing"]["Decision"] == "Wait listed"
+    assert scrape.listing_missing_fields(second) == ["Degree Type"]
+
+
+@pytest.mark.analysis
+def test_listing_only_fetches_result_pages_for_missing_fields(monkeypatch):
+    """Listing-only mode fetches a result page only for incomplete rows."""
+    fetched = []
+    monkeypatch.setattr(
+        scrape,
+        "scrape_survey_page",
+        lambda n: parsing.parse_survey_html(LISTING_HTML) if n == 1 else [],
+    )
+
+    def detail(entry):
+        fetched.append(entry["id"])
+        return scrape.build_detail_record(entry, RESULT_HTML)
+
+    monkeypatch.setattr(scrape, "scrape_page", detail)
+    results = scrape.scrape_new_entries(
+        target_count=10, batch_size=1, listing_only=True
+    )
+
+    assert fetched == [30]
+    assert results[0]["data"]["Program"] == "Computer Science"
+    assert results[0]["data"]["Term"] == "Fall 2025"
+    assert results[1]["data"]["Notes"] == "A & B"
+
+
+@pytest.mark.analysis
+def test_scrape_new_entries_skips_seen_ids(monkeypatch, tmp_path):
+    """
+    With a seen-ID set, only unseen entries are fetched: late-posted lower IDs
+    are kept, entries repeated by shifted pages are fetched once, and the first
+    page with a seen entry ends the scrape.
+    """
+    seen = SeenIdSet(tmp_path / "seen_ids.bin")
+    seen.update([50, 40])
+    pages = {1: [60, 35], 2: [35, 58], 3: [57, 50, 45], 4: [44]}
+    fetched = []
+    monkeypatch.setattr(
+        scrape,
+        "scrape_survey_page",
+        lambda n: [{"id": i, "date_added": None} for i in pages.get(n, [])],
+    )
+
+    def detail(entry):
+        fetched.append(entry["id"])
+        return {"id": entry["id"], "url": "u", "data": {}}
+
+    monkeypatch.setattr(scrape, "scrape_page", detail)
+    results = scrape.scrape_new_entries(
+        target_count=100, batch_size=4, stores={"seen": seen}
+    )
+
+    assert [r["id"] for r in results] == [60, 35, 58, 57, 45]
+    assert sorted(fetched) == [35, 45, 57, 58, 60]
+
+
+@pytest.mark.analysis
+def test_failed_result_pages_are_queued_and_retried_first(monkeypatch, tmp_path):
+    """Failed detail fetches are queued durably and drained by the next scrape."""
+    path = tmp_path / "retry_queue.json"
+    down = {2}
+    fetched = []
+    monkeypatch.setattr(
+        scrape,
+        "scrape_survey_page",
+        lambda n: [{"id": 3 - n, "date_added": None}] if n <= 2 else [],
+    )
+
+    def detail(entry):
+        fetched.append(entry["id"])
+        if entry["id"] in down:
+            return None
+        return {"id": entry["id"], "url": "u", "data": {}}
+
+    monkeypatch.setattr(scrape, "scrape_page", detail)
+    queue = RetryQueue(path, base_delay=0)
+    first = scrape.scrape_new_entries(
+        target_count=2, batch_size=2, stores={"retry_queue": queue}
+    )
+    assert [r["id"] for r in first] == [1]
+    assert RetryQueue(path).attempts(2) == 1
+
+    down.clear()
+    fetched.clear()
+    monkeypatch.setattr(
+        scrape, "scrape_survey_page", lambda n: [{"id": 5, "date_added": None}]
+    )
+    second = scrape.scrape_new_entries(
+        max_id=4, target_count=1, batch_size=1, stores={"retry_queue": RetryQueue(path)}
+    )
+    assert [r["id"] for r in second] == [2, 5]
+    assert sorted(fetched) == [2, 5]
+    assert len(RetryQueue(path)) == 0
+
+
+class _PaddedResultHandler(BaseHTTPRequestHandler):
+    """Keep-alive handler serving RESULT_HTML followed by ``/result/<n>`` bytes of padding."""
+
+    protocol_version = "HTTP/1.1"
+    client_ports = set()
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Send the padded result page with a Content-Length."""
+        self.client_ports.add(self.client_address[1])
+        body = RESULT_HTML.encode() + b" " * int(self.path.rsplit("/", 1)[1])
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):  # pylint: disable=arguments-differ
+        """Silence request logging."""
+
+
+@pytest.mark.analysis
+def test_streamed_detail_fetch_stops_at_dl(archive, monkeypatch, tmp_path):
+    """Streaming reads stop after </dl>; short remainders keep the connection alive."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _PaddedResultHandler)
+    server.handle_error = lambda *_a: None  # the client resets the long response
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/result/{{page_id}}"
+    monkeypatch.setattr(scrape, "RESULT_URL", url)
+    monkeypatch.setattr(scrape, "http", InstrumentedPoolManager(maxsize=1))
+    monkeypatch.setattr(streaming, "STREAM_CHUNK_BYTES", 64)
+    expected = parsing.parse_result_html(RESULT_HTML)
+    archive(tmp_path, "record")
+    try:
+        monkeypatch.setattr(scrape, "STREAM_DETAILS", True)
+        short = scrape.scrape_page({"id": 10, "date_added": None})
+        long = scrape.scrape_page({"id": 10**6, "date_added": None})
+        after_long = scrape.scrape_page({"id": 10, "date_added": None})
+        monkeypatch.setattr(scrape, "STREAM_DETAILS", False)
+        full = scrape.scrape_page({"id": 10, "date_added": None})
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    for record in (short, long, after_long, full):
+        assert {k: record["data"][k] for k in expected} == expected
+    stored = HtmlArchive(tmp_path).get(url.format(page_id=10**6))
+    assert stored.endswith(b"</dl>") and len(stored) < len(RESULT_HTML)
+    # Drained after the short page, closed after the long one, reused otherwise
+    assert len(_PaddedResultHandler.client_ports) == 2
+
+
+@pytest.mark.analysis
+def test_streamed_detail_refetches_when_cutoff_misses_results(monkeypatch):
+    """A page whose first </dl> is not the result block is read again in full."""
+    page = b"<dl><div><dt>Menu</dt><dd>Home</dd></div></dl>" + RESULT_HTML.encode()
+    calls = []
+
+    def fake_get(_url, _kind, until=None):
+        calls.append(until)
+        return page[: page.find(until) + len(until)] if until else page
+
+    monkeypatch.setattr(scrape, "_get", fake_get)
+    monkeypatch.setattr(scrape, "STREAM_DETAILS", True)
+    record = scrape.scrape_page({"id": 10, "date_added": None})
+    assert calls == [b"</dl>", None]
+    assert record["data"]["Program"] == parsing.parse_result_html(RESULT_HTML)["Program"]
+
+    calls.clear()
+    monkeypatch.setattr(scrape, "_get", lambda *a: calls.append(a) or RESULT_HTML)
+    assert scrape.scrape_page({"id": 10, "date_added": None})["data"]["Notes"] == "A & B"
+    assert len(calls) == 1
+
+
+class _DroppingHandler(BaseHTTPRequestHandler):
+    """Redirect ``/moved`` to ``/ok``; close the connection on anything else."""
+
+    hits = []
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Answer, redirect, or hang up without a response."""
+        self.hits.append(self.path)
+        if self.path == "/ok":
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+        elif self.path == "/moved":
+            self.send_response(302)
+            self.send_header("Location", "/ok")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        else:
+            self.close_connection = True  # pylint: disable=attribute-defined-outside-init
+
+    def log_message(self, *_args):  # pylint: disable=arguments-differ
+        """Silence request logging."""
+
+
+@pytest.mark.analysis
+def test_request_only_retries_through_retry_policy(monkeypatch):
+    """urllib3 adds no retries of its own but still follows redirects."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _DroppingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    monkeypatch.setattr(scrape, "http", InstrumentedPoolManager(maxsize=1))
+    scrape.metrics.reset()
+    try:
+        assert scrape.request_for_test(f"{base}/moved", "detail").data == b"ok"
+        with pytest.raises(urllib3.exceptions.HTTPError):
+            scrape.request_for_test(f"{base}/drop", "detail")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert _DroppingHandler.hits.count("/drop") == scrape.RETRY_POLICY["retries"] + 1
+    exceptions = scrape.get_metrics()["detail"]["exceptions"]
+    assert exceptions == {"ProtocolError": scrape.RETRY_POLICY["retries"] + 1}
+
+
+@pytest.mark.analysis
+def test_scrape_new_entries_records_metrics(monkeypatch, capsys):
+    """Fetches are timed, sized, and counted by status; backoff is kept out of latency."""
+    responses = {
+        scrape.SURVEY_URL.format(page_num=1): [
+            MagicMock(status=200, data=SURVEY_HTML.encode())
+        ],
+        scrape.RESULT_URL.format(page_id=21): [
+            MagicMock(status=429, headers={}),
+            MagicMock(status=200, data=RESULT_HTML.encode()),
+        ],
+        scrape.RESULT_URL.format(page_id=22): [MagicMock(status=404, data=b"")],
+    }
+    monkeypatch.setattr(
+        scrape.http, "request", lambda _m, url, **_k: responses[url].pop(0)
+    )
+    monkeypatch.setattr(scrape, "backoff_delay", lambda *_a: 0.25)
+    monkeypatch.setattr(scrape.time, "sleep", lambda _s: None)
+
+    scrape.scrape_new_entries(target_count=2, batch_size=1)
+    summary = scrape.get_metrics()
+    assert summary["survey"]["fetches"] == 1 and summary["survey"]["parsed"] == 1
+    assert summary["survey"]["bytes"] == len(SURVEY_HTML.encode())
+    assert summary["detail"]["fetches"] == 2 and summary["detail"]["parsed"] == 1
+    assert summary["detail"]["statuses"] == {"429": 1, "200": 1, "404": 1}
+    assert summary["detail"]["backoff_seconds"] == 0.25
+    assert summary["detail"]["latency_seconds"]["max"] < 0.25
+    assert summary["detail"]["queue_seconds"] >= 0
+    assert summary["limiter"]["overloads"] == 1
+    assert "Scrape metrics: {" in capsys.readouterr().out
+
+
+@pytest.mark.analysis
+def test_distributed_scrape_matches_threaded(monkeypatch, tmp_path):
+    """Queue workers return the threaded engine's records, stopping at the frontier."""
+    pages = {
+        1: [{"id": 30, "date_added": None}, {"id": 29, "date_added": None}],
+        2: [{"id": 28, "date_added": None}, {"id": 20, "date_added": None}],
+        3: [{"id": 19, "date_added": None}],
+    }
+    monkeypatch.setattr(scrape, "scrape_survey_page", lambda n: pages.get(n, []))
+    monkeypatch.setattr(
+        scrape,
+        "scrape_page",
+        lambda e: None if e["id"] == 29 else {"id": e["id"], "data": {}},
+    )
+    expected = scrape.scrape_new_entries(max_id=20, target_count=10, batch_size=1)
+
+    path = tmp_path / "queue.sqlite3"
+    WorkQueue(path).reset()
+    worker = threading.Thread(target=run_worker, args=(path, 3, 0.01))
+    worker.start()
+    records = scrape_new_entries_distributed(
+        path, max_id=20, target_count=10, batch_size=1, workers={"processes": 0}
+    )
+    worker.join(timeout=30)
+
+    assert records == expected == [{"id": 30, "data": {}}, {"id": 28, "data": {}}]
+    assert not worker.is_alive()
+    assert WorkQueue(path).counts()["detail"] == {"done": 2, "failed": 1}
+    assert len(WorkQueue(path).reports()) == 1  # the worker's metrics
+
+
+@pytest.mark.analysis
+def test_distributed_scrape_uses_retry_queue(monkeypatch, tmp_path):
+    """Due retries are queued first, failed details are kept, and budgets are split."""
+    monkeypatch.setattr(
+        scrape,
+        "scrape_survey_page",
+        lambda n: [{"id": 30, "date_added": None}] if n == 1 else [],
+    )
+    monkeypatch.setattr(
+        scrape,
+        "scrape_page",
+        lambda e: None if e["id"] == 30 else {"id": e["id"], "data": {}},
+    )
+    retry_queue = RetryQueue(tmp_path / "retry.json", base_delay=0)
+    retry_queue.record_failure({"id": 5, "date_added": None}, now=0)
+    scrape.limiter = AdaptiveLimiter(max_limit=40, max_rps=8.0)
+
+    path = tmp_path / "queue.sqlite3"
+    WorkQueue(path).reset()
+    worker = threading.Thread(target=run_worker, args=(path, 3, 0.01, 4))
+    worker.start()
+    records = scrape_new_entries_distributed(
+        path,
+        target_count=10,
+        batch_size=1,
+        workers={"processes": 0},
+        retry_queue=retry_queue,
+    )
+    worker.join(timeout=30)
+
+    assert records == [{"id": 5, "data": {}}]
+    assert 5 not in retry_queue and retry_queue.attempts(30) == 1
+    assert 30 in RetryQueue(tmp_path / "retry.json")
+    assert scrape.limiter.max_rps == 2.0 and scrape.limiter.bounds[1] == 3
@@ -0,0 +1,153 @@
+"""
+Tests for src.scrape_async (asyncio scraping engine).
+
+Uses httpx.MockTransport so no network access is needed.
+"""
+
+import httpx
+import pytest
+
+from src import archive, scrape, scrape_async
+from src.retry_queue import RetryQueue
+from src.seen_ids import SeenIdSet
+
+SURVEY_HTML = """
+<table>
+  <tr><td><a href="/result/{id}">Link</a></td><td></td><td>2025-09-18</td></tr>
+  <tr><td><div class="tw-inline-flex">Fall 2025</div></td></tr>
+</table>
+"""
+
+RESULT_HTML = "<dl><div><dt>Program</dt><dd>CS {id}</dd></div></dl>"
+
+
+def make_transport(survey_ids, failing=()):
+    """Serve one entry per survey page from ``survey_ids`` and its result page."""
+    seen = []
+
+    def handler(request):
+        seen.append(str(request.url))
+        if "/survey/" in request.url.path:
+            page = int(request.url.params["page"])
+            if page > len(survey_ids):
+                return httpx.Response(200, text="<table></table>")
+            return httpx.Response(200, text=SURVEY_HTML.format(id=survey_ids[page - 1]))
+        page_id = int(request.url.path.rsplit("/", 1)[1])
+        if page_id in failing:
+            raise httpx.ConnectError("boom", request=request)
+        return httpx.Response(200, text=RESULT_HTML.format(id=page_id))
+
+    return httpx.MockTransport(handler), seen
+
+
+@pytest.mark.analysis
+def test_scrape_new_entries_async_pipelines_in_order():
+    """Details should come back in survey order and stop at target_count."""
+    transport, seen = make_transport([30, 20, 10])
+    results = scrape_async.scrape_new_entries_async(
+        target_count=2, batch_size=2, limits={"concurrency": 3}, transport=transport
+    )
+    assert [r["id"] for r in results] == [30, 20]
+    assert results[0]["data"]["Program"] == "CS 30"
+    assert results[0]["data"]["Term"] == "Fall 2025"
+    assert results[0]["url"] == "https://www.thegradcafe.com/result/30"
+    assert not any(url.endswith("/result/10") for url in seen)
+
+
+@pytest.mark.analysis
+def test_scrape_new_entries_async_filters_and_drops_failures(capsys):
+    """Failed fetches are dropped and the first page with a known ID stops the run."""
+    transport, _ = make_transport([30, 20, 10], failing={20})
+    results = scrape_async.scrape_new_entries_async(
+        max_id=10, target_count=10, batch_size=2, transport=transport
+    )
+    assert [r["id"] for r in results] == [30]
+    assert "Reached already-scraped entries" in capsys.readouterr().out
+
+
+@pytest.mark.analysis
+def test_scrape_new_entries_async_frontier_and_batch_size(capsys):
+    """Later batches are sized to the expected entries; the frontier page stops the run."""
+    transport, seen = make_transport([50, 40, 30, 20, 10])
+    results = scrape_async.scrape_new_entries_async(
+        max_id=30, target_count=10, batch_size=1, transport=transport
+    )
+    assert [r["id"] for r in results] == [50, 40]
+    assert not any(url.endswith(("/result/20", "/result/10")) for url in seen)
+    out = capsys.readouterr().out
+    assert "Scraping survey pages 2–10..." in out
+    assert "Reached already-scraped entries" in out
+
+
+@pytest.mark.analysis
+def test_scrape_new_entries_async_non_200():
+    """Non-200 survey responses yield no entries."""
+    transport = httpx.MockTransport(lambda request: httpx.Response(503))
+    assert not scrape_async.scrape_new_entries_async(
+        target_count=1, transport=transport
+    )
+
+
+@pytest.mark.analysis
+def test_scrape_new_entries_async_seen_retries_and_metrics(tmp_path):
+    """Seen and repeated IDs are skipped; failures are queued; fetches are counted."""
+    seen = SeenIdSet(tmp_path / "seen.bin")
+    seen.update([25])
+    queue = RetryQueue(tmp_path / "retry.json", base_delay=0)
+    queue.record_failure({"id": 5, "date_added": "2025-09-01"}, now=0)
+    # Page 2 repeats page 1's entry, as when new posts shift pagination
+    transport, seen_urls = make_transport([30, 30, 20, 25, 15], failing={20})
+    results = scrape_async.scrape_new_entries_async(
+        target_count=10, batch_size=2, transport=transport, seen=seen, retry_queue=queue
+    )
+
+    assert [r["id"] for r in results] == [5, 30]
+    assert sum(url.endswith("/result/30") for url in seen_urls) == 1
+    assert not any(url.endswith("/result/25") for url in seen_urls)
+    assert 5 not in queue and 20 in queue
+    assert 20 in RetryQueue(tmp_path / "retry.json")
+    summary = scrape.get_metrics()
+    assert summary["detail"]["fetches"] == 3
+    assert summary["detail"]["parsed"] == 2
+    assert summary["detail"]["exceptions"] == {"ConnectError": 1}
+
+
+@pytest.mark.analysis
+def test_scrape_new_entries_async_parse_error_drops_entry(monkeypatch):
+    """A result page that fails to parse is dropped without losing the others."""
+    real_build = scrape_async.build_detail_record
+
+    def build(entry, html):
+        if entry["id"] == 20:
+            raise ValueError("bad page")
+        return real_build(entry, html)
+
+    monkeypatch.setattr(scrape_async, "build_detail_record", build)
+    transport, _ = make_transport([30, 20, 10])
+    results = scrape_async.scrape_new_entries_async(
+        target_count=3, batch_size=3, transport=transport
+    )
+    assert [r["id"] for r in results] == [30, 10]
+
+
+@pytest.mark.analysis
+def test_scrape_new_entries_async_records_and_replays_archive(tmp_path):
+    """The async engine records into the fetch archive and replays offline."""
+    transport, _ = make_transport([30, 20])
+    archive.set_archive(tmp_path, "record")
+    try:
+        recorded = scrape_async.scrape_new_entries_async(
+            target_count=2, batch_size=2, transport=transport
+        )
+
+        def offline(request):
+            raise AssertionError(f"replay mode must not fetch {request.url}")
+
+        archive.set_archive(tmp_path, "replay")
+        replayed = scrape_async.scrape_new_entries_async(
+            target_count=2, batch_size=2, transport=httpx.MockTransport(offline)
+        )
+    finally:
+        archive.set_archive(None)
+    assert [r["id"] for r in recorded] == [30, 20]
+    assert replayed == recorded
@@ -0,0 +1,91 @@
+"""
+Tests for src.scrape_metrics (per-run scraper instrumentation).
+"""
+
+import json
+
+import pytest
+
+from src.scrape_metrics import ScrapeMetrics
+
+
+@pytest.mark.analysis
+def test_summary_reports_percentiles_statuses_and_timing():
+    """Fetches, responses, and parses are summarized per kind."""
+    metrics = ScrapeMetrics()
+    for i in range(1, 101):
+        metrics.record_fetch("detail", i / 100, nbytes=1000)
+    metrics.record_response("detail", 429)
+    metrics.record_response("detail", 200)
+    metrics.record_response("detail", 200)
+    metrics.record_exception("survey", TimeoutError("slow"))
+    metrics.record_parse("detail", 0.25)
+    metrics.record_parse("detail", 0.25)
+
+    summary = metrics.summary()
+    detail = summary["detail"]
+    assert detail["fetches"] == 100
+    assert detail["latency_seconds"] == {
+        "p50": 0.5,
+        "p90": 0.9,
+        "p99": 0.99,
+        "max": 1.0,
+    }
+    assert detail["bytes"] == 100_000 and detail["mean_bytes"] == 1000
+    assert detail["statuses"] == {"429": 1, "200": 2}
+    assert detail["network_seconds"] == pytest.approx(50.5)
+    assert detail["parse_seconds"] == 0.5 and detail["parsed"] == 2
+    assert summary["survey"]["exceptions"] == {"TimeoutError": 1}
+    assert summary["survey"]["latency_seconds"]["p50"] is None
+    assert sum(summary["pages_per_second"]) > 0
+    json.dumps(summary)
+
+    metrics.reset()
+    assert metrics.summary()["detail"]["fetches"] == 0
+
+
+@pytest.mark.analysis
+def test_summary_stops_the_clock_at_finish(monkeypatch):
+    """After `finish`, idle polls report the same elapsed time and buckets."""
+    now = [100.0]
+    monkeypatch.setattr("src.scrape_metrics.time.monotonic", lambda: now[0])
+    metrics = ScrapeMetrics(window=10.0)
+    now[0] = 105.0
+    metrics.record_fetch("survey", 0.5)
+    now[0] = 125.0
+    metrics.finish()
+
+    now[0] = 1000.0
+    summary = metrics.summary()
+    assert summary["elapsed_seconds"] == 25.0
+    assert summary["pages_per_second"] == [0.1, 0.0, 0.0]
+    assert metrics.summary() == summary
+
+    metrics.reset()
+    now[0] = 1004.0
+    assert metrics.summary()["elapsed_seconds"] == 4.0
+
+
+@pytest.mark.analysis
+def test_waits_are_separate_and_exports_merge():
+    """Queueing and backoff are not latency; exported counters merge across processes."""
+    worker = ScrapeMetrics()
+    worker.record_wait("detail", queued=2.0)
+    worker.record_wait("detail", backoff=1.5)
+    worker.record_fetch("detail", 0.5, nbytes=10)
+    worker.record_response("detail", 200)
+    worker.record_parse("detail", 0.1)
+    exported = json.loads(json.dumps(worker.export()))
+
+    metrics = ScrapeMetrics()
+    metrics.record_fetch("detail", 0.25, nbytes=5)
+    metrics.record_response("detail", 200)
+    metrics.merge(exported)
+
+    detail = metrics.summary()["detail"]
+    assert detail["fetches"] == 2 and detail["bytes"] == 15
+    assert detail["latency_seconds"]["max"] == 0.5
+    assert detail["network_seconds"] == 0.75
+    assert detail["queue_seconds"] == 2.0 and detail["backoff_seconds"] == 1.5
+    assert detail["statuses"] == {"200": 2} and detail["parsed"] == 1
+    assert sum(metrics.summary()["pages_per_second"]) > 0
@@ -0,0 +1,25 @@
+"""
+Tests for src.seen_ids (persistent seen-ID set).
+"""
+
+import pytest
+
+from src.seen_ids import SeenIdSet
+
+
+@pytest.mark.analysis
+def test_seen_ids_update_persists_sorted_unique(tmp_path):
+    """Updates merge new IDs in order and survive reopening the file."""
+    path = tmp_path / "data" / "seen_ids.bin"
+    seen = SeenIdSet(path)
+    assert not seen and seen.max() == 0
+
+    assert seen.update([30, 10, None, 10]) == 2
+    assert seen.update([20, 30]) == 1
+    assert seen.update([]) == 0
+
+    reopened = SeenIdSet(path)
+    assert len(reopened) == 3 and reopened.max() == 30
+    assert 20 in reopened and 25 not in reopened and 99 not in reopened
+    assert path.stat().st_size == 3 * 4
+    assert not path.with_name("seen_ids.bin.tmp").exists()
@@ -0,0 +1,64 @@
+"""
+Tests for src.throttle (adaptive concurrency limiter and backoff).
+"""
+
+import pytest
+
+from src import throttle
+from src.throttle import AdaptiveLimiter, backoff_delay
+
+
+@pytest.mark.analysis
+def test_limiter_slow_start_then_halves_once_per_window():
+    """Healthy responses grow the limit; a burst of overloads halves it once."""
+    limiter = AdaptiveLimiter(initial=4, max_limit=6, target_latency=60.0)
+    for _ in range(5):
+        limiter.release(limiter.acquire())
+    assert limiter.stats()["limit"] == 6  # capped at max_limit
+
+    for _ in range(3):
+        limiter.release(limiter.acquire(), overloaded=True)
+    stats = limiter.stats()
+    assert stats == {
+        "requests": 8,
+        "overloads": 3,
+        "decreases": 1,
+        "peak_limit": 6,
+        "limit": 3,
+    }
+
+    # after the first decrease, growth is additive (about +1 per window)
+    for _ in range(3):
+        limiter.release(limiter.acquire())
+    assert limiter.stats()["limit"] == 3
+    assert limiter.limit > 3.9
+
+
+@pytest.mark.analysis
+def test_limiter_slow_responses_do_not_grow():
+    """Responses slower than target_latency hold the limit steady."""
+    limiter = AdaptiveLimiter(initial=2, target_latency=0.0)
+    started = limiter.acquire()
+    limiter.release(started - 1.0)
+    assert limiter.stats()["limit"] == 2
+
+
+@pytest.mark.analysis
+def test_limiter_spaces_requests_by_max_rps(monkeypatch):
+    """With max_rps set, request starts are spaced 1/max_rps apart."""
+    sleeps = []
+    monkeypatch.setattr(throttle.time, "sleep", sleeps.append)
+    monkeypatch.setattr(throttle.time, "monotonic", lambda: 100.0)
+    limiter = AdaptiveLimiter(max_rps=4)
+    for _ in range(3):
+        limiter.release(limiter.acquire())
+    assert sleeps == [0.25, 0.5]
+
+
+@pytest.mark.analysis
+def test_backoff_delay_is_jittered_capped_and_honors_retry_after():
+    """Delays stay within the exponential window, the cap, and Retry-After."""
+    for attempt in range(6):
+        assert 0 <= backoff_delay(attempt, 0.5, 4.0) <= min(4.0, 0.5 * 2**attempt)
+    assert backoff_delay(0, 0.0, 30.0, retry_after=7.0) == 7.0
+    assert backoff_delay(0, 0.0, 30.0, retry_after=90.0) == 30.0
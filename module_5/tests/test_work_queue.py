@@ -0,0 +1,93 @@
+"""
+Tests for src.work_queue (SQLite-backed shared work queue).
+"""
+
+import threading
+
+import pytest
+
+from src.work_queue import WorkQueue
+
+
+@pytest.mark.analysis
+def test_claim_complete_fail_and_lease(tmp_path):
+    """Tasks are claimed survey-first, retried, re-leased, and drained."""
+    queue = WorkQueue(tmp_path / "q.sqlite3", lease=10, max_attempts=2)
+    assert queue.put("detail", [(7, {"id": 7})]) == 1
+    assert queue.put("survey", [(1, None), (2, None)]) == 2
+    assert queue.put("survey", [(1, None)]) == 0
+
+    assert queue.claim("a", now=100) == ("survey", 1, None)
+    assert queue.claim("a", now=100) == ("survey", 2, None)
+    queue.complete("survey", 1, [{"id": 7}])
+    assert queue.get("survey", 1) == ("done", [{"id": 7}])
+
+    # An abandoned claim is handed out again once its lease expires
+    assert queue.claim("b", now=100) == ("detail", 7, {"id": 7})
+    assert queue.claim("b", now=105) is None
+    assert queue.claim("b", now=111)[:2] == ("survey", 2)
+
+    queue.fail("detail", 7)
+    assert queue.get("detail", 7)[0] == "pending"
+    assert queue.claim("b", now=112)[:2] == ("detail", 7)
+    queue.fail("detail", 7)
+    assert queue.get("detail", 7) == ("failed", None)
+
+    assert not queue.drained()
+    assert queue.cancel("survey", [2, 3]) == 0  # page 2 is claimed, 3 unknown
+    queue.complete("survey", 2, [])
+    queue.close_queue()
+    assert queue.drained()
+    assert queue.counts() == {"survey": {"done": 2}, "detail": {"failed": 1}}
+
+    queue.reset()
+    assert not queue.counts() and not queue.drained()
+    queue.close()
+
+
+@pytest.mark.analysis
+def test_expired_claims_stop_after_max_attempts(tmp_path):
+    """A task whose worker keeps dying is failed once its attempts run out."""
+    queue = WorkQueue(tmp_path / "q.sqlite3", lease=10, max_attempts=2)
+    queue.put("detail", [(7, {"id": 7})])
+    assert queue.claim("a", now=0)[:2] == ("detail", 7)
+    assert queue.claim("b", now=11)[:2] == ("detail", 7)
+    assert queue.claim("c", now=22) is None
+    assert queue.get("detail", 7) == ("failed", None)
+    queue.close_queue()
+    assert queue.drained()
+    queue.close()
+
+
+@pytest.mark.analysis
+def test_concurrent_claims_hand_out_each_task_once(tmp_path):
+    """Separate connections (as in separate processes) never share a task."""
+    path = tmp_path / "q.sqlite3"
+    WorkQueue(path).put("detail", [(i, i) for i in range(200)])
+    claimed = []
+
+    def drain():
+        queue = WorkQueue(path)
+        while (task := queue.claim("w")) is not None:
+            claimed.append(task[1])
+        queue.close()
+
+    workers = [threading.Thread(target=drain) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert sorted(claimed) == list(range(200))
+
+
+@pytest.mark.analysis
+def test_reports_are_kept_until_reset(tmp_path):
+    """Workers' reports are returned by name and cleared with the queue."""
+    queue = WorkQueue(tmp_path / "q.sqlite3")
+    queue.close_queue()
+    queue.report("host:1", {"fetches": 3})
+    queue.report("host:2", {"fetches": 4})
+    queue.report("host:1", {"fetches": 5})
+    assert queue.reports() == {"host:1": {"fetches": 5}, "host:2": {"fetches": 4}}
+    queue.reset()
+    assert not queue.reports()